@@ -27,7 +27,8 @@ pyinstaller src/main.py ^
   --windowed ^
   --add-data "lib;lib" ^
   --add-data "assets;assets" ^
-  --add-data "src;src" ^
+  --add-data "src/ui;src/ui" ^
+  --add-data "modules;modules" ^
   --hidden-import=jinja2 ^
   --hidden-import=jinja2.ext
 
@@ -148,6 +149,10 @@ for /d %%D in ("%RELEASE_DIR%\*") do (
     rmdir /s /q "%%D"
 )
 
+:: Write the file manifest the updater uses to fetch only changed files
+echo Writing update manifest...
+python src\updater.py --manifest "%RELEASE_DIR%\%ZIP_NAME%" "v%VERSION%"
+
 goto :CLEANUP
 
 :MANUAL_ZIP
@@ -28,7 +28,8 @@ pyinstaller src/main.py \
   --windowed \
   --add-data "lib:lib" \
   --add-data "assets:assets" \
-  --add-data "src:src" \
+  --add-data "src/ui:src/ui" \
+  --add-data "modules:modules" \
   --hidden-import=jinja2 \
   --hidden-import=jinja2.ext
 
@@ -97,6 +98,10 @@ echo
 echo "Cleaning extras in release folder..."
 mv "$ZIP_NAME" "$RELEASE_DIR/"
 
+# Write the file manifest the updater uses to fetch only changed files
+echo "Writing update manifest..."
+python src/updater.py --manifest "$RELEASE_DIR/$ZIP_NAME" "v$VERSION"
+
 # Remove everything in release except the ZIP file
 #find "$RELEASE_DIR" ! -name "$ZIP_NAME" -type f -exec rm -f {} +
 #find "$RELEASE_DIR" ! -name "$ZIP_NAME" -type d -exec rm -rf {} + 2>/dev/null || true
@@ -122,6 +127,7 @@ echo "- Main application: $MAIN_APP_DIR"
 echo "- Updater: $MAIN_APP_DIR/mDirtUpdater"
 echo "- Version file: $MAIN_APP_DIR/version.json"
 echo "- Release ZIP: $RELEASE_DIR/$ZIP_NAME"
+echo "- Update manifest: $RELEASE_DIR/manifest.json"
 echo
 
 read -rp "Open release folder? (y/n): " OPEN_FOLDER
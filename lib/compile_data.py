@@ -1,24 +1,29 @@
 import os
-import shutil
+import sys
 import zipfile
 import json
+import hashlib
+import threading
 from pathlib import Path
-from collections import defaultdict, OrderedDict
+from collections import defaultdict
 import platform
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
 
-def infer_jsonschema_type(values):
-    if all(v in ("true", "false") for v in values):
-        return "boolean", None
-    return "string", sorted(values)
-
-def get_sounds_json(target_version=None):
-    system = platform.system()
-    if system == "Windows":
-        mc_assets = os.path.expandvars(r"%APPDATA%\.minecraft\assets")
-    elif system == "Darwin":
-        mc_assets = os.path.expanduser(r"~/Library/Application Support/minecraft/assets")
+CACHE_DIR = Path(__file__).parent / ".compile_cache"
+
+CATEGORIES = ("blocks", "items", "biomes", "enchantments", "effects", "damage_types", "sound_events", "entities", "game_events")
+
+def minecraft_directory():
+    if platform.system() == "Windows":
+        return os.path.expandvars(r"%APPDATA%\.minecraft")
+    elif platform.system() == "Darwin":
+        return os.path.expanduser("~/Library/Application Support/minecraft")
     else:
-        mc_assets = os.path.expanduser(r"~/.minecraft/assets")
+        return os.path.expanduser("~/.minecraft")
+
+def find_sounds_json(target_version=None):
+    """Returns the path of sounds.json inside the launcher's asset objects, or None."""
+    mc_assets = os.path.join(minecraft_directory(), "assets")
 
     index_dir = os.path.join(mc_assets, "indexes")
     versions = [f for f in os.listdir(index_dir) if f.endswith(".json")]
@@ -39,249 +44,280 @@ def get_sounds_json(target_version=None):
     entry = "minecraft/sounds.json"
     if entry in data["objects"]:
         h = data["objects"][entry]["hash"]
-        src = os.path.join(mc_assets, "objects", h[:2], h)
-        dst = os.path.join(os.path.dirname(__file__), "sounds.json")
-        shutil.copyfile(src, dst)
-        print(f"Copied sounds.json from {index_file} to {dst}")
+        return os.path.join(mc_assets, "objects", h[:2], h)
     else:
         print("sounds.json not found in index.")
 
-blocks = []
-items = []
-biomes = []
-enchantments = []
-blockstates_data = {}
-effects = []
-damage_types = []
-sound_events = []
-entities = []
-game_events = []
-
-def get_minecraft_files(version: str, soundver: str):
-    if platform.system() == "Windows":
-        base_path = os.path.expandvars(r"%APPDATA%\.minecraft")
-    elif platform.system() == "Darwin":
-        base_path = os.path.expanduser("~/Library/Application Support/minecraft")
-    else:
-        base_path = os.path.expanduser("~/.minecraft")
-
-    minecraft_path = os.path.join(base_path, "versions", version, f"{version}.jar")
-
-
-    if not os.path.exists(minecraft_path):
+def collect_when(when, state_values):
+    if not isinstance(when, dict):
         return
+    for key, value in when.items():
+        if key in ("OR", "AND") and isinstance(value, list):
+            for condition in value:
+                collect_when(condition, state_values)
+            continue
+        for v in (value if isinstance(value, list) else [value]):
+            for option in str(v).split("|"):
+                state_values[key].add(option)
+
+def parse_blockstate(entry):
+    """Returns (block name, {property: set of values}) for one blockstate file. Runs in a worker process."""
+    block_name, raw = entry
+    state_values = defaultdict(set)
+
+    try:
+        data = json.loads(raw)
+    except json.JSONDecodeError:
+        return block_name, {}
+
+    variants = data.get("variants", {})
+    multipart = data.get("multipart", [])
+
+    if variants:
+        for variant_key in variants:
+            if variant_key == "":
+                continue
+            pairs = variant_key.split(",")
+            for pair in pairs:
+                key, value = pair.split("=")
+                state_values[key.strip()].add(value.strip())
 
-    current_directory = Path(__file__).parent
-    zip_path = current_directory / f"{version}.jar"
-
-    shutil.copy(minecraft_path, zip_path)
-    zip_file_path = zip_path.with_suffix(".zip")
-    os.rename(zip_path, zip_file_path)
-
-    extract_folder = current_directory / "extracted_files"
-    extract_folder.mkdir(exist_ok=True)
-
-    with zipfile.ZipFile(zip_file_path, "r") as zip_ref:
-        zip_ref.extractall(extract_folder)
+    elif multipart:
+        for part in multipart:
+            collect_when(part.get("when"), state_values)
 
-    get_sounds_json(target_version=soundver)
+    return block_name, dict(state_values)
 
-    items_path = extract_folder / "assets/minecraft/items"
-    blocks_path = extract_folder / "assets/minecraft/blockstates"
-    biome_path = extract_folder / "data/minecraft/worldgen/biome"
-    enchantment_path = extract_folder / "data/minecraft/enchantment"
-    effects_path = extract_folder / "assets/minecraft/textures/mob_effect"
-    damage_types_path = extract_folder / "data/minecraft/damage_type"
-    sounds_json_path = Path(__file__).parent / "sounds.json"
-    entity_path = extract_folder / "assets/minecraft/textures/entity" # top level folders & .pngs
-    vibrations_file = extract_folder / "data/minecraft/tags/game_event/vibrations.json"
 
+class ResultCache:
+    """
+    Results of expensive steps keyed by a content hash of their inputs.
 
-    for file in items_path.glob("*.json"):
-        items.append(file.name.removesuffix(".json"))
+    Kept in memory for the run and in CACHE_DIR between runs, so a version
+    whose blockstates didn't change reuses the previous version's parse.
+    """
 
-    blockstates_schema = {}
+    def __init__(self, directory=CACHE_DIR):
+        self.directory = Path(directory)
+        self.memory = {}    # key -> Future, so concurrent versions wait for one build
+        self.lock = threading.Lock()
 
-    for file in blocks_path.glob("*.json"):
-        block_name = file.name.removesuffix(".json")
-        blocks.append(block_name)
+    def get(self, step, fingerprint, build):
+        key = f"{step}-{fingerprint}"
+        with self.lock:
+            future = self.memory.get(key)
+            owner = future is None
+            if owner:
+                future = self.memory[key] = Future()
 
-        with open(file, "r") as f:
-            try:
-                data = json.load(f)
-            except json.JSONDecodeError:
-                continue
+        if not owner:
+            return future.result(), True
 
-            variants = data.get("variants", {})
-            multipart = data.get("multipart", [])
-
-            state_values = defaultdict(set)
-
-            if variants:
-                for variant_key in variants:
-                    if variant_key == "":
-                        continue
-                    pairs = variant_key.split(",")
-                    for pair in pairs:
-                        key, value = pair.split("=")
-                        state_values[key.strip()].add(value.strip())
-
-            elif multipart:
-                for part in multipart:
-                    when = part.get("when")
-                    if isinstance(when, dict):
-                        for key, value in when.items():
-                            if isinstance(value, list):
-                                for v in value:
-                                    if isinstance(v, dict):
-                                        state_values[key].add(json.dumps(v, sort_keys=True))
-                                    else:
-                                        state_values[key].add(str(v))
-                            else:
-                                if isinstance(value, dict):
-                                    state_values[key].add(json.dumps(value, sort_keys=True))
-                                else:
-                                    state_values[key].add(str(value))
-
-            if state_values:
-                properties = OrderedDict()
-                for key, values in sorted(state_values.items()):
-                    inferred_type, enum_vals = infer_jsonschema_type(values)
-                    schema = {"type": inferred_type}
-                    if enum_vals:
-                        schema["enum"] = enum_vals
-                    properties[key] = schema
-
-                blockstates_schema[block_name] = {
-                    "type": "object",
-                    "properties": properties,
-                    "required": []
-                }
-
-    for file in biome_path.glob("*.json"):
-        biomes.append(file.name.removesuffix(".json"))
-
-    for file in enchantment_path.glob("*.json"):
-        enchantments.append(file.name.removesuffix(".json"))
-
-    for file in effects_path.glob("*.png"):
-        effects.append(file.name.removesuffix(".png"))
-    
-    for file in damage_types_path.glob("*.json"):
-        damage_types.append(file.name.removesuffix(".json"))
-
-    if sounds_json_path.exists():
-        with open(sounds_json_path, "r") as f:
-            try:
-                sound_data = json.load(f)
-                sound_events.extend(sound_data.keys())
-            except json.JSONDecodeError:
-                print("Failed to parse sounds.json.")
-
-    for item in entity_path.iterdir():
-        if item.is_dir():
-            entities.append(item.name)
-        elif item.is_file() and item.suffix == ".png":
-            entities.append(item.name.removesuffix(".png"))
-
-    with open(vibrations_file, "r") as f:
         try:
-            data = json.load(f)
+            result, reused = self.load(key, build)
+        except BaseException as e:
+            future.set_exception(e)
+            with self.lock:
+                del self.memory[key]
+            raise
+        future.set_result(result)
+        return result, reused
+
+    def load(self, key, build):
+        path = self.directory / f"{key}.json"
+        try:
+            with open(path, "r") as f:
+                return json.load(f), True
+        except (OSError, json.JSONDecodeError):
+            pass
+
+        result = build()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        with open(f"{path}.tmp", "w") as f:
+            json.dump(result, f)
+        os.replace(f"{path}.tmp", path)
+        return result, False
+
+
+class VersionCompiler:
+    """Builds `lib/<version>_data.json` for one version. All state lives on the instance."""
+
+    def __init__(self, version: str, soundver: str, cache: ResultCache, pool=None):
+        self.version = version
+        self.soundver = soundver
+        self.cache = cache
+        self.pool = pool
+        self.jar_path = os.path.join(minecraft_directory(), "versions", version, f"{version}.jar")
+
+        self.data = {category: [] for category in CATEGORIES}
+        self.data["block_states"] = {}
+        self.reused = []
+
+    def entries(self, prefix, suffix):
+        """Names of the files directly inside `prefix` (like Path.glob("*suffix")), without the suffix."""
+        found = []
+        for name in self.names:
+            if name.startswith(prefix) and name.endswith(suffix):
+                rest = name[len(prefix):]
+                if "/" not in rest:
+                    found.append(rest.removesuffix(suffix))
+        return found
+
+    def fingerprint(self, prefix):
+        """Hash of every entry under `prefix`, from the CRCs already stored in the jar's directory."""
+        digest = hashlib.sha256()
+        for info in sorted(self.jar.infolist(), key=lambda i: i.filename):
+            if info.filename.startswith(prefix):
+                digest.update(f"{info.filename}:{info.CRC}:{info.file_size}\n".encode())
+        return digest.hexdigest()[:32]
+
+    def compile(self):
+        if not os.path.exists(self.jar_path):
+            print(f"{self.version}: {self.jar_path} not found, skipping.")
+            return None
+
+        # Read the entries we need straight out of the jar instead of extracting it
+        with zipfile.ZipFile(self.jar_path, "r") as self.jar:
+            self.names = self.jar.namelist()
+
+            self.data["items"].extend(self.entries("assets/minecraft/items/", ".json"))
+            self.compile_blockstates()
+            self.data["biomes"].extend(self.entries("data/minecraft/worldgen/biome/", ".json"))
+            self.data["enchantments"].extend(self.entries("data/minecraft/enchantment/", ".json"))
+            self.data["effects"].extend(self.entries("assets/minecraft/textures/mob_effect/", ".png"))
+            self.data["damage_types"].extend(self.entries("data/minecraft/damage_type/", ".json"))
+            self.compile_entities()
+            self.compile_game_events()
+
+        self.compile_sound_events()
+
+        for category in CATEGORIES:
+            self.data[category].sort()
+
+        with open(f"lib/{self.version}_data.json", "w") as f:
+            json.dump(self.data, f, indent=4)
+
+        reused = f" (reused {', '.join(self.reused)})" if self.reused else ""
+        print(f"{self.version}: wrote lib/{self.version}_data.json{reused}")
+        return self.data
+
+    def compile_blockstates(self):
+        prefix = "assets/minecraft/blockstates/"
+
+        def build():
+            blockstate_files = [
+                (block_name, self.jar.read(f"{prefix}{block_name}.json"))
+                for block_name in self.entries(prefix, ".json")
+            ]
+
+            # Parsing ~1200 blockstate files is CPU bound, so spread it over processes
+            if self.pool:
+                parsed = list(self.pool.map(parse_blockstate, blockstate_files, chunksize=64))
+            else:
+                parsed = [parse_blockstate(entry) for entry in blockstate_files]
+
+            blocks = []
+            block_states = {}
+            for block_name, state_values in parsed:
+                blocks.append(block_name)
+
+                if state_values:
+                    # Multipart files often only mention one side of a boolean (e.g. fence "north": "true")
+                    block_states[block_name] = {
+                        key: ["false", "true"] if set(values) <= {"true", "false"} else sorted(values)
+                        for key, values in sorted(state_values.items())
+                    }
+
+            return {"blocks": blocks, "block_states": block_states}
+
+        result, reused = self.cache.get("blockstates", self.fingerprint(prefix), build)
+        if reused:
+            self.reused.append("blockstates")
+
+        self.data["blocks"].extend(result["blocks"])
+        self.data["block_states"] = result["block_states"]
+
+    def compile_entities(self):
+        # Top level folders & .pngs
+        entity_prefix = "assets/minecraft/textures/entity/"
+        entity_names = set()
+        for name in self.names:
+            if name.startswith(entity_prefix):
+                rest = name[len(entity_prefix):]
+                if "/" in rest:
+                    entity_names.add(rest.split("/")[0])
+                elif rest.endswith(".png"):
+                    entity_names.add(rest.removesuffix(".png"))
+        self.data["entities"].extend(entity_names)
+
+    def compile_game_events(self):
+        vibrations_file = "data/minecraft/tags/game_event/vibrations.json"
+        try:
+            data = json.loads(self.jar.read(vibrations_file))
             if isinstance(data.get("values"), list):
-                game_events.extend(data["values"])
+                self.data["game_events"].extend(data["values"])
         except json.JSONDecodeError:
             print(f"Failed to parse {vibrations_file}")
 
-    #zip_file_path.unlink()
-    #sounds_json_path.unlink()
-    shutil.rmtree(extract_folder)
-
-    blocks.sort()
-    items.sort()
-    biomes.sort()
-    enchantments.sort()
-    effects.sort()
-    damage_types.sort()
-    sound_events.sort()
-    entities.sort()
-    game_events.sort()
-
-    with open(f"lib/{version}_data.json", "w") as f:
-        json.dump({
-            "blocks": blocks,
-            "items": items,
-            "biomes": biomes,
-            "enchantments": enchantments,
-            "effects": effects,
-            "damage_types": damage_types,
-            "sound_events": sound_events,
-            "entities": entities,
-            "game_events": game_events
-        }, f, indent=4)
-    
-    blockstate_oneof = {
-        "definitions": {
-            "blockStates": {
-                "oneOf": []
-            }
-        }
-    }
-
-    blockstate_oneof = {
-        "$schema": "http://json-schema.org/draft-07/schema#",
-        "definitions": {
-            "blockStates": {
-                "oneOf": []
-            }
-        }
-    }
-
-    for block_name in blocks:
-        state_schema = blockstates_schema.get(block_name)
-
-        if state_schema:
-            # Block has defined state properties
-            properties_schema = {
-                **state_schema,
-                "additionalProperties": False
-            }
-        else:
-            # Block has no states — allow empty object only
-            properties_schema = {
-                "type": "object",
-                "maxProperties": 0
-            }
-
-        wrapped_schema = {
-            "type": "object",
-            "properties": {
-                "block": {
-                    "type": "string",
-                    "title": "Block",
-                    "const": block_name
-                },
-                "properties": properties_schema
-            },
-            "required": ["block"],
-            "additionalProperties": False
-        }
-
-        blockstate_oneof["definitions"]["blockStates"]["oneOf"].append(wrapped_schema)
-
-    # Save full version (detailed oneOf)
-    #with open(f"lib/{version}_blockstates.json", "w") as f:
-        #json.dump(blockstate_oneof, f, indent=4)
-
-    # Save simple original version (just definitions)
-    blockstates_simple = {
-        "$schema": "http://json-schema.org/draft-07/schema#",
-        "definitions": {
-            "blockStates": blockstates_schema
-        }
-    }
-
-    #with open(f"lib/{version}_blockstates_simple.json", "w") as f:
-        #json.dump(blockstates_simple, f, indent=4)
+    def compile_sound_events(self):
+        sounds_json_path = find_sounds_json(target_version=self.soundver)
+        if not sounds_json_path:
+            return
+
+        def build():
+            with open(sounds_json_path, "r") as f:
+                return list(json.load(f).keys())
+
+        # Asset objects are named by their hash already
+        try:
+            events, reused = self.cache.get("sounds", os.path.basename(sounds_json_path), build)
+        except json.JSONDecodeError:
+            print("Failed to parse sounds.json.")
+            return
+        if reused:
+            self.reused.append("sounds")
+        self.data["sound_events"].extend(events)
+
+
+def diff_versions(old_version, old, new_version, new):
+    """Describes what changed between two compiled data files."""
+    changes = {}
+    for category in CATEGORIES:
+        before, after = set(old.get(category, [])), set(new.get(category, []))
+        if before != after:
+            changes[category] = {"added": sorted(after - before), "removed": sorted(before - after)}
+
+    old_states, new_states = old.get("block_states", {}), new.get("block_states", {})
+    changed_states = sorted(block for block in old_states.keys() & new_states.keys() if old_states[block] != new_states[block])
+    added_states = sorted(new_states.keys() - old_states.keys())
+    removed_states = sorted(old_states.keys() - new_states.keys())
+    if changed_states or added_states or removed_states:
+        changes["block_states"] = {"added": added_states, "removed": removed_states, "changed": changed_states}
+
+    return {"from": old_version, "to": new_version, "changes": changes}
+
+def compile_versions(versions):
+    """
+    Compiles several versions concurrently.
+
+    :param versions: List of (version, sound asset index) pairs, oldest first.
+                     Each version after the first also gets `lib/<version>_delta.json`
+                     describing the changes from the one before it.
+    """
+    cache = ResultCache()
+    with ProcessPoolExecutor() as pool, ThreadPoolExecutor(max_workers=len(versions) or 1) as threads:
+        compilers = [VersionCompiler(version, soundver, cache, pool) for version, soundver in versions]
+        results = list(threads.map(lambda compiler: compiler.compile(), compilers))
+
+    previous = None
+    for compiler, data in zip(compilers, results):
+        if data is None:
+            continue
+        if previous:
+            delta = diff_versions(previous.version, previous.data, compiler.version, data)
+            with open(f"lib/{compiler.version}_delta.json", "w") as f:
+                json.dump(delta, f, indent=4)
+        previous = compiler
 
 # 1.21.4 = 19
 # 1.21.5 = 24
@@ -289,4 +325,9 @@ def get_minecraft_files(version: str, soundver: str):
 # 1.21.9/10 = 27
 # 1.21.11: 29
 # We have NO IDEA why Mojang names their sounds this way.
-get_minecraft_files("1.21.11-rc1", "29")
\ No newline at end of file
+# Usage: python compile_data.py 1.21.10:27 1.21.11-rc1:29
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        compile_versions([tuple(arg.split(":", 1)) for arg in sys.argv[1:]])
+    else:
+        compile_versions([("1.21.11-rc1", "29")])
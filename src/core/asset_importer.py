@@ -0,0 +1,185 @@
+import os
+import shutil
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from PySide6.QtCore import QThread, Signal
+
+from core.pack_exporter import PROGRESS_INTERVAL
+from core.thumbnail_cache import loadThumbnail
+from utils.enums import BlockFace, ElementPage
+
+ASSET_FOLDERS = {
+    ElementPage.BLOCKS: 'blocks',
+    ElementPage.ITEMS: 'items',
+    ElementPage.PAINTINGS: 'paintings',
+    ElementPage.STRUCTURES: 'structures',
+    ElementPage.EQUIPMENT: 'equipment',
+}
+
+SIDES = (BlockFace.LEFT, BlockFace.BACK, BlockFace.RIGHT, BlockFace.FRONT)
+
+# Filename suffix -> faces it textures, most specific first
+BLOCK_SUFFIXES = (
+    ('top', (BlockFace.TOP,)),
+    ('bottom', (BlockFace.BOTTOM,)),
+    ('left', (BlockFace.LEFT,)),
+    ('back', (BlockFace.BACK,)),
+    ('right', (BlockFace.RIGHT,)),
+    ('front', (BlockFace.FRONT,)),
+    ('side', SIDES),
+    ('end', (BlockFace.TOP, BlockFace.BOTTOM)),
+)
+
+# Filename suffix -> (project dict, key) of an equipment texture, most specific first
+EQUIPMENT_SUFFIXES = (
+    ('horse_armor_layer', ('model', 'horseArmor')),
+    ('layer_1', ('model', 'h')),
+    ('layer_2', ('model', 'h_l')),
+    ('horse_armor', ('item', 'horseArmor')),
+    ('helmet', ('item', 'helmet')),
+    ('chestplate', ('item', 'chestplate')),
+    ('leggings', ('item', 'leggings')),
+    ('boots', ('item', 'boots')),
+)
+
+
+def matchSuffix(path, suffixes):
+    stem = os.path.splitext(os.path.basename(path))[0].lower()
+    for suffix, value in suffixes:
+        if stem == suffix or stem.endswith(f'_{suffix}'):
+            return value
+    return None
+
+
+def choosePage(paths, current):
+    """
+    The editor a drop of `paths` belongs in: the one their names point to
+    (equipment textures, block faces), else the open one if it can use them.
+    """
+    textures = [path for path in paths if path.lower().endswith('.png')]
+    if any(matchSuffix(path, EQUIPMENT_SUFFIXES) for path in textures):
+        return ElementPage.EQUIPMENT
+    if any(matchSuffix(path, BLOCK_SUFFIXES) for path in textures):
+        return ElementPage.BLOCKS
+    if current == ElementPage.STRUCTURES or not textures:
+        return ElementPage.STRUCTURES if len(textures) < len(paths) else None
+    return current if current in ASSET_FOLDERS and current != ElementPage.EQUIPMENT else ElementPage.ITEMS
+
+
+def matchAssets(paths, page, fallback=None):
+    """
+    Assigns dropped files to the slots of the editor on `page`.
+
+    Block faces and equipment textures are matched by name (`*_top.png`,
+    `*_side.png`, `*_layer_1.png`, `*_boots.png`...). A file whose name
+    matches nothing goes to `fallback` (the slot it was dropped on), or for
+    blocks, textures every face nothing else did.
+
+    :return: ({slot: path}, list of paths that weren't used)
+    """
+    extension = '.nbt' if page == ElementPage.STRUCTURES else '.png'
+    candidates = [path for path in paths if path.lower().endswith(extension)]
+    unused = [path for path in paths if not path.lower().endswith(extension)]
+    slots = {}
+
+    if page == ElementPage.BLOCKS:
+        matched = [(path, matchSuffix(path, BLOCK_SUFFIXES)) for path in candidates]
+        plain = [path for path, faces in matched if faces is None]
+        # Files naming a single face go first; sides and ends only fill the faces left over
+        for path, faces in sorted(((path, faces) for path, faces in matched if faces), key=lambda match: len(match[1])):
+            free = [face for face in faces if face not in slots]
+            slots.update((face, path) for face in free)
+            if not free:
+                unused.append(path)
+        if plain:
+            faces = [fallback] if fallback is not None else [face for face in BlockFace if face not in slots]
+            slots.update((face, plain[0]) for face in faces if face not in slots)
+            unused.extend(plain[1:])
+        return slots, unused
+
+    if page == ElementPage.EQUIPMENT:
+        for path in candidates:
+            key = matchSuffix(path, EQUIPMENT_SUFFIXES) or fallback
+            if key is None or key in slots:
+                unused.append(path)
+            else:
+                slots[key] = path
+        return slots, unused
+
+    # Items, paintings and structures take a single file
+    if candidates:
+        slots[None] = candidates[0]
+    return slots, unused + candidates[1:]
+
+
+def destinationPaths(paths, folder):
+    """
+    Where each file is copied in `folder`. Files keep their names, except that
+    a name another file in the same drop already took (`block/foo.png` and
+    `item/foo.png`) is numbered, so no two copies share a destination.
+    """
+    destinations = {}
+    taken = set()
+    for path in paths:
+        stem, extension = os.path.splitext(os.path.basename(path))
+        name = stem + extension
+        number = 1
+        # Compared case-insensitively for Windows and macOS filesystems
+        while name.lower() in taken:
+            number += 1
+            name = f'{stem}_{number}{extension}'
+        taken.add(name.lower())
+        destinations[path] = f'{folder}/{name}'
+    return destinations
+
+
+class AssetImporter(QThread):
+    """
+    Copies dropped files into the workspace's asset folders and decodes their
+    thumbnails on a pool of workers, so big drops don't hold up the GUI.
+    """
+
+    progress = Signal(int, int)        # done, total
+    imported = Signal(list, list)      # [(destination, stamp, thumbnail)], [error]
+
+    def __init__(self, jobs, thumbnailDirectory, workers=8, parent=None):
+        """
+        :param jobs: List of (source path, destination path), one per file.
+        :param thumbnailDirectory: Disk cache folder handed to loadThumbnail().
+        """
+        super().__init__(parent)
+        self.jobs = jobs
+        self.thumbnailDirectory = thumbnailDirectory
+        self.workers = workers
+        self.lastReport = 0
+
+    def importOne(self, source, destination):
+        os.makedirs(os.path.dirname(destination), exist_ok=True)
+        if os.path.abspath(source) != os.path.abspath(destination):
+            shutil.copyfile(source, destination)
+        stat = os.stat(destination)
+        thumbnail = loadThumbnail(destination, self.thumbnailDirectory) if destination.lower().endswith('.png') else None
+        return (stat.st_mtime_ns, stat.st_size), thumbnail
+
+    def run(self):
+        results = []
+        errors = []
+        total = len(self.jobs)
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            futures = {pool.submit(self.importOne, source, destination): (source, destination) for source, destination in self.jobs}
+            for done, future in enumerate(as_completed(futures), start=1):
+                source, destination = futures[future]
+                try:
+                    stamp, thumbnail = future.result()
+                except OSError as e:
+                    errors.append(f'{os.path.basename(source)}: {e.strerror or e}')
+                else:
+                    results.append((destination, stamp, thumbnail))
+
+                now = time.monotonic()
+                if done == total or now - self.lastReport >= PROGRESS_INTERVAL:
+                    self.lastReport = now
+                    self.progress.emit(done, total)
+
+        self.imported.emit(results, errors)
@@ -0,0 +1,42 @@
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
+
+
+class TaskSignals(QObject):
+    finished = Signal(object)
+    failed = Signal(object)
+
+
+class BackgroundTask(QRunnable):
+    """Runs `fn` on the global thread pool and reports back through Qt signals (delivered on the GUI thread)."""
+
+    def __init__(self, fn):
+        super().__init__()
+        self.fn = fn
+        self.signals = TaskSignals()
+
+    def run(self):
+        try:
+            result = self.fn()
+        except Exception as e:
+            self.signals.failed.emit(e)
+        else:
+            self.signals.finished.emit(result)
+
+
+_running = set()
+
+
+def runInBackground(fn, onFinished=None, onFailed=None):
+    task = BackgroundTask(fn)
+    # Keep the task (and its signals object) alive until it has reported back
+    _running.add(task)
+    task.signals.finished.connect(lambda _: _running.discard(task))
+    task.signals.failed.connect(lambda _: _running.discard(task))
+    if onFinished:
+        task.signals.finished.connect(onFinished)
+    if onFailed:
+        task.signals.failed.connect(onFailed)
+
+    task.setAutoDelete(False)
+    QThreadPool.globalInstance().start(task)
+    return task
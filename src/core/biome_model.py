@@ -0,0 +1,75 @@
+from PySide6.QtCore import QAbstractListModel, QModelIndex, Qt
+
+
+class BiomeListModel(QAbstractListModel):
+    """
+    Checkable list of the biome tags and biomes a structure can spawn in.
+
+    Built once per project. A structure's biomes are either a list of biomes
+    or a single tag, so checking a tag unchecks everything else and checking
+    a biome unchecks any tag.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.names = []
+        self.rows = {}
+        self.tags = frozenset()
+        self.checked = set()
+
+    def rebuild(self, tags, biomes):
+        self.beginResetModel()
+        tags = [f'#{tag}' for tag in tags]
+        self.names = tags + list(biomes)
+        self.rows = {name: row for row, name in enumerate(self.names)}
+        self.tags = frozenset(tags)
+        self.checked = set()
+        self.endResetModel()
+
+    def checkedNames(self):
+        return sorted(self.checked, key=self.rows.__getitem__)
+
+    def setCheckedNames(self, names):
+        """Checks exactly `names`; names this version doesn't have are ignored."""
+        self.changeChecked({name for name in names if name in self.rows})
+
+    def changeChecked(self, checked):
+        # Only the rows whose state flips are repainted
+        changed = self.checked ^ checked
+        self.checked = checked
+        for name in changed:
+            index = self.index(self.rows[name])
+            self.dataChanged.emit(index, index, [Qt.CheckStateRole])
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.names)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        name = self.names[index.row()]
+        if role == Qt.DisplayRole:
+            return name
+        if role == Qt.CheckStateRole:
+            return Qt.Checked if name in self.checked else Qt.Unchecked
+        if role == Qt.ToolTipRole and name in self.tags:
+            return "Biome tag: the structure spawns in every biome in it."
+        return None
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsUserCheckable
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if not index.isValid() or role != Qt.CheckStateRole:
+            return False
+        name = self.names[index.row()]
+
+        if Qt.CheckState(value) != Qt.Checked:
+            self.changeChecked(self.checked - {name})
+        elif name in self.tags:
+            self.changeChecked({name})
+        else:
+            self.changeChecked((self.checked - self.tags) | {name})
+        return True
@@ -0,0 +1,151 @@
+import csv
+import json
+import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+
+from core.elements import Item, RightClick
+from utils.field_validator import FieldValidator
+
+MANIFEST_FIELDS = ('file', 'name', 'displayName', 'baseItem', 'stackSize', 'rightClick', 'rightClickMode', 'rightClickFunction')
+RIGHT_CLICK_MODES = ('tick', 'impulse')
+TRUE_VALUES = ('1', 'true', 'yes', 'y')
+
+
+class BulkImporter:
+    """
+    Builds items from a folder of PNGs in one pass.
+
+    An optional CSV or JSON manifest (one row per texture, keyed by `file`)
+    supplies names, display names, base items, stack sizes and right-click
+    settings. Textures without a row get values derived from their filename.
+    Every row is validated before anything is copied, and all problems are
+    reported together.
+    """
+
+    DEFAULT_BASE_ITEM = 'paper'
+    DEFAULT_STACK_SIZE = 64
+
+    def __init__(self, validItems, destinationDirectory, workers=8):
+        self.validItems = validItems
+        self.destinationDirectory = destinationDirectory
+        self.workers = workers
+
+    def loadManifest(self, path):
+        """Returns a mapping of texture filename -> row, raising ValueError on malformed files."""
+        if path.lower().endswith('.json'):
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if isinstance(data, dict):
+                data = [dict(row, file=file) for file, row in data.items()]
+            if not isinstance(data, list) or not all(isinstance(row, dict) for row in data):
+                raise ValueError('JSON manifest must be a list of objects or an object keyed by file name.')
+            rows = data
+        else:
+            with open(path, 'r', encoding='utf-8-sig', newline='') as f:
+                rows = list(csv.DictReader(f))
+
+        manifest = {}
+        for index, row in enumerate(rows, start=1):
+            file = str(row.get('file') or '').strip()
+            if not file:
+                raise ValueError(f'Manifest row {index} has no "file" column.')
+            if not file.lower().endswith('.png'):
+                file += '.png'
+            manifest[file] = row
+        return manifest
+
+    def defaultRow(self, file):
+        stem = os.path.splitext(file)[0]
+        return {
+            'file': file,
+            'name': stem.lower().replace(' ', '_').replace('-', '_'),
+            'displayName': stem.replace('_', ' ').title()
+        }
+
+    def buildItem(self, file, row, errors):
+        label = f'{file}:'
+        name = str(row.get('name') or '').strip()
+        displayName = str(row.get('displayName') or '').strip()
+        baseItem = str(row.get('baseItem') or self.DEFAULT_BASE_ITEM).strip()
+
+        for value, allowed, field in ((name, FieldValidator.NAME_CHARS, 'Item Name'), (displayName, FieldValidator.DISPLAY_NAME_CHARS, 'Display Name')):
+            error = FieldValidator.check_text(value, allowed, field)
+            if error:
+                errors.append(f'{label} {error}')
+
+        if baseItem not in self.validItems:
+            errors.append(f'{label} "{baseItem}" is not a Minecraft item.')
+
+        stackSize = row.get('stackSize')
+        if stackSize in (None, ''):
+            stackSize = self.DEFAULT_STACK_SIZE
+        try:
+            stackSize = int(stackSize)
+        except (TypeError, ValueError):
+            errors.append(f'{label} Stack size "{stackSize}" is not a number.')
+            stackSize = self.DEFAULT_STACK_SIZE
+        if not 1 <= stackSize <= 99:
+            errors.append(f'{label} Stack size must be between 1 and 99.')
+
+        enabled = row.get('rightClick', False)
+        if not isinstance(enabled, bool):
+            enabled = str(enabled).strip().lower() in TRUE_VALUES
+        mode = str(row.get('rightClickMode') or RIGHT_CLICK_MODES[0]).strip().lower()
+        if mode not in RIGHT_CLICK_MODES:
+            errors.append(f'{label} Right click mode must be Tick or Impulse.')
+
+        return Item(
+            name=name,
+            displayName=displayName,
+            baseItem=baseItem,
+            texture=f'{self.destinationDirectory}/{file}',
+            model='generated',
+            stackSize=stackSize,
+            rightClick=RightClick(enabled=enabled, function=str(row.get('rightClickFunction') or ''), mode=mode)
+        )
+
+    def prepare(self, directory, manifestPath=None):
+        """
+        Validates a folder (and manifest) without touching the workspace.
+
+        :return: (list of (source path, Item), list of error strings)
+        """
+        errors = []
+        textures = sorted(f for f in os.listdir(directory) if f.lower().endswith('.png'))
+
+        manifest = {}
+        if manifestPath:
+            try:
+                manifest = self.loadManifest(manifestPath)
+            except (OSError, ValueError, csv.Error) as e:
+                return [], [f'Could not read manifest: {e}']
+            for file in manifest:
+                if file not in textures:
+                    errors.append(f'{file}: Texture not found in {directory}.')
+
+        if not textures:
+            errors.append('The selected folder contains no PNG files.')
+
+        jobs = []
+        seen = set()
+        for file in textures:
+            # Columns a row leaves empty fall back to the values derived from the filename
+            row = {**self.defaultRow(file), **{key: value for key, value in manifest.get(file, {}).items() if value not in (None, '')}}
+            item = self.buildItem(file, row, errors)
+            if item.name in seen:
+                errors.append(f'{file}: Item name "{item.name}" is used more than once.')
+            seen.add(item.name)
+            jobs.append((os.path.join(directory, file), item))
+
+        return jobs, errors
+
+    def collisions(self, jobs, existingNames):
+        """Names of prepared items that are already in the project."""
+        return [item.name for _, item in jobs if item.name in existingNames]
+
+    def copyTextures(self, jobs):
+        os.makedirs(self.destinationDirectory, exist_ok=True)
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            # list() re-raises the first copy failure here
+            list(pool.map(lambda job: shutil.copyfile(job[0], job[1].texture), jobs))
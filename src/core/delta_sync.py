@@ -0,0 +1,162 @@
+import hashlib
+import json
+import os
+import posixpath
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from core.http_client import getSession
+
+
+CHUNK_SIZE = 64 * 1024
+MAX_FILE_SIZE = 64 * 1024 * 1024
+SYNC_ROOTS = ('lib/', 'modules/')
+DOWNLOAD_WORKERS = 4
+
+
+class SyncError(Exception):
+    pass
+
+
+def fileHash(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class DeltaSync:
+    """
+    Keeps a version's data file and generator module in step with the server.
+
+    The server publishes `lib/manifests/<version>.json`:
+
+        {"version": "1.21.11", "files": {"<path>": {"sha256": "...", "size": 123}}}
+
+    where each path is relative to both the repository root (for the download
+    URL) and the install directory. Only files whose hash differs locally are
+    fetched, several at a time. Downloads stream into `.sync/` next to the
+    install, resume from a partial file with a Range request, and are checked
+    against the manifest before any file is swapped into `lib/` or `modules/`.
+    """
+
+    def __init__(self, baseUrl, rootDirectory, session=None, timeout=10):
+        self.baseUrl = baseUrl.rstrip('/')
+        self.rootDirectory = str(rootDirectory)
+        self.stagingDirectory = os.path.join(self.rootDirectory, '.sync')
+        self.session = session or getSession()
+        self.timeout = timeout
+
+    def fetchManifest(self, version):
+        response = self.session.get(f'{self.baseUrl}/lib/manifests/{version}.json', timeout=self.timeout)
+        response.raise_for_status()
+        manifest = response.json()
+        if not isinstance(manifest.get("files"), dict):
+            raise SyncError(f'Manifest for {version} has no file list.')
+        return manifest
+
+    def localPath(self, relativePath):
+        normalised = posixpath.normpath(relativePath)
+        if normalised != relativePath or not relativePath.startswith(SYNC_ROOTS) or '..' in normalised.split('/'):
+            raise SyncError(f'Refusing to write outside the install: {relativePath}')
+        return os.path.join(self.rootDirectory, *normalised.split('/'))
+
+    def changedFiles(self, manifest):
+        """Returns the manifest entries whose local copy is missing or differs."""
+        changed = []
+        for relativePath, entry in manifest["files"].items():
+            path = self.localPath(relativePath)
+            if not os.path.exists(path) or os.path.getsize(path) != entry["size"] or fileHash(path) != entry["sha256"]:
+                changed.append((relativePath, entry))
+        return changed
+
+    def download(self, relativePath, entry):
+        """Streams one file into the staging directory, resuming a partial download. Returns the staged path."""
+        if entry["size"] > MAX_FILE_SIZE:
+            raise SyncError(f'{relativePath} is larger than the {MAX_FILE_SIZE // (1024 * 1024)} MB limit.')
+
+        staged = os.path.join(self.stagingDirectory, *relativePath.split('/'))
+        partial = f'{staged}.part'
+        os.makedirs(os.path.dirname(staged), exist_ok=True)
+
+        offset = os.path.getsize(partial) if os.path.exists(partial) else 0
+        if offset > entry["size"]:
+            os.remove(partial)
+            offset = 0
+
+        if offset < entry["size"]:
+            headers = {'Range': f'bytes={offset}-'} if offset else {}
+            with self.session.get(f'{self.baseUrl}/{relativePath}', headers=headers, stream=True, timeout=self.timeout) as response:
+                response.raise_for_status()
+                # A server that ignores Range sends the whole file again
+                mode = 'ab' if response.status_code == 206 else 'wb'
+                written = offset if mode == 'ab' else 0
+                with open(partial, mode) as f:
+                    for chunk in response.iter_content(CHUNK_SIZE):
+                        written += len(chunk)
+                        if written > entry["size"]:
+                            break
+                        f.write(chunk)
+
+        if os.path.getsize(partial) != entry["size"] or fileHash(partial) != entry["sha256"]:
+            os.remove(partial)
+            raise SyncError(f'Checksum mismatch for {relativePath}.')
+
+        os.replace(partial, staged)
+        return staged
+
+    def sync(self, version, progress=None):
+        """
+        Brings the install up to date with the version's manifest.
+
+        :param progress: Optional callable (done, total) called after each file.
+        :return: List of relative paths that were updated.
+        """
+        manifest = self.fetchManifest(version)
+        changed = self.changedFiles(manifest)
+
+        staged = []
+        with ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS) as pool:
+            futures = {pool.submit(self.download, relativePath, entry): relativePath for relativePath, entry in changed}
+            for index, future in enumerate(as_completed(futures), start=1):
+                staged.append((futures[future], future.result()))
+                if progress:
+                    progress(index, len(changed))
+
+        # Everything is verified, so swap the files in
+        for relativePath, stagedPath in staged:
+            path = self.localPath(relativePath)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            os.replace(stagedPath, path)
+
+        return [relativePath for relativePath, _ in staged]
+
+
+def buildManifest(rootDirectory, version, paths):
+    """Builds the manifest for `paths` (relative, '/'-separated) under `rootDirectory`."""
+    files = {}
+    for relativePath in sorted(paths):
+        path = os.path.join(str(rootDirectory), *relativePath.split('/'))
+        files[relativePath] = {"sha256": fileHash(path), "size": os.path.getsize(path)}
+    return {"version": version, "files": files}
+
+
+def writeManifest(rootDirectory, version):
+    """Writes lib/manifests/<version>.json for the version's data file and generator module zip."""
+    rootDirectory = str(rootDirectory)
+    paths = [f'lib/{version}_data.json', f'modules/v{version.replace(".", "_")}.zip']
+
+    manifest = buildManifest(rootDirectory, version, paths)
+    path = os.path.join(rootDirectory, 'lib', 'manifests', f'{version}.json')
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w') as f:
+        json.dump(manifest, f, indent=4)
+    return manifest
+
+
+if __name__ == "__main__":
+    import sys
+    # Usage: python src/core/delta_sync.py 1.21.11
+    root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    for version in sys.argv[1:]:
+        print(f'{version}: {len(writeManifest(root, version)["files"])} files')
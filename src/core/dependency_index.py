@@ -0,0 +1,161 @@
+EQUIPMENT_SUFFIXES = ('helmet', 'chestplate', 'leggings', 'boots', 'horse_armor')
+
+# Files written per element, relative to the export directory. {pack} is the
+# data pack folder, {rp} the resource pack folder and {ns} the pack namespace.
+ELEMENT_OUTPUTS = {
+    'blocks': (
+        '{pack}/data/{ns}/function/blocks/{name}/place.mcfunction',
+        '{pack}/data/{ns}/function/blocks/{name}/{name}.mcfunction',
+        '{pack}/data/{ns}/function/blocks/{name}/break.mcfunction',
+        '{pack}/data/{ns}/loot_table/{name}.json',
+        '{rp}/assets/{ns}/items/{name}.json',
+        '{rp}/assets/{ns}/models/item/{name}.json'
+    ),
+    'items': (
+        '{pack}/data/{ns}/function/items/{name}/{name}.mcfunction',
+        '{pack}/data/{ns}/function/items/{name}/cooldown.mcfunction',
+        '{pack}/data/{ns}/function/items/{name}/execute.mcfunction',
+        '{pack}/data/{ns}/advancement/{name}_use.json',
+        '{pack}/data/{ns}/advancement/{name}_cooldown.json',
+        '{rp}/assets/{ns}/items/{name}.json',
+        '{rp}/assets/{ns}/models/item/{name}.json'
+    ),
+    'recipes': (
+        '{pack}/data/{ns}/recipe/{name}.json',
+    ),
+    'paintings': (
+        '{pack}/data/{ns}/painting_variant/{name}.json',
+    ),
+    'structures': (
+        '{pack}/data/{ns}/worldgen/structure/{name}.json',
+        '{pack}/data/{ns}/worldgen/structure_set/{name}.json',
+        '{pack}/data/{ns}/worldgen/template_pool/{name}.json'
+    ),
+    'equipment': (
+        '{rp}/assets/{ns}/equipment/{name}.json',
+        *(f'{{rp}}/assets/{{ns}}/items/{{name}}_{suffix}.json' for suffix in EQUIPMENT_SUFFIXES),
+        *(f'{{rp}}/assets/{{ns}}/models/item/{{name}}_{suffix}.json' for suffix in EQUIPMENT_SUFFIXES)
+    )
+}
+
+# Files that list every element of a category, so any change to it rewrites them.
+CATEGORY_OUTPUTS = {
+    'blocks': (
+        '{pack}/data/{ns}/function/blocks/check_placed_item_frame.mcfunction',
+        '{pack}/data/{ns}/function/blocks/as_blocks.mcfunction',
+        '{pack}/data/{ns}/function/give_blocks.mcfunction'
+    ),
+    'items': (
+        '{pack}/data/{ns}/function/give_items.mcfunction',
+        '{pack}/data/{ns}/function/load.mcfunction'
+    ),
+    'paintings': (
+        '{pack}/data/{ns}/function/give_paintings.mcfunction',
+        '{pack}/data/minecraft/tags/painting_variant/placeable.json'
+    ),
+    'equipment': (
+        '{pack}/data/{ns}/function/give_equipment.mcfunction',
+    )
+}
+
+
+class DependencyIndex:
+    """
+    Reverse index of references between project elements.
+
+    Recipes point at their result by name and blocks point at their drop, using
+    the same lookup the templates do: an item or block name, or
+    `<equipment>_<piece>` for equipment. The index maps each referenced name to
+    the elements using it, so usages, delete warnings and regeneration sets are
+    answered without scanning the project.
+    """
+
+    def __init__(self):
+        self.usedBy = {}    # reference -> {(category, name)}
+        self.uses = {}      # (category, name) -> {reference}
+
+    @staticmethod
+    def references(category, element):
+        if category == 'blocks':
+            return {element.blockDrop} if element.blockDrop and element.blockDrop != 'self' else set()
+        if category == 'recipes':
+            result = element.items.get('9' if element.type == 'crafting' else '11')
+            return {result} if result else set()
+        return set()
+
+    @staticmethod
+    def keys(category, name):
+        """Reference strings that resolve to the given element."""
+        if category == 'equipment':
+            return {f'{name}_{suffix}' for suffix in EQUIPMENT_SUFFIXES}
+        if category in ('blocks', 'items'):
+            return {name}
+        return set()
+
+    def clear(self):
+        self.usedBy.clear()
+        self.uses.clear()
+
+    def rebuild(self, elements: dict):
+        """Indexes a whole project, given a mapping of category -> element dict."""
+        self.clear()
+        for category, values in elements.items():
+            for element in values.values():
+                self.update(category, element)
+
+    def update(self, category, element):
+        self.remove(category, element.name)
+
+        refs = self.references(category, element)
+        if refs:
+            key = (category, element.name)
+            self.uses[key] = refs
+            for ref in refs:
+                self.usedBy.setdefault(ref, set()).add(key)
+
+    def remove(self, category, name):
+        key = (category, name)
+        for ref in self.uses.pop(key, ()):
+            users = self.usedBy.get(ref)
+            if users:
+                users.discard(key)
+                if not users:
+                    del self.usedBy[ref]
+
+    def usages(self, category, name):
+        """Returns a sorted list of (category, name) pairs referencing the element."""
+        found = set()
+        for ref in self.keys(category, name):
+            found |= self.usedBy.get(ref, set())
+        found.discard((category, name))
+        return sorted(found)
+
+    def affected(self, category, name):
+        """The element plus everything that renders its properties, followed transitively."""
+        seen = {(category, name)}
+        pending = [(category, name)]
+        while pending:
+            for user in self.usages(*pending.pop()):
+                if user not in seen:
+                    seen.add(user)
+                    pending.append(user)
+        return seen
+
+    def outputFiles(self, changes, packName, namespace):
+        """
+        Minimal set of export files to rewrite (or remove) after `changes`.
+
+        :param changes: Iterable of (category, name) pairs that were added, edited or deleted.
+        :return: Sorted list of paths relative to the export directory.
+        """
+        elements = set()
+        for category, name in changes:
+            elements |= self.affected(category, name)
+
+        fields = {'pack': packName, 'rp': f'{packName} Resource Pack', 'ns': namespace}
+        files = set()
+        for category, name in elements:
+            files.update(path.format(name=name, **fields) for path in ELEMENT_OUTPUTS.get(category, ()))
+        for category in {category for category, _ in changes}:
+            files.update(path.format(**fields) for path in CATEGORY_OUTPUTS.get(category, ()))
+        return sorted(files)
@@ -0,0 +1,105 @@
+import json
+import os
+
+
+class EditJournal:
+    """
+    Append-only log of element edits kept next to a project's JSON files.
+
+    Every add/edit/delete is written as one JSON line and flushed to disk, so a
+    crash between saves loses nothing. `replay()` re-applies the records on load
+    and `clear()` truncates the log once a full save has compacted it.
+    """
+
+    FILE_NAME = 'journal.jsonl'
+
+    def __init__(self, projectDirectory):
+        self.path = os.path.join(projectDirectory, self.FILE_NAME)
+        self.file = None
+
+    def open(self):
+        if self.file is None:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            self.file = open(self.path, 'a', encoding='utf-8')
+            # Terminate a record torn by a crash so new records start on their own line.
+            if self.file.tell() > 0:
+                with open(self.path, 'rb') as f:
+                    f.seek(-1, os.SEEK_END)
+                    if f.read(1) != b'\n':
+                        self.file.write('\n')
+
+    def close(self):
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+    def recordMany(self, entries):
+        """
+        Appends (op, category, name, data) records and forces them to disk with a single flush.
+
+        op is one of 'add', 'edit' or 'delete'; category is the element dict the
+        record applies to, e.g. 'blocks'; name is the element name (the dict key);
+        data is the JSON-serialisable element properties, or None for deletes.
+        """
+        self.open()
+        lines = []
+        for op, category, name, data in entries:
+            entry = {"op": op, "type": category, "name": name}
+            if data is not None:
+                entry["data"] = data
+            lines.append(json.dumps(entry, separators=(",", ":")) + "\n")
+        self.file.write("".join(lines))
+        self.file.flush()
+        os.fsync(self.file.fileno())
+
+    def pending(self):
+        """
+        Returns the records written since the last compaction.
+
+        Torn lines (the app died mid-write) are skipped.
+        """
+        if not os.path.exists(self.path):
+            return []
+
+        records = []
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if entry.get("op") in ("add", "edit", "delete") and "type" in entry and "name" in entry:
+                    records.append(entry)
+        return records
+
+    def replay(self, elements: dict, decode=None):
+        """
+        Applies pending records to `elements`, a mapping of category -> element dict.
+
+        :param decode: Optional callable (category, data) -> element used to turn
+                       the stored properties back into project elements.
+        :return: Number of records applied.
+        """
+        applied = 0
+        for entry in self.pending():
+            target = elements.get(entry["type"])
+            if target is None:
+                continue
+
+            if entry["op"] == "delete":
+                target.pop(entry["name"], None)
+            else:
+                data = entry.get("data")
+                if data is None:
+                    continue
+                target[entry["name"]] = decode(entry["type"], data) if decode else data
+            applied += 1
+        return applied
+
+    def clear(self):
+        self.close()
+        if os.path.exists(self.path):
+            os.remove(self.path)
@@ -0,0 +1,213 @@
+from PySide6.QtCore import QAbstractItemModel, QModelIndex, Qt
+from PySide6.QtGui import QFont
+
+from utils.const import TREE_CATEGORIES
+
+FETCH_BATCH = 500       # Element rows added to a category each time the view scrolls near its end
+
+ElementRole = Qt.UserRole + 1       # (category, name) of an element row, None for category rows
+
+
+class ElementTreeModel(QAbstractItemModel):
+    """
+    The element viewer's tree: one row per category, each holding the names
+    of that category's elements.
+
+    Rows are read from the project's element dicts and added to the view in
+    batches as it scrolls, so opening a big project doesn't create a row per
+    element up front. `setFilter()` narrows every category to names
+    containing the search text.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.labels = list(TREE_CATEGORIES)
+        self.categories = list(TREE_CATEGORIES.values())
+        self.names = {category: [] for category in self.categories}      # Every element, in project order
+        self.members = {category: set() for category in self.categories}
+        self.visible = {category: [] for category in self.categories}    # Those matching the filter
+        self.loaded = {category: 0 for category in self.categories}      # How many visible rows the view has
+        self.filterText = ""
+
+    def rebuild(self, elementDicts):
+        self.beginResetModel()
+        for category in self.categories:
+            self.names[category] = list(elementDicts.get(category, {}))
+            self.members[category] = set(self.names[category])
+        self.applyFilter(self.filterText, self.names)
+        self.endResetModel()
+
+    def matches(self, name, text=None):
+        text = self.filterText if text is None else text
+        return not text or text in name.lower()
+
+    def applyFilter(self, text, source):
+        for category in self.categories:
+            self.visible[category] = [name for name in source[category] if self.matches(name, text)] if text else list(source[category])
+            self.loaded[category] = min(len(self.visible[category]), FETCH_BATCH)
+        self.filterText = text
+
+    def setFilter(self, text):
+        text = text.strip().lower()
+        if text == self.filterText:
+            return
+        # Typing more only narrows the results, so only the rows still shown need checking
+        source = self.visible if self.filterText and text.startswith(self.filterText) else self.names
+        self.beginResetModel()
+        self.applyFilter(text, source)
+        self.endResetModel()
+
+    def updateMany(self, changes):
+        """
+        Adds or removes rows after the project changes.
+
+        :param changes: List of (category, name, element or None if it no longer exists).
+        """
+        added = {}
+        removed = {}
+        for category, name, element in changes:
+            if category not in self.names:
+                continue
+            if element is None and name in self.members[category]:
+                removed.setdefault(category, set()).add(name)
+            elif element is not None and name not in self.members[category]:
+                added.setdefault(category, []).append(name)
+
+        for category, names in removed.items():
+            self.members[category] -= names
+            self.names[category] = [name for name in self.names[category] if name not in names]
+            self.removeVisible(category, names)
+        for category, names in added.items():
+            self.members[category].update(names)
+            self.names[category].extend(names)
+            self.appendVisible(category, [name for name in names if self.matches(name)])
+
+    def appendVisible(self, category, names):
+        visible = self.visible[category]
+        start = len(visible)
+        visible.extend(names)
+        if self.loaded[category] < start or not names:
+            # Not fetched into the view yet; they show up when the view scrolls down to them
+            return
+        # Show up to one batch straight away, the rest is fetched as usual
+        end = min(len(visible), start + FETCH_BATCH)
+        self.beginInsertRows(self.categoryIndex(category), start, end - 1)
+        self.loaded[category] = end
+        self.endInsertRows()
+
+    def removeVisible(self, category, names):
+        visible = self.visible[category]
+        rows = [row for row, name in enumerate(visible) if name in names]
+        loaded = self.loaded[category]
+
+        # Rows the view has are removed in contiguous runs, bottom first so earlier rows keep their numbers
+        runs = []
+        for row in rows:
+            if row >= loaded:
+                break
+            if runs and runs[-1][1] == row - 1:
+                runs[-1][1] = row
+            else:
+                runs.append([row, row])
+
+        # Drop the rows the view doesn't have first: it may fetch more during endRemoveRows(), which must not bring them in
+        visible = visible[:loaded] + [name for name in visible[loaded:] if name not in names]
+        self.visible[category] = visible
+
+        parent = self.categoryIndex(category)
+        for first, last in reversed(runs):
+            self.beginRemoveRows(parent, first, last)
+            del visible[first:last + 1]
+            self.loaded[category] -= last - first + 1
+            self.endRemoveRows()
+
+    def categoryIndex(self, category):
+        return self.index(self.categories.index(category), 0)
+
+    def indexOf(self, category, name):
+        """Index of an element's row, fetching rows into the view as needed. Invalid if it is filtered out."""
+        try:
+            row = self.visible[category].index(name)
+        except ValueError:
+            return QModelIndex()
+        while self.loaded[category] <= row:
+            self.fetchMore(self.categoryIndex(category))
+        return self.index(row, 0, self.categoryIndex(category))
+
+    def matchCount(self):
+        return sum(len(visible) for visible in self.visible.values())
+
+    # QAbstractItemModel
+
+    def index(self, row, column, parent=QModelIndex()):
+        if not self.hasIndex(row, column, parent):
+            return QModelIndex()
+        if parent.isValid():
+            # Element rows carry their category's row + 1 as internal id; category rows carry 0
+            return self.createIndex(row, column, parent.row() + 1)
+        return self.createIndex(row, column, 0)
+
+    def parent(self, index):
+        if not index.isValid() or index.internalId() == 0:
+            return QModelIndex()
+        return self.createIndex(index.internalId() - 1, 0, 0)
+
+    def rowCount(self, parent=QModelIndex()):
+        if not parent.isValid():
+            return len(self.categories)
+        if parent.internalId() == 0:
+            return self.loaded[self.categories[parent.row()]]
+        return 0
+
+    def columnCount(self, parent=QModelIndex()):
+        return 1
+
+    def hasChildren(self, parent=QModelIndex()):
+        if not parent.isValid():
+            return True
+        if parent.internalId() == 0:
+            return bool(self.visible[self.categories[parent.row()]])
+        return False
+
+    def canFetchMore(self, parent):
+        if not parent.isValid() or parent.internalId() != 0:
+            return False
+        category = self.categories[parent.row()]
+        return self.loaded[category] < len(self.visible[category])
+
+    def fetchMore(self, parent):
+        category = self.categories[parent.row()]
+        start = self.loaded[category]
+        end = min(len(self.visible[category]), start + FETCH_BATCH)
+        if end <= start:
+            return
+        self.beginInsertRows(parent, start, end - 1)
+        self.loaded[category] = end
+        self.endInsertRows()
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if index.internalId() == 0:
+            if role == Qt.DisplayRole:
+                return self.labels[index.row()]
+            return None
+
+        category = self.categories[index.internalId() - 1]
+        if role == Qt.DisplayRole:
+            return self.visible[category][index.row()]
+        if role == ElementRole:
+            return category, self.visible[category][index.row()]
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation != Qt.Horizontal or section != 0:
+            return None
+        if role == Qt.DisplayRole:
+            return "Element Viewer"
+        if role == Qt.FontRole:
+            font = QFont()
+            font.setBold(True)
+            font.setUnderline(True)
+            return font
+        return None
@@ -0,0 +1,195 @@
+import sys
+from copy import deepcopy
+
+NUMBER = (int, float)
+
+
+class ElementSchemaError(ValueError):
+    pass
+
+
+class Element:
+    """
+    Base class for project elements.
+
+    Subclasses list their fields in `SCHEMA` (field -> expected type) and in
+    `__slots__`, so instances carry no per-object `__dict__`. `fromDict()`
+    validates stored JSON against the schema and `toDict()` produces the exact
+    format written to the workspace files. Fields in `DEFAULTS` may be missing
+    from stored JSON (projects saved by older versions) and take that value.
+    """
+
+    __slots__ = ()
+    SCHEMA = {}
+    DEFAULTS = {}
+
+    def __init__(self, **fields):
+        for field in self.SCHEMA:
+            value = fields[field]
+            if type(value) is str:
+                value = sys.intern(value)
+            elif type(value) in (dict, list):
+                # Stored elements never share containers with the editor state they were built from
+                value = type(value)(value)
+            setattr(self, field, value)
+
+    @classmethod
+    def fromDict(cls, data):
+        if not isinstance(data, dict):
+            raise ElementSchemaError(f'{cls.__name__} must be an object, got {type(data).__name__}.')
+
+        label = data.get("name", "?")
+        fields = {}
+        for field, type_ in cls.SCHEMA.items():
+            if field in data:
+                value = data[field]
+            elif field in cls.DEFAULTS:
+                value = deepcopy(cls.DEFAULTS[field])
+            else:
+                raise ElementSchemaError(f'{cls.__name__} "{label}" is missing "{field}".')
+
+            if isinstance(type_, type) and issubclass(type_, Element):
+                value = type_.fromDict(value)
+            elif not isinstance(value, type_):
+                raise ElementSchemaError(f'{cls.__name__} "{label}": "{field}" has the wrong type ({type(value).__name__}).')
+            fields[field] = value
+        return cls(**fields)
+
+    def toDict(self):
+        data = {}
+        for field in self.SCHEMA:
+            value = getattr(self, field)
+            data[field] = value.toDict() if isinstance(value, Element) else value
+        return data
+
+    def copy(self):
+        return type(self).fromDict(deepcopy(self.toDict()))
+
+    def __eq__(self, other):
+        return type(self) is type(other) and all(getattr(self, f) == getattr(other, f) for f in self.SCHEMA)
+
+    def __repr__(self):
+        return f'{type(self).__name__}({getattr(self, "name", "")!r})'
+
+
+class RightClick(Element):
+    __slots__ = ('enabled', 'function', 'mode')
+    SCHEMA = {
+        "enabled": bool,
+        "function": str,
+        "mode": str
+    }
+    DEFAULTS = {"enabled": False, "function": "", "mode": "tick"}
+
+
+class Block(Element):
+    __slots__ = ('name', 'displayName', 'baseBlock', 'textures', 'placeSound', 'blockDrop', 'directional', 'model')
+    SCHEMA = {
+        "name": str,
+        "displayName": str,
+        "baseBlock": str,
+        "textures": dict,       # str(BlockFace) -> texture path
+        "placeSound": str,
+        "blockDrop": str,
+        "directional": bool,
+        "model": str
+    }
+    DEFAULTS = {"displayName": "", "textures": {}, "placeSound": "", "blockDrop": "self", "directional": False, "model": "Block"}
+
+
+class Item(Element):
+    __slots__ = ('name', 'displayName', 'baseItem', 'texture', 'model', 'stackSize', 'rightClick')
+    SCHEMA = {
+        "name": str,
+        "displayName": str,
+        "baseItem": str,
+        "texture": str,
+        "model": str,
+        "stackSize": int,
+        "rightClick": RightClick
+    }
+    DEFAULTS = {"displayName": "", "model": "generated", "stackSize": 64, "rightClick": {}}
+
+
+class Recipe(Element):
+    __slots__ = ('name', 'items', 'outputCount', 'outputCount2', 'exact', 'shapeless', 'type')
+    SCHEMA = {
+        "name": str,
+        "items": dict,          # str(slot) -> item name
+        "outputCount": int,
+        "outputCount2": int,
+        "exact": bool,
+        "shapeless": bool,
+        "type": str
+    }
+    DEFAULTS = {"outputCount": 1, "outputCount2": 1, "exact": False, "shapeless": False, "type": "crafting"}
+
+
+class Painting(Element):
+    __slots__ = ('name', 'displayName', 'width', 'height', 'placeable', 'texture')
+    SCHEMA = {
+        "name": str,
+        "displayName": str,
+        "width": int,
+        "height": int,
+        "placeable": bool,
+        "texture": str
+    }
+    DEFAULTS = {"displayName": "", "placeable": True}
+
+
+class Structure(Element):
+    __slots__ = ('name', 'structure', 'step', 'terrain_adaptation', 'start_height', 'psth', 'spacing', 'seperation', 'biomes')
+    SCHEMA = {
+        "name": str,
+        "structure": str,
+        "step": str,
+        "terrain_adaptation": str,
+        "start_height": int,
+        "psth": str,
+        "spacing": int,
+        "seperation": int,
+        "biomes": list
+    }
+    DEFAULTS = {"step": "Surface structures", "terrain_adaptation": "None", "start_height": 0, "psth": "Motion blocking", "spacing": 32, "seperation": 8, "biomes": []}
+
+
+class Equipment(Element):
+    __slots__ = ('name', 'displayName', 'armor', 'toughness', 'kb_resistance', 'durability', 'itemTextures', 'modelTextures', 'includeHorse')
+    SCHEMA = {
+        "name": str,
+        "displayName": str,
+        "armor": dict,
+        "toughness": NUMBER,
+        "kb_resistance": NUMBER,
+        "durability": dict,
+        "itemTextures": dict,
+        "modelTextures": dict,
+        "includeHorse": bool
+    }
+    DEFAULTS = {"toughness": 0, "kb_resistance": 0, "modelTextures": {}, "includeHorse": False}
+
+
+ELEMENT_TYPES = {
+    'blocks': Block,
+    'items': Item,
+    'recipes': Recipe,
+    'paintings': Painting,
+    'structures': Structure,
+    'equipment': Equipment
+}
+
+
+def decodeElement(category, data):
+    return ELEMENT_TYPES[category].fromDict(data)
+
+
+def decodeElements(category, data):
+    """Validates and converts a whole `<category>.json` mapping."""
+    if not isinstance(data, dict):
+        raise ElementSchemaError(f'{category}.json must contain an object.')
+    return {name: decodeElement(category, properties) for name, properties in data.items()}
+
+
+def encodeElements(elements):
+    return {name: element.toDict() for name, element in elements.items()}
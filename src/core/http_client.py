@@ -0,0 +1,111 @@
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+
+
+class DownloadError(Exception):
+    pass
+
+
+_session = None
+_sessionLock = threading.Lock()
+
+
+def getSession():
+    """The PooledSession shared by every network call in the app."""
+    global _session
+    with _sessionLock:
+        if _session is None:
+            # requests takes ~100 ms to import, so it is only loaded once something goes online
+            from core.pooled_session import PooledSession
+            _session = PooledSession()
+        return _session
+
+
+_mirror = None
+
+
+def setMirror(location):
+    """
+    Points version list, data file and module fetches at an offline mirror:
+    a folder made by `python -m core.mirror`, or the URL of a server hosting one.
+    An empty value goes back to the default servers.
+    """
+    global _mirror
+    location = (location or '').strip()
+    if not location:
+        _mirror = None
+    elif location.startswith(('http://', 'https://', 'file://')):
+        _mirror = location.rstrip('/')
+    else:
+        _mirror = Path(location).expanduser().resolve().as_uri()
+
+
+def mirrorUrl():
+    """Base URL of the configured offline mirror, or None."""
+    return _mirror
+
+
+class HttpCache:
+    """
+    On-disk cache of GET responses, revalidated with ETag / Last-Modified.
+
+    Each URL is stored as `<sha1>.body` plus `<sha1>.json` holding the
+    validators. A 304 answer returns the stored body without downloading it
+    again.
+    """
+
+    def __init__(self, directory, session=None):
+        self.directory = str(directory)
+        self.session = session or getSession()
+
+    def paths(self, url):
+        key = hashlib.sha1(url.encode()).hexdigest()
+        return os.path.join(self.directory, f'{key}.body'), os.path.join(self.directory, f'{key}.json')
+
+    def cached(self, url):
+        """Returns the stored body for `url`, or None."""
+        bodyPath, _ = self.paths(url)
+        try:
+            with open(bodyPath, 'rb') as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def fetch(self, url, timeout=5):
+        """Returns the response body, from the cache when the server answers 304."""
+        bodyPath, metaPath = self.paths(url)
+
+        headers = {}
+        try:
+            with open(metaPath, 'r') as f:
+                meta = json.load(f)
+            if os.path.exists(bodyPath):
+                if meta.get("etag"):
+                    headers['If-None-Match'] = meta["etag"]
+                if meta.get("last_modified"):
+                    headers['If-Modified-Since'] = meta["last_modified"]
+        except (OSError, ValueError):
+            pass
+
+        response = self.session.get(url, headers=headers, timeout=timeout)
+        if response.status_code == 304:
+            body = self.cached(url)
+            if body is not None:
+                return body
+            response = self.session.get(url, timeout=timeout)
+        response.raise_for_status()
+
+        body = response.content
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(f'{bodyPath}.tmp', 'wb') as f:
+                f.write(body)
+            os.replace(f'{bodyPath}.tmp', bodyPath)
+            with open(metaPath, 'w') as f:
+                json.dump({"url": url, "etag": response.headers.get('ETag'), "last_modified": response.headers.get('Last-Modified')}, f)
+        except OSError:
+            pass
+        return body
@@ -0,0 +1,154 @@
+from PySide6.QtCore import QAbstractListModel, QModelIndex, QSortFilterProxyModel, Qt
+
+from core.dependency_index import EQUIPMENT_SUFFIXES
+
+SELF = 'self'           # A block dropping itself
+PROJECT = 'project'     # Blocks, items and equipment pieces from the open project
+VANILLA = 'vanilla'     # Minecraft items of the project's version
+
+KindRole = Qt.UserRole + 1
+
+CATEGORIES = ('blocks', 'items', 'equipment')
+
+
+def elementNames(category, element):
+    """The item ids an element adds to the game."""
+    if category == 'equipment':
+        return [f'{element.name}_{suffix}' for suffix in EQUIPMENT_SUFFIXES if suffix != 'horse_armor' or element.includeHorse]
+    return [element.name]
+
+
+class ItemNameModel(QAbstractListModel):
+    """
+    Every item id a recipe slot or block drop can name: 'self', then the
+    project's blocks, items and equipment pieces, then the vanilla items.
+
+    Built once per project and kept up to date as elements change, so the
+    combo boxes sharing it never have to be refilled.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.owners = []        # (category, element name) for each project row
+        self.names = []         # Item id for each project row
+        self.vanilla = ()
+
+    def rebuild(self, vanilla, elementDicts):
+        self.beginResetModel()
+        self.owners = []
+        self.names = []
+        for category in CATEGORIES:
+            for name, element in elementDicts.get(category, {}).items():
+                for itemName in elementNames(category, element):
+                    self.owners.append((category, name))
+                    self.names.append(itemName)
+        self.vanilla = tuple(vanilla)
+        self.endResetModel()
+
+    def rowsOf(self, category, name):
+        """Returns (first, last) project row of an element, or None."""
+        rows = [row for row, owner in enumerate(self.owners) if owner == (category, name)]
+        return (rows[0], rows[-1]) if rows else None
+
+    def insertionRow(self, category):
+        # New elements go at the end of their category's group
+        order = CATEGORIES.index(category)
+        for row, (owner, _) in enumerate(self.owners):
+            if CATEGORIES.index(owner) > order:
+                return row
+        return len(self.owners)
+
+    def updateMany(self, changes):
+        """
+        Brings the rows in line with changed elements.
+
+        :param changes: List of (category, name, element or None if it no longer exists).
+        """
+        changes = [change for change in changes if change[0] in CATEGORIES]
+        if len(changes) == 1:
+            self.update(*changes[0])
+        elif changes:
+            # Bulk edits (imports, undoing them) regroup the rows in one pass instead of moving them one element at a time
+            groups = {category: {} for category in CATEGORIES}
+            for owner, itemName in zip(self.owners, self.names):
+                groups[owner[0]].setdefault(owner[1], []).append(itemName)
+            for category, name, element in changes:
+                if element is None:
+                    groups[category].pop(name, None)
+                else:
+                    groups[category][name] = elementNames(category, element)
+
+            self.beginResetModel()
+            self.owners = [(category, name) for category in CATEGORIES for name, itemNames in groups[category].items() for _ in itemNames]
+            self.names = [itemName for category in CATEGORIES for itemNames in groups[category].values() for itemName in itemNames]
+            self.endResetModel()
+
+    def update(self, category, name, element):
+        """Replaces an element's rows, or removes them when `element` is None."""
+        if category not in CATEGORIES:
+            return
+
+        newNames = elementNames(category, element) if element is not None else []
+        existing = self.rowsOf(category, name)
+        if existing:
+            first, last = existing
+            if self.names[first:last + 1] == newNames:
+                return
+            self.beginRemoveRows(QModelIndex(), first + 1, last + 1)
+            del self.owners[first:last + 1]
+            del self.names[first:last + 1]
+            self.endRemoveRows()
+            row = first
+        else:
+            row = self.insertionRow(category)
+
+        if newNames:
+            self.beginInsertRows(QModelIndex(), row + 1, row + len(newNames))
+            self.owners[row:row] = [(category, name)] * len(newNames)
+            self.names[row:row] = newNames
+            self.endInsertRows()
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return 1 + len(self.names) + len(self.vanilla)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row = index.row()
+
+        if role in (Qt.DisplayRole, Qt.EditRole):
+            if row == 0:
+                return SELF
+            row -= 1
+            if row < len(self.names):
+                return self.names[row]
+            return self.vanilla[row - len(self.names)]
+
+        if role == KindRole:
+            if row == 0:
+                return SELF
+            return PROJECT if row - 1 < len(self.names) else VANILLA
+
+        return None
+
+
+class ItemNameFilter(QSortFilterProxyModel):
+    """Shows the rows of an ItemNameModel whose kind is in `kinds`."""
+
+    def __init__(self, source, kinds, parent=None):
+        super().__init__(parent)
+        self.kinds = frozenset(kinds)
+        self.setSourceModel(source)
+
+    def setKinds(self, kinds):
+        kinds = frozenset(kinds)
+        if kinds != self.kinds:
+            self.kinds = kinds
+            self.invalidateFilter()
+
+    def filterAcceptsRow(self, sourceRow, sourceParent):
+        if sourceRow == 0:
+            return SELF in self.kinds
+        return (PROJECT if sourceRow - 1 < len(self.sourceModel().names) else VANILLA) in self.kinds
@@ -0,0 +1,81 @@
+import json
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from core.delta_sync import buildManifest
+from core.http_client import getSession
+from module import ModuleDownloader
+from utils.const import LIB_URL
+
+DOWNLOAD_WORKERS = 4
+
+
+def sourceUrls(source):
+    """Returns (lib URL, modules URL) to mirror from: the default servers, a mirror-style folder or a URL."""
+    if not source:
+        return LIB_URL, ModuleDownloader.MODULE_BASE
+    if not source.startswith(('http://', 'https://', 'file://')):
+        source = Path(source).expanduser().resolve().as_uri()
+    source = source.rstrip('/')
+    return f'{source}/lib', f'{source}/modules'
+
+
+def fetchTo(session, url, path):
+    response = session.get(url)
+    response.raise_for_status()
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(f'{path}.tmp', 'wb') as f:
+        f.write(response.content)
+    os.replace(f'{path}.tmp', path)
+
+
+def buildMirror(destination, source=None, session=None):
+    """
+    Packs the version list, every version's data file and generator module zip,
+    and a fresh delta-sync manifest per version into `destination`, laid out
+    like the repository (`lib/`, `lib/manifests/`, `modules/`).
+
+    Versions whose files can't be fetched are left out of the bundle's version
+    list. Returns the list of mirrored versions.
+    """
+    destination = str(destination)
+    session = session or getSession()
+    libUrl, modulesUrl = sourceUrls(source)
+
+    response = session.get(f'{libUrl}/version_list.json')
+    response.raise_for_status()
+    versionList = response.json()
+
+    def mirrorVersion(version):
+        module = f'v{version.replace(".", "_")}'
+        paths = [f'lib/{version}_data.json', f'modules/{module}.zip']
+        try:
+            fetchTo(session, f'{libUrl}/{version}_data.json', os.path.join(destination, 'lib', f'{version}_data.json'))
+            fetchTo(session, f'{modulesUrl}/{module}.zip', os.path.join(destination, 'modules', f'{module}.zip'))
+        except (OSError, ValueError) as e:      # requests' errors are OSErrors
+            print(f'Skipping {version}: {e}')
+            return None
+
+        # Rebuilt here so the hashes always match the files in the bundle
+        manifest = buildManifest(destination, version, paths)
+        os.makedirs(os.path.join(destination, 'lib', 'manifests'), exist_ok=True)
+        with open(os.path.join(destination, 'lib', 'manifests', f'{version}.json'), 'w') as f:
+            json.dump(manifest, f, indent=4)
+        return version
+
+    with ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS) as pool:
+        mirrored = [version for version in pool.map(mirrorVersion, versionList["versions"]) if version]
+
+    versionList["versions"] = mirrored
+    os.makedirs(os.path.join(destination, 'lib'), exist_ok=True)
+    with open(os.path.join(destination, 'lib', 'version_list.json'), 'w') as f:
+        json.dump(versionList, f, indent=4)
+    return mirrored
+
+
+if __name__ == "__main__":
+    # Usage (from src/): python -m core.mirror <bundle folder> [source folder or URL]
+    bundle = buildMirror(sys.argv[1], sys.argv[2] if len(sys.argv) > 2 else None)
+    print(f'Mirrored {len(bundle)} version(s) into {sys.argv[1]}: {", ".join(bundle)}')
@@ -0,0 +1,93 @@
+import importlib
+import importlib.util
+import os
+import sys
+import zipimport
+
+# Generator modules loaded in this process: version -> (source stamp, generator module)
+_loaded = {}
+
+
+def moduleName(version):
+    return f'v{version.replace(".", "_")}'
+
+
+def moduleZipPath(mainDirectory, version):
+    return os.path.join(str(mainDirectory), 'modules', f'{moduleName(version)}.zip')
+
+
+def moduleSource(mainDirectory, version):
+    """
+    Returns (path, stamp) for where a version's generator module lives.
+
+    `modules/<module>.zip` is used whenever it exists, so installed updates
+    always take effect. An extracted `src/generation/<module>` folder is only
+    used when there is no zip, or in a source checkout (not frozen), where it
+    wins so generator changes can be tried without rebuilding the zip.
+    Returns (None, None) if neither exists.
+    """
+    extracted = os.path.join(str(mainDirectory), 'src', 'generation', moduleName(version))
+    if not getattr(sys, 'frozen', False) and os.path.isdir(extracted):
+        return extracted, None
+
+    path = moduleZipPath(mainDirectory, version)
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return (extracted, None) if os.path.isdir(extracted) else (None, None)
+    return path, (stat.st_mtime_ns, stat.st_size)
+
+
+def unloadModule(name):
+    for key in [key for key in sys.modules if key == name or key.startswith(f'{name}.')]:
+        del sys.modules[key]
+
+
+def importFromZip(name, zipPath, module):
+    """Imports the package `module` inside `zipPath` under the name `name`."""
+    importlib.invalidate_caches()       # Drops zipimport's table of contents for a replaced zip
+    importer = zipimport.zipimporter(zipPath)
+    importer.invalidate_caches()
+
+    spec = importer.find_spec(module)
+    if spec is None or spec.loader is None:
+        raise ImportError(f'{zipPath} does not contain the {module} module.', name=name)
+
+    # Re-spec the package under its full name; submodules resolve through its __path__ inside the zip.
+    spec = importlib.util.spec_from_file_location(name, spec.origin, loader=importer, submodule_search_locations=[os.path.join(zipPath, module)])
+    package = importlib.util.module_from_spec(spec)
+    sys.modules[name] = package
+    try:
+        spec.loader.exec_module(package)
+    except BaseException:
+        del sys.modules[name]
+        raise
+    return package
+
+
+def loadGenerator(mainDirectory, version, package='generation'):
+    """
+    Returns the `generator` module for `version`.
+
+    Installed versions are imported straight from their zip with zipimport;
+    templates are read out of the same zip by the generators' PackageLoader.
+    Modules are kept for the life of the process and only re-imported when the
+    zip on disk changes.
+    """
+    path, stamp = moduleSource(mainDirectory, version)
+    if path is None:
+        raise ImportError(f'The generator module for {version} is not installed.')
+
+    cached = _loaded.get(version)
+    if cached and cached[0] == (path, stamp):
+        return cached[1]
+
+    name = f'{package}.{moduleName(version)}'
+    unloadModule(name)
+    importlib.import_module(package)
+    if stamp is not None:
+        importFromZip(name, path, moduleName(version))
+    generator = importlib.import_module(f'{name}.generator')
+
+    _loaded[version] = ((path, stamp), generator)
+    return generator
@@ -0,0 +1,83 @@
+import logging
+import os
+import shutil
+import tempfile
+import threading
+import time
+
+from PySide6.QtCore import QThread, Signal
+
+logger = logging.getLogger("mDirt")
+
+PROGRESS_INTERVAL = 0.05    # Seconds between per-element progress updates
+
+
+class ExportCancelled(Exception):
+    pass
+
+
+class PackExporter(QThread):
+    """
+    Runs a pack generator off the GUI thread.
+
+    The generator writes into a hidden staging folder inside the export
+    location; only a finished export replaces the packs already there, so a
+    cancelled or failed export leaves nothing behind.
+    """
+
+    progress = Signal(str, str, int, int)     # stage, element ('' when a stage starts), done, total
+    exported = Signal(str)                    # export location
+    failed = Signal(str)
+    cancelled = Signal()
+
+    def __init__(self, makeGenerator, outputDirectory, parent=None):
+        """
+        :param makeGenerator: Callable (directory, progress) returning the generator to run.
+        """
+        super().__init__(parent)
+        self.makeGenerator = makeGenerator
+        self.outputDirectory = str(outputDirectory)
+        self.cancelRequested = threading.Event()
+        self.lastReport = 0
+
+    def cancel(self):
+        self.cancelRequested.set()
+
+    def reportProgress(self, stage, element, done, total):
+        # Called by the generator between elements, which is where a cancel takes effect
+        if self.cancelRequested.is_set():
+            raise ExportCancelled()
+
+        # Stage starts always go through; elements are throttled so big packs don't flood the GUI thread
+        now = time.monotonic()
+        if element is None or done == total or now - self.lastReport >= PROGRESS_INTERVAL:
+            self.lastReport = now
+            self.progress.emit(stage, element or '', done, total)
+
+    def publish(self, staging):
+        for name in os.listdir(staging):
+            if name.startswith('.'):
+                continue
+            target = os.path.join(self.outputDirectory, name)
+            if os.path.exists(target):
+                # The previous export is moved aside and deleted with the staging folder
+                os.replace(target, os.path.join(staging, f'.previous {name}'))
+            os.replace(os.path.join(staging, name), target)
+
+    def run(self):
+        os.makedirs(self.outputDirectory, exist_ok=True)
+        staging = tempfile.mkdtemp(prefix='.export-', dir=self.outputDirectory)
+        try:
+            self.makeGenerator(staging, self.reportProgress).generateDatapack()
+            if self.cancelRequested.is_set():
+                raise ExportCancelled()
+            self.publish(staging)
+        except ExportCancelled:
+            self.cancelled.emit()
+        except Exception as e:
+            logger.exception("Pack export failed")
+            self.failed.emit(str(e))
+        else:
+            self.exported.emit(self.outputDirectory)
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
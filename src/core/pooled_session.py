@@ -0,0 +1,141 @@
+import io
+import logging
+import os
+import re
+import threading
+import time
+from collections import deque
+from urllib.parse import urlparse
+from urllib.request import url2pathname
+
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from urllib3.util.retry import Retry
+
+MAX_CONCURRENT_REQUESTS = 6
+DEFAULT_TIMEOUT = (5, 30)   # (connect, read) seconds
+RETRIES = Retry(
+    total=3,
+    backoff_factor=0.5,     # 0.5s, 1s, 2s between attempts
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=frozenset({'GET', 'HEAD'}),
+    respect_retry_after_header=True,
+    raise_on_status=False
+)
+
+logger = logging.getLogger("mDirt")
+
+
+class RequestMetrics:
+    """Timings of the most recent requests made through the shared session."""
+
+    def __init__(self, size=200):
+        self.records = deque(maxlen=size)
+        self.lock = threading.Lock()
+
+    def record(self, method, url, status, elapsed, waited, retries):
+        with self.lock:
+            self.records.append({"method": method, "url": url, "status": status, "elapsed": elapsed, "waited": waited, "retries": retries})
+        logger.debug(f'{method} {url} -> {status} in {elapsed * 1000:.0f} ms (queued {waited * 1000:.0f} ms, {retries} retries)')
+
+    def summary(self):
+        with self.lock:
+            records = list(self.records)
+        if not records:
+            return {"requests": 0}
+        elapsed = sorted(record["elapsed"] for record in records)
+        return {
+            "requests": len(records),
+            "failures": sum(1 for record in records if record["status"] is None or record["status"] >= 400),
+            "retries": sum(record["retries"] for record in records),
+            "median_ms": elapsed[len(elapsed) // 2] * 1000,
+            "max_ms": elapsed[-1] * 1000
+        }
+
+
+class FileAdapter(BaseAdapter):
+    """
+    Serves file:// URLs, so an offline mirror folder works anywhere a URL does.
+    Files are kept in memory and only read again when they change on disk.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.files = {}
+        self.lock = threading.Lock()
+
+    def read(self, path):
+        stat = os.stat(path)
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        with self.lock:
+            cached = self.files.get(path)
+        if cached and cached[0] == stamp:
+            return cached[1]
+
+        with open(path, 'rb') as f:
+            body = f.read()
+        with self.lock:
+            self.files[path] = (stamp, body)
+        return body
+
+    def send(self, request, **kwargs):
+        response = requests.Response()
+        response.url = request.url
+        response.request = request
+        response.headers = CaseInsensitiveDict()
+
+        try:
+            body = self.read(url2pathname(urlparse(request.url).path))
+            response.status_code, response.reason = 200, 'OK'
+        except OSError:
+            body = b''
+            response.status_code, response.reason = 404, 'Not Found'
+
+        # DeltaSync resumes with open-ended ranges; the updater asks for one file's bytes of a release zip
+        match = re.fullmatch(r'bytes=(\d+)-(\d*)', request.headers.get('Range', ''))
+        if match and response.status_code == 200:
+            end = int(match.group(2)) + 1 if match.group(2) else len(body)
+            body = body[int(match.group(1)):end]
+            response.status_code, response.reason = 206, 'Partial Content'
+
+        response.headers['Content-Length'] = str(len(body))
+        response.raw = io.BytesIO(body)
+        return response
+
+    def close(self):
+        with self.lock:
+            self.files.clear()
+
+
+class PooledSession(requests.Session):
+    """
+    requests.Session with keep-alive connection pools, retries with exponential
+    backoff, a default timeout and a cap on how many requests wait on a server
+    at once. Every request is timed into `metrics`.
+    """
+
+    def __init__(self, maxConcurrent=MAX_CONCURRENT_REQUESTS):
+        super().__init__()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=maxConcurrent, max_retries=RETRIES)
+        self.mount('https://', adapter)
+        self.mount('http://', adapter)
+        self.mount('file://', FileAdapter())
+        self.slots = threading.BoundedSemaphore(maxConcurrent)
+        self.metrics = RequestMetrics()
+
+    def request(self, method, url, *args, **kwargs):
+        kwargs.setdefault('timeout', DEFAULT_TIMEOUT)
+        queued = time.perf_counter()
+        # Held until the response headers arrive; streamed bodies are read outside the limit
+        with self.slots:
+            started = time.perf_counter()
+            try:
+                response = super().request(method, url, *args, **kwargs)
+            except requests.RequestException:
+                self.metrics.record(method, url, None, time.perf_counter() - started, started - queued, 0)
+                raise
+
+        retries = response.raw.retries.history if getattr(response.raw, 'retries', None) else ()
+        self.metrics.record(method, url, response.status_code, time.perf_counter() - started, started - queued, len(retries))
+        return response
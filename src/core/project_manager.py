@@ -1,11 +1,11 @@
 import datetime
 import json
 import os
-import requests
+from concurrent.futures import ThreadPoolExecutor
 import string
 import string
 
-from PySide6.QtWidgets import QWidget, QTreeWidgetItem, QMessageBox
+from PySide6.QtWidgets import QWidget, QMessageBox
 
 from utils.field_validator import FieldValidator
 from utils.enums import ElementPage
@@ -14,14 +14,34 @@ from utils.alert import alert
 import ui.load_project as load_project
 
 from module import ModuleDownloader
+from core.edit_journal import EditJournal
+from core.dependency_index import DependencyIndex
+from core.undo_history import UndoHistory
+from core.version_data import loadVersionData
+from core.delta_sync import DeltaSync, SyncError
+from core.http_client import DownloadError, HttpCache, getSession, mirrorUrl
+from core.background import runInBackground
+from core.item_model import ItemNameModel
+from core.element_tree import ElementTreeModel
+from core.biome_model import BiomeListModel
+from core.module_loader import moduleName, moduleSource
+from core.elements import ElementSchemaError, decodeElement, decodeElements, encodeElements
 
 from utils.const import *
 
+ELEMENT_CATEGORIES = ('blocks', 'items', 'recipes', 'paintings', 'structures', 'equipment')
+
 class ProjectManager():
     def __init__(self, ui, mainDirectory):
         super().__init__()
         self.ui = ui
         self.mainDirectory = mainDirectory
+        self.journal = None
+        self.dependencies = DependencyIndex()
+        self.history = UndoHistory()
+        self.itemNames = ItemNameModel()
+        self.elementTree = ElementTreeModel()
+        self.biomeList = BiomeListModel()
 
     #######################
     # SETUP PROJECT       #
@@ -31,45 +51,64 @@ class ProjectManager():
         verPath = self.mainDirectory / 'lib' / 'version_list.json'
         with open(verPath, 'r') as f:
             versionsa = json.load(f)
-        versions = versionsa["versions"]
+
+        self.version_json = versionsa
+        self.supportedVersions = {item: 'local' for item in versionsa["versions"]}
 
         if remote == False:
-            self.version_json = versionsa
-            self.supportedVersions = versions
             return
 
+        # The local list is shown straight away; the server's list is merged in when it arrives.
         self.ui.statusbar.showMessage("Pulling version list...", 2000)
-        version_url = f'{LIB_URL}/version_list.json'
-        
-        try:
-            response = requests.get(version_url, timeout=5)
-            response.raise_for_status()
+        version_url = f'{self.libUrl()}/version_list.json'
+        runInBackground(lambda: json.loads(self.httpCache().fetch(version_url)), self.versionListFetched, self.versionListFailed)
 
-            data = response.json()
-            self.version_json = data
-            supportedVersions = data.get("versions", [])
+    def versionListFetched(self, data):
+        if not isinstance(data, dict) or not isinstance(data.get("versions"), list):
+            self.versionListFailed(ValueError("Received invalid version list from server."))
+            return
 
-        except requests.exceptions.RequestException as e:
-            alert(f'Failed to download supported versions. Error: {e}\n\nPlease relaunch mDirt and try again. If the problem persists, report it here:\n{ISSUE_URL}')
-        except ValueError:
-            alert(f'Received invalid JSON from server.\n\nPlease try again or report the issue:\n{ISSUE_URL}')
-        
-        merged = {item: 'online' for item in supportedVersions}
-        merged.update({item: 'local' for item in versions})
+        merged = {item: 'online' for item in data["versions"]}
+        merged.update({item: 'local' for item in self.version_json["versions"]})
         self.supportedVersions = merged
 
+        self.version_json = {
+            "versions": list(merged),
+            "dataformat": {**self.version_json.get("dataformat", {}), **data.get("dataformat", {})},
+            "resourceformat": {**self.version_json.get("resourceformat", {}), **data.get("resourceformat", {})}
+        }
+        self.populateVersionDropdown()
+
+    def versionListFailed(self, error):
+        self.ui.statusbar.showMessage(f"Couldn't reach the version server, showing installed versions only. ({error})", 5000)
+
+    def rawUrl(self):
+        return mirrorUrl() or RAW_URL
+
+    def libUrl(self):
+        return f'{self.rawUrl()}/lib'
+
+    def httpCache(self):
+        return HttpCache(self.mainDirectory / 'lib' / 'cache' / 'http')
+
     def installVersionsJson(self):
         path = self.mainDirectory / 'lib' / 'version_list.json'
         with open(path, 'w') as f:
             json.dump(self.version_json, f)
 
-    def openProjectMenu(self):
-        self.pullSupportedVersions()                   # Pulls the supported version list from the server.
+    def populateVersionDropdown(self):
+        selected = self.ui.packVersion.currentText().removeprefix('🌐 ')
 
         self.ui.packVersion.clear()
         for version, source in self.supportedVersions.items():
             label = f"🌐 {version}" if source == "online" else version
             self.ui.packVersion.addItem(label)     # Adds the versions to the dropdown.
+            if version == selected:
+                self.ui.packVersion.setCurrentIndex(self.ui.packVersion.count() - 1)
+
+    def openProjectMenu(self):
+        self.pullSupportedVersions()                   # Pulls the supported version list from the server.
+        self.populateVersionDropdown()
 
         self.ui.elementEditor.setCurrentIndex(ElementPage.PROJECT_SETUP)
         self.unsavedChanges = True
@@ -88,34 +127,70 @@ class ProjectManager():
 
     def pullData(self, remote=True):
         self.ui.statusbar.showMessage("Pulling version data file...", 2000)
-        version = self.packDetails["version"]
-        local_path = self.mainDirectory / 'lib' / f'{version}_data.json'
-        url = f'{LIB_URL}/{version}_data.json'
+        try:
+            updated = self.downloadVersionFiles(self.packDetails["version"], remote)
+        except DownloadError as e:
+            alert(str(e))
+            return
 
-        if not os.path.exists(local_path):
-            response = requests.get(url)
-            if response.status_code == 200:
-                os.makedirs("lib", exist_ok=True)
-                with open(local_path, "wb") as f:
-                    f.write(response.content)
-            else:
-                alert(f'Failed to download data file for version {version}. (HTTP {response.status_code}). \nCheck your internet connection, and relaunch mDirt. If the issue persists, report it here:\n{ISSUE_URL}')
+        if updated:
+            self.ui.statusbar.showMessage(f"Updated {len(updated)} file(s) for {self.packDetails['version']}.", 2000)
 
-            try: # Opens the JSON to ensure it is not corrupted.
-                with open(local_path, "r") as f:
-                    json.load(f)
-            except json.JSONDecodeError:
-                os.remove(local_path)
-                alert(f'Downloaded data file is corrupt or invalid JSON.\nCheck your internet connection, and relaunch mDirt. If the issue persists, report it here:\n{ISSUE_URL}')
-        
-            self.grabModule()
-
-    def grabModule(self):
-        self.ui.statusbar.showMessage("Pulling version module...", 2000)
-        version = f'v{self.packDetails["version"].replace(".", "_")}'
-        dir = self.mainDirectory / 'src' / 'generation'
-        self.moduleGrab = ModuleDownloader(target_dir=dir)
-        self.moduleGrab.download_and_extract(version)
+    def downloadVersionFiles(self, version, remote=True):
+        """
+        Makes sure the data file and generator module for `version` are installed.
+        Safe to call off the GUI thread; problems are raised as DownloadError.
+
+        :return: List of files that were written.
+        """
+        if remote:
+            # Fetch only the changed data/module files listed in the version's manifest.
+            try:
+                return DeltaSync(self.rawUrl(), self.mainDirectory, session=getSession()).sync(version)
+            except (ValueError, SyncError, OSError):      # requests' errors are OSErrors
+                pass
+
+        local_path = self.mainDirectory / 'lib' / f'{version}_data.json'
+        downloads = []
+        if not os.path.exists(local_path):
+            downloads.append((f'lib/{version}_data.json', lambda: self.downloadDataFile(version, local_path)))
+        if moduleSource(self.mainDirectory, version)[0] is None:
+            downloads.append((f'modules/{moduleName(version)}.zip', lambda: self.grabModule(version)))
+        if not downloads:
+            return []
+
+        # Whichever files are missing share the pooled session and download side by side.
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            futures = [pool.submit(download) for _, download in downloads]
+            for future in futures:
+                future.result()
+        return [path for path, _ in downloads]
+
+    def downloadDataFile(self, version, local_path):
+        url = f'{self.libUrl()}/{version}_data.json'
+        try:
+            response = getSession().get(url, timeout=30)
+        except OSError as e:
+            raise DownloadError(f'Failed to download data file for version {version}. ({e}) \nCheck your internet connection, and relaunch mDirt. If the issue persists, report it here:\n{ISSUE_URL}')
+        if response.status_code != 200:
+            raise DownloadError(f'Failed to download data file for version {version}. (HTTP {response.status_code}). \nCheck your internet connection, and relaunch mDirt. If the issue persists, report it here:\n{ISSUE_URL}')
+
+        try: # Opens the JSON to ensure it is not corrupted.
+            json.loads(response.content)
+        except ValueError:
+            raise DownloadError(f'Downloaded data file is corrupt or invalid JSON.\nCheck your internet connection, and relaunch mDirt. If the issue persists, report it here:\n{ISSUE_URL}')
+
+        os.makedirs(local_path.parent, exist_ok=True)
+        with open(f'{local_path}.tmp', "wb") as f:
+            f.write(response.content)
+        os.replace(f'{local_path}.tmp', local_path)
+
+    def grabModule(self, version):
+        dir = self.mainDirectory / 'modules'
+        mirror = mirrorUrl()
+        self.moduleGrab = ModuleDownloader(target_dir=dir, session=getSession(), base_url=f'{mirror}/modules' if mirror else None)
+        if not self.moduleGrab.download(moduleName(version)):
+            raise DownloadError(f'Failed to download the generator module for version {version}.\nCheck your internet connection, and relaunch mDirt. If the issue persists, report it here:\n{ISSUE_URL}')
         
     def newProject(self):
         if self.validatePackDetails() == 0: return      # Make sure all fields aren't empty and only contain valid characters.
@@ -142,15 +217,12 @@ class ProjectManager():
                 }
 
                 self.installVersionsJson()
-                self.pullData()
-                self.setupProjectData()
-
-                self.saveProjectAs()
-                self.ui.menuNew_Element.setEnabled(True) # Enable the Element buttons so user can add things to their pack
-                self.ui.menuTools.setEnabled(True)
 
-                self.ui.elementEditor.setCurrentIndex(ElementPage.HOME)
-                self.ui.textEdit.setHtml(f'<h1>Welcome to mDirt. Create a new Element to get started.</h1>')
+                # Download off the GUI thread, then finish creating the project.
+                self.ui.createProjectButton.setEnabled(False)
+                self.ui.statusbar.showMessage(f"Downloading {self.packDetails['version']}...")
+                version = self.packDetails["version"]
+                runInBackground(lambda: self.downloadVersionFiles(version), lambda _: self.finishNewProject(), self.versionDownloadFailed)
             
             else:
                 QMessageBox.information(self, 'Remote Download Cancelled',
@@ -164,16 +236,26 @@ class ProjectManager():
                     "author": self.ui.packAuthor.text(),
                     "version": self.ui.packVersion.currentText()
                 }
-            self.setupProjectData()
-            self.saveProjectAs()
-            self.ui.menuNew_Element.setEnabled(True) # Enable the Element buttons so user can add things to their pack
-            self.ui.menuTools.setEnabled(True)
-            self.ui.elementEditor.setCurrentIndex(ElementPage.HOME)
-            self.ui.textEdit.setHtml(f'<h1>Welcome to mDirt. Create a new Element to get started.</h1>')
+            self.finishNewProject()
+
+    def versionDownloadFailed(self, error):
+        self.ui.createProjectButton.setEnabled(True)
+        self.ui.statusbar.clearMessage()
+        alert(str(error))
+
+    def finishNewProject(self):
+        self.ui.createProjectButton.setEnabled(True)
+        self.ui.statusbar.clearMessage()
+
+        self.setupProjectData()
+        self.saveProjectAs()
+        self.ui.menuNew_Element.setEnabled(True) # Enable the Element buttons so user can add things to their pack
+        self.ui.menuTools.setEnabled(True)
+        self.ui.elementEditor.setCurrentIndex(ElementPage.HOME)
+        self.ui.textEdit.setHtml(f'<h1>Welcome to mDirt. Create a new Element to get started.</h1>')
 
     def setupProjectData(self):
-        with open(f'{self.mainDirectory}/lib/{self.packDetails["version"]}_data.json', "r") as f:
-            self.data = json.load(f)
+        self.data = loadVersionData(f'{self.mainDirectory}/lib/{self.packDetails["version"]}_data.json')
         
         self.dataFormat = self.version_json["dataformat"][self.packDetails["version"]]
         self.resourceFormat = self.version_json["resourceformat"][self.packDetails["version"]]
@@ -189,16 +271,12 @@ class ProjectManager():
         self.equipment = {}
 
         self.exists = {}
+        self.dependencies.clear()
+        self.itemNames.rebuild(self.data["items"], {})
+        self.biomeList.rebuild(self.data.get("biome_tags", BIOME_TAGS), self.data["biomes"])
+        self.history.clear()
 
-        try:
-            self.blocks_tree
-        except:
-            self.blocks_tree = QTreeWidgetItem(self.ui.elementViewer, ["Blocks"])
-            self.items_tree = QTreeWidgetItem(self.ui.elementViewer, ["Items"])
-            self.recipes_tree = QTreeWidgetItem(self.ui.elementViewer, ["Recipes"])
-            self.paintings_tree = QTreeWidgetItem(self.ui.elementViewer, ["Paintings"])
-            self.structures_tree = QTreeWidgetItem(self.ui.elementViewer, ["Structures"])
-            self.equipment_tree = QTreeWidgetItem(self.ui.elementViewer, ["Equipment"])
+        self.elementTree.rebuild({})
 
         self.blockTexture = {}
         self.itemTexture = None
@@ -214,6 +292,108 @@ class ProjectManager():
 #    Copyright 2025 by JoelDaDev    #
 #####################################\n"""
 
+    #######################
+    # ELEMENTS            #
+    #######################
+
+    def elementDicts(self):
+        return {category: getattr(self, category) for category in ELEMENT_CATEGORIES}
+
+    def setElement(self, category, element):
+        isNew = element.name not in getattr(self, category)
+        self.applyChanges([(category, element.name, element)])
+        return isNew
+
+    def setElements(self, category, elements):
+        """Adds or replaces many elements as one journal write and one undo step. Returns the names that are new."""
+        target = getattr(self, category)
+        added = [element.name for element in elements if element.name not in target]
+        self.applyChanges([(category, element.name, element) for element in elements])
+        return added
+
+    def deleteElement(self, category, name):
+        if name not in getattr(self, category):
+            return False
+        self.applyChanges([(category, name, None)])
+        return True
+
+    def applyChanges(self, changes, record=True):
+        """
+        Stores or removes elements, keeping the dependency index, journal and undo history in sync.
+
+        :param changes: List of (category, name, element or None to delete).
+        :param record: Whether the changes become an undo step.
+        """
+        entries = []
+        step = []
+        touched = {}
+        for category, name, element in changes:
+            elements = getattr(self, category)
+            previous = elements.get(name)
+            touched[(category, name)] = None
+
+            if element is None:
+                if previous is None:
+                    continue
+                del elements[name]
+                self.dependencies.remove(category, name)
+                entries.append(('delete', category, name, None))
+            else:
+                elements[name] = element
+                self.dependencies.update(category, element)
+                entries.append(('add' if previous is None else 'edit', category, name, element.toDict()))
+
+            if record:
+                step.append(UndoHistory.diff(category, name, previous and previous.toDict(), element and element.toDict()))
+
+        if not entries:
+            return
+        # The views' models take the final state in one go, so bulk changes don't update them row by row
+        final = [(category, name, getattr(self, category).get(name)) for category, name in touched]
+        self.itemNames.updateMany(final)
+        self.elementTree.updateMany(final)
+        if self.journal:
+            self.journal.recordMany(entries)
+        if step:
+            self.history.push(step)
+        self.unsavedChanges = True
+
+    def undo(self):
+        """Reverts the last change. Returns the (category, name) pairs that were touched."""
+        return self.restore(self.history.undo(self.currentProperties))
+
+    def redo(self):
+        return self.restore(self.history.redo(self.currentProperties))
+
+    def currentProperties(self, category, name):
+        element = getattr(self, category).get(name)
+        return element.toDict() if element is not None else None
+
+    def restore(self, states):
+        changes = [(category, name, decodeElement(category, data) if data is not None else None) for category, name, data in states]
+        self.applyChanges(changes, record=False)
+        return [(category, name) for category, name, _ in changes]
+
+    def findUsages(self, category, name):
+        return self.dependencies.usages(category, name)
+
+    def regenerationSet(self, changes):
+        """Export files that need rewriting after the given (category, name) changes."""
+        return self.dependencies.outputFiles(changes, self.packDetails["name"], self.packDetails["namespace"])
+
+    #######################
+    # JOURNAL             #
+    #######################
+
+    def openJournal(self, projectDirectory):
+        if self.journal:
+            self.journal.close()
+        self.journal = EditJournal(projectDirectory)
+
+    def discardJournal(self):
+        if self.journal:
+            self.journal.clear()
+
     #######################
     # SAVE / LOAD         #
     #######################
@@ -246,18 +426,9 @@ class ProjectManager():
         }
             json.dump(data, file, indent=4)
             
-        with open(projectDirectory / 'blocks.json', 'w') as file:
-            json.dump(self.blocks, file, indent=4)
-        with open(projectDirectory / 'items.json', 'w') as file:
-            json.dump(self.items, file, indent=4)
-        with open(projectDirectory / 'recipes.json', 'w') as file:
-            json.dump(self.recipes, file, indent=4)
-        with open(projectDirectory / 'paintings.json', 'w') as file:
-            json.dump(self.paintings, file, indent=4)
-        with open(projectDirectory / 'structures.json', 'w') as file:
-            json.dump(self.structures, file, indent=4)
-        with open(projectDirectory / 'equipment.json', 'w') as file:
-            json.dump(self.equipment, file, indent=4)
+        for category, elements in self.elementDicts().items():
+            with open(projectDirectory / f'{category}.json', 'w') as file:
+                json.dump(encodeElements(elements), file, indent=4)
         
         os.makedirs(projectDirectory / 'assets', exist_ok=True)
         os.makedirs(projectDirectory / 'assets' / 'blocks', exist_ok=True)
@@ -281,6 +452,10 @@ class ProjectManager():
             manifest["workspaces"].append(namespace)
             with open(manifestPath, 'w') as f:
                 json.dump(manifest, f, indent=4)
+
+        # Everything journaled so far is now in the main files.
+        self.openJournal(projectDirectory)
+        self.journal.clear()
         
         self.unsavedChanges = False
         
@@ -322,47 +497,50 @@ class ProjectManager():
         
         with open(projectDirectory / 'project.dat', 'r') as file:
             data = json.load(file)
-            self.packDetails = data["packDetails"]
+
+        # Everything is decoded before any project state is touched, so a broken project leaves the open one as it was
+        journal = EditJournal(projectDirectory)
+        try:
+            elements = {}
+            for category in ELEMENT_CATEGORIES:
+                path = projectDirectory / f'{category}.json'
+                if not os.path.exists(path):
+                    elements[category] = {}     # Category added after the project was last saved
+                    continue
+                with open(path, 'r') as file:
+                    elements[category] = decodeElements(category, json.load(file))
+
+            # Re-apply edits made after the last save (e.g. the app crashed).
+            recovered = journal.replay(elements, decodeElement)
+        except (ElementSchemaError, json.JSONDecodeError, OSError) as e:
+            alert(f"This project's element files are invalid and could not be loaded!\n\n{e}")
+            return
+
         if data["app_version"] != APP_VERSION:
             alert("Warning: This project was created with a different version of the app, and may cause crashes or corruption!")
-        
+
+        self.packDetails = data["packDetails"]
         self.pullSupportedVersions(remote=False)
         self.pullData(remote=False)
         self.setupProjectData()
 
-        with open(projectDirectory / 'blocks.json', 'r') as file:
-            self.blocks = json.load(file)
-        with open(projectDirectory / 'items.json', 'r') as file:
-            self.items = json.load(file)
-        with open(projectDirectory / 'recipes.json', 'r') as file:
-            self.recipes = json.load(file)
-        with open(projectDirectory / 'paintings.json', 'r') as file:
-            self.paintings = json.load(file)
-        with open(projectDirectory / 'structures.json', 'r') as file:
-            self.structures = json.load(file)
-        with open(projectDirectory / 'equipment.json', 'r') as file:
-            self.equipment = json.load(file)
+        for category in ELEMENT_CATEGORIES:
+            setattr(self, category, elements[category])
+        if self.journal:
+            self.journal.close()
+        self.journal = journal
+
+        self.dependencies.rebuild(self.elementDicts())
+        self.itemNames.rebuild(self.data["items"], self.elementDicts())
+
+        if recovered:
+            self.unsavedChanges = True
+            self.ui.statusbar.showMessage(f"Recovered {recovered} unsaved edit(s) from the journal.", 5000)
         
         try:
             self.projectList.close()
         except:
             pass
        
-        for item in self.blocks:
-            QTreeWidgetItem(self.blocks_tree, [self.blocks[item]["name"]])
-        
-        for item in self.items:
-            QTreeWidgetItem(self.items_tree, [self.items[item]["name"]])
-        
-        for item in self.recipes:
-            QTreeWidgetItem(self.recipes_tree, [self.recipes[item]["name"]])
-        
-        for item in self.paintings:
-            QTreeWidgetItem(self.paintings_tree, [self.paintings[item]["name"]])
-        
-        for item in self.structures:
-            QTreeWidgetItem(self.structures_tree, [self.structures[item]["name"]])
-        
-        for item in self.equipment:
-            QTreeWidgetItem(self.equipment_tree, [self.equipment[item]["name"]])
+        self.elementTree.rebuild(self.elementDicts())
     
\ No newline at end of file
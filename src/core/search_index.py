@@ -0,0 +1,82 @@
+import heapq
+from collections import Counter
+
+SEPARATORS = frozenset('_.:/')
+FUZZY_THRESHOLD = 0.5       # Share of the query's trigrams a name needs to count as a typo'd match
+DEFAULT_LIMIT = 20
+
+
+def normalise(text):
+    return text.strip().lower().replace(' ', '_')
+
+
+def trigrams(text):
+    # '^' marks the start of the name, so a query's first letters weigh in too
+    padded = f'^{text}'
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class SearchIndex:
+    """
+    In-memory trigram index over one registry (block ids, sound events, ...).
+
+    `search()` ranks exact matches first, then prefixes, matches at the start
+    of a word ("plank" -> oak_planks), other substrings and finally names that
+    share most of the query's trigrams, so small typos still find something.
+    """
+
+    def __init__(self, names):
+        self.names = tuple(dict.fromkeys(names))
+        self.keys = tuple(name.lower() for name in self.names)
+        self.members = frozenset(self.names)
+
+        postings = {}
+        for id_, key in enumerate(self.keys):
+            for gram in trigrams(key):
+                postings.setdefault(gram, []).append(id_)
+        self.postings = {gram: tuple(ids) for gram, ids in postings.items()}
+
+    def __contains__(self, name):
+        return name in self.members
+
+    def __len__(self):
+        return len(self.names)
+
+    def rank(self, id_, query, shared, total):
+        key = self.keys[id_]
+        if key == query:
+            tier = 0
+        elif key.startswith(query):
+            tier = 1
+        else:
+            position = key.find(query)
+            if position > 0:
+                tier = 2 if key[position - 1] in SEPARATORS else 3
+            else:
+                tier = 4
+        return (tier, -shared / total if tier == 4 else 0, len(key), key)
+
+    def search(self, text, limit=DEFAULT_LIMIT):
+        """Returns up to `limit` names matching `text`, best first."""
+        query = normalise(text)
+        if not query:
+            return []
+
+        grams = trigrams(query)
+        if len(query) < 3:
+            # Too short for trigrams to narrow anything down; registries are small enough to scan
+            matches = [(id_, 0) for id_, key in enumerate(self.keys) if query in key]
+        else:
+            shared = Counter()
+            for gram in grams:
+                shared.update(self.postings.get(gram, ()))
+            minimum = max(1, int(len(grams) * FUZZY_THRESHOLD))
+            matches = [(id_, count) for id_, count in shared.items() if count >= minimum]
+
+        best = heapq.nsmallest(limit, matches, key=lambda match: self.rank(match[0], query, match[1], len(grams)))
+        return [self.names[id_] for id_, _ in best]
+
+    def closest(self, text):
+        """The best match for `text`, or None. Used for "did you mean" hints."""
+        results = self.search(text, 1)
+        return results[0] if results else None
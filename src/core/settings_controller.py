@@ -1,6 +1,8 @@
 from PySide6.QtGui import QFont, Qt
+from PySide6.QtWidgets import QLineEdit
 from utils.enums import ElementPage
 from utils.alert import alert
+from core.http_client import setMirror
 from pathlib import Path
 
 class SettingsController:
@@ -10,7 +12,14 @@ class SettingsController:
         self.settings = settings
         self.autoSaveTimer = autoSaveTimer
         self.mainDirectory = mainDirectory
+        self.addMirrorSetting()
         self.connectEvents()
+
+    def addMirrorSetting(self):
+        self.settingsMirror = QLineEdit(self.ui.scrollAreaWidgetContents)
+        self.settingsMirror.setObjectName("settingsMirror")
+        self.settingsMirror.setPlaceholderText("Folder or URL of an offline mirror (blank for the default servers)")
+        self.ui.formLayout_8.addRow("Offline Mirror", self.settingsMirror)
     
     def connectEvents(self):
         self.ui.settingsApplyButton.clicked.connect(self.saveSettings)
@@ -43,6 +52,7 @@ class SettingsController:
         self.settings.set('network', 'check_updates', self.ui.settingsCheckUpdatesCheckbox.isChecked())
         self.settings.set('network', 'custom_update_url', self.ui.settingsUpdateURL.text())
         self.settings.set('network', 'get_betas', self.ui.settingsBetaUpdatesCheckbox.isChecked())
+        self.settings.set('network', 'mirror', self.settingsMirror.text())
 
         self.settings.save_settings()
         self.refreshSettings()
@@ -81,9 +91,11 @@ class SettingsController:
         self.ui.settingsCheckUpdatesCheckbox.setChecked(self.settings.get('network', 'check_updates'))
         self.ui.settingsUpdateURL.setText(self.settings.get('network', 'custom_update_url'))
         self.ui.settingsBetaUpdatesCheckbox.setChecked(self.settings.get('network', 'get_betas'))
+        self.settingsMirror.setText(self.settings.get('network', 'mirror'))
 
         self.setAutoSaveInterval()
         self.workspacePath = self.settings.get('general', 'workspace_path')
+        setMirror(self.settings.get('network', 'mirror'))
         self.app.setFont(QFont("Segoe UI", self.settings.get('appearance', 'font_size')))
         theme = self.settings.get('appearance', 'theme')
         self.app.setStyleSheet("QPushButton:flat{background-color: transparent; border: 2px solid black;}")
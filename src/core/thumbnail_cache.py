@@ -0,0 +1,113 @@
+import hashlib
+import os
+
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QImage, QPixmap, QPixmapCache
+
+from core.background import runInBackground
+
+THUMBNAIL_SIZE = 50
+
+
+def loadThumbnail(path, directory):
+    """
+    Returns (content hash, scaled QImage or None if the file isn't an image).
+    Runs on a worker thread, so only QImage is used here.
+    """
+    with open(path, 'rb') as f:
+        data = f.read()
+    digest = hashlib.sha1(data).hexdigest()
+
+    cached = os.path.join(directory, f'{digest}.png') if directory else None
+    if cached and os.path.exists(cached):
+        image = QImage(cached)
+        if not image.isNull():
+            return digest, image
+
+    image = QImage.fromData(data)
+    if image.isNull():
+        return digest, None
+    image = image.scaled(THUMBNAIL_SIZE, THUMBNAIL_SIZE, Qt.AspectRatioMode.KeepAspectRatio)
+
+    if cached:
+        try:
+            os.makedirs(directory, exist_ok=True)
+            if image.save(f'{cached}.tmp', 'PNG'):
+                os.replace(f'{cached}.tmp', cached)
+        except OSError:
+            pass    # The disk cache is an optimisation only
+    return digest, image
+
+
+class ThumbnailCache:
+    """
+    Texture previews for the editors' labels.
+
+    Thumbnails are keyed by the texture's content hash: in memory through
+    QPixmapCache (LRU, shared with Qt) and on disk as small PNGs in
+    `directory()`. Anything not already in memory is read and scaled on a
+    worker thread; the label is filled in when it's ready, unless it has been
+    given another texture or cleared in the meantime.
+    """
+
+    def __init__(self, directory):
+        """
+        :param directory: Callable returning the disk cache folder for the open project, or None.
+        """
+        self.directory = directory
+        self.digests = {}       # path -> ((mtime, size), content hash) of the last load
+        self.requests = {}      # label -> path it is waiting for
+        self.loading = set()
+
+    def show(self, label, path):
+        """Sets `label` to the thumbnail of the texture at `path`, clearing it if there's none."""
+        if not path:
+            self.clear(label)
+            return
+
+        try:
+            stat = os.stat(path)
+        except OSError:
+            self.clear(label)
+            return
+        stamp = (stat.st_mtime_ns, stat.st_size)
+
+        known = self.digests.get(path)
+        if known and known[0] == stamp:
+            pixmap = QPixmapCache.find(f'thumbnail:{known[1]}')
+            if pixmap is not None and not pixmap.isNull():
+                self.requests.pop(label, None)
+                label.setPixmap(pixmap)
+                return
+
+        label.clear()
+        self.requests[label] = path
+        if path in self.loading:
+            return
+        self.loading.add(path)
+        directory = self.directory()
+        runInBackground(
+            lambda: loadThumbnail(path, directory),
+            lambda result: self.loaded(path, stamp, result),
+            lambda error: self.loaded(path, stamp, None)
+        )
+
+    def loaded(self, path, stamp, result):
+        self.loading.discard(path)
+        pixmap = None
+        if result is not None:
+            digest, image = result
+            if image is not None:
+                pixmap = QPixmap.fromImage(image)
+                QPixmapCache.insert(f'thumbnail:{digest}', pixmap)
+                self.digests[path] = (stamp, digest)
+
+        for label in [label for label, wanted in self.requests.items() if wanted == path]:
+            del self.requests[label]
+            if pixmap is not None:
+                label.setPixmap(pixmap)
+
+    def clear(self, *labels):
+        for label in labels:
+            self.requests.pop(label, None)
+            label.clear()
@@ -0,0 +1,108 @@
+import json
+from collections import deque
+
+
+class UndoHistory:
+    """
+    Undo/redo stacks of element changes.
+
+    A step is a list of changes `(category, name, kind, payload)`:
+    'add' and 'delete' keep the element's properties, 'edit' keeps only the
+    fields that changed as `{field: (old, new)}`. The stacks are capped at
+    `budget` bytes (estimated from the JSON size of each step); the oldest
+    steps are dropped first.
+    """
+
+    def __init__(self, budget=16 * 1024 * 1024):
+        self.budget = budget
+        self.undoStack = deque()    # (step, size)
+        self.redoStack = deque()
+        self.size = 0
+
+    @staticmethod
+    def diff(category, name, before, after):
+        """Builds a change from two property dicts (None = element absent), or None if nothing changed."""
+        if before is None and after is None:
+            return None
+        if before is None:
+            return (category, name, 'add', after)
+        if after is None:
+            return (category, name, 'delete', before)
+
+        changed = {field: (before.get(field), value) for field, value in after.items() if before.get(field) != value}
+        return (category, name, 'edit', changed) if changed else None
+
+    @staticmethod
+    def weigh(step):
+        return sum(len(category) + len(name) + len(json.dumps(payload, separators=(",", ":"))) for category, name, _, payload in step)
+
+    def canUndo(self):
+        return bool(self.undoStack)
+
+    def canRedo(self):
+        return bool(self.redoStack)
+
+    def clear(self):
+        self.undoStack.clear()
+        self.redoStack.clear()
+        self.size = 0
+
+    def push(self, step):
+        step = [change for change in step if change]
+        if not step:
+            return
+
+        for _, size in self.redoStack:
+            self.size -= size
+        self.redoStack.clear()
+
+        size = self.weigh(step)
+        self.undoStack.append((step, size))
+        self.size += size
+        self.trim()
+
+    def trim(self):
+        # Always keep the most recent step, even if it alone is over budget.
+        while self.size > self.budget and len(self.undoStack) + len(self.redoStack) > 1:
+            stack = self.undoStack if self.undoStack else self.redoStack
+            _, size = stack.popleft()
+            self.size -= size
+
+    def undo(self, current):
+        """
+        Pops the latest step and returns what to restore.
+
+        :param current: Callable (category, name) -> property dict or None.
+        :return: List of (category, name, properties or None for "remove").
+        """
+        if not self.undoStack:
+            return []
+        entry = self.undoStack.pop()
+        self.redoStack.append(entry)
+
+        restore = []
+        for category, name, kind, payload in reversed(entry[0]):
+            if kind == 'add':
+                restore.append((category, name, None))
+            elif kind == 'delete':
+                restore.append((category, name, payload))
+            else:
+                restore.append((category, name, dict(current(category, name), **{field: old for field, (old, _) in payload.items()})))
+        return restore
+
+    def redo(self, current):
+        """Re-applies the most recently undone step. Same return value as `undo()`."""
+        if not self.redoStack:
+            return []
+        entry = self.redoStack.pop()
+        self.undoStack.append(entry)
+
+        restore = []
+        for category, name, kind, payload in entry[0]:
+            if kind == 'add':
+                restore.append((category, name, payload))
+            elif kind == 'delete':
+                restore.append((category, name, None))
+            else:
+                restore.append((category, name, dict(current(category, name), **{field: new for field, (_, new) in payload.items()})))
+        return restore
@@ -0,0 +1,105 @@
+import hashlib
+import json
+import marshal
+import mmap
+import os
+import sys
+
+from core.search_index import SearchIndex
+
+CACHE_VERSION = 1
+
+# Loaded version data shared by every project opened in this process, keyed by JSON hash.
+_loaded = {}
+
+
+class StringTable(tuple):
+    """Ordered, immutable list of names with O(1) membership checks."""
+
+    def __new__(cls, values):
+        table = super().__new__(cls, map(sys.intern, values))
+        table.index = frozenset(table)
+        return table
+
+    def __contains__(self, value):
+        return value in self.index
+
+
+class VersionData(dict):
+    """
+    Version data (`lib/<version>_data.json`) as a read-only mapping of
+    category -> StringTable. Existing `data["items"]` style lookups keep
+    working; `in` checks no longer scan the list.
+    """
+
+    def __init__(self, tables):
+        super().__init__((key, StringTable(value) if isinstance(value, (list, tuple)) else value) for key, value in tables.items())
+        self.indexes = {}
+
+    def search(self, category):
+        """The SearchIndex over one registry, built the first time it is asked for."""
+        index = self.indexes.get(category)
+        if index is None:
+            index = self.indexes[category] = SearchIndex(self.get(category, ()))
+        return index
+
+
+def cachePath(jsonPath, digest):
+    stem = os.path.splitext(os.path.basename(jsonPath))[0]
+    # marshal's format is tied to the interpreter, so the cache is too.
+    return os.path.join(os.path.dirname(jsonPath), 'cache', f'{stem}.{digest[:16]}.{sys.implementation.cache_tag}.bin')
+
+
+def readCache(path, digest):
+    try:
+        with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            version, cachedDigest, tables = marshal.loads(mapped)
+    except (OSError, ValueError, EOFError, TypeError):
+        return None
+    if version != CACHE_VERSION or cachedDigest != digest:
+        return None
+    return tables
+
+
+def writeCache(path, digest, tables):
+    directory = os.path.dirname(path)
+    stem = os.path.basename(path).split(f'.{digest[:16]}.')[0]
+    try:
+        os.makedirs(directory, exist_ok=True)
+        # Drop caches of older revisions of the same file
+        for name in os.listdir(directory):
+            if name.startswith(f'{stem}.') and name.endswith('.bin'):
+                os.remove(os.path.join(directory, name))
+
+        tmpPath = f'{path}.tmp'
+        with open(tmpPath, 'wb') as f:
+            marshal.dump((CACHE_VERSION, digest, tables), f)
+        os.replace(tmpPath, path)
+    except OSError:
+        pass    # The cache is an optimisation only
+
+
+def loadVersionData(jsonPath):
+    """
+    Returns the VersionData for a `<version>_data.json` file.
+
+    The JSON is only parsed the first time a given revision is seen; after that
+    a binary cache next to it (lib/cache/) is used, and within one process the
+    same object is returned for every project load.
+    """
+    with open(jsonPath, 'rb') as f:
+        raw = f.read()
+    digest = hashlib.sha1(raw).hexdigest()
+
+    if digest in _loaded:
+        return _loaded[digest]
+
+    path = cachePath(jsonPath, digest)
+    tables = readCache(path, digest)
+    if tables is None:
+        tables = {key: tuple(map(sys.intern, value)) if isinstance(value, list) else value for key, value in json.loads(raw).items()}
+        writeCache(path, digest, tables)
+
+    data = VersionData(tables)
+    _loaded[digest] = data
+    return data
@@ -0,0 +1,119 @@
+import json
+from collections import Counter
+
+FLAGS = ("bold", "italic", "underlined", "strikethrough", "obfuscated")
+OBFUSCATED = FLAGS.index("obfuscated")
+PLAIN = (False,) * len(FLAGS) + (None,)     # No flags, default color
+DEFAULT_COLOR = "white"
+CANDIDATE_STYLES = 3    # Most common run styles also tried as the root style
+
+
+def dumps(value):
+    return json.dumps(value, separators=(",", ":"))
+
+
+def styleOf(component):
+    return tuple(bool(component.get(flag, False)) for flag in FLAGS) + (component.get("color"),)
+
+
+def mergeRuns(components):
+    """
+    Joins adjacent components that render the same, as [text, style] runs.
+
+    A component that is only line breaks has nothing a style could change
+    (unless it is obfuscated), so it joins whichever run is next to it.
+    """
+    runs = []
+    pending = ""    # Line breaks waiting for a run to join
+
+    def add(text, style):
+        if runs and runs[-1][1] == style:
+            runs[-1][0] += text
+        else:
+            runs.append([text, style])
+
+    for component in components:
+        text = component["text"]
+        style = styleOf(component)
+        if not text.strip("\n") and not style[OBFUSCATED]:
+            if runs and not runs[-1][1][OBFUSCATED]:
+                runs[-1][0] += text
+            else:
+                pending += text
+            continue
+        if pending:
+            if style[OBFUSCATED]:
+                add(pending, PLAIN)
+            else:
+                text = pending + text
+            pending = ""
+        add(text, style)
+
+    if pending:
+        add(pending, PLAIN)
+    return runs
+
+
+def child(text, style, root):
+    """A run written as an extra of `root`, giving only the style it doesn't inherit."""
+    component = {"text": text}
+    for index, flag in enumerate(FLAGS):
+        if style[index] != root[index]:
+            component[flag] = style[index]
+    if style[-1] != root[-1]:
+        component["color"] = style[-1] or DEFAULT_COLOR
+    # Unstyled text can be a plain string
+    return text if len(component) == 1 else component
+
+
+def build(runs, root):
+    """The whole text as one component whose style is `root`, inherited by its extras."""
+    # The first run becomes the root's own text when it needs nothing of its own
+    rootText = ""
+    if runs and runs[0][1] == root:
+        rootText = runs[0][0]
+        runs = runs[1:]
+    extras = [child(text, style, root) for text, style in runs]
+
+    if root == PLAIN:
+        if not extras:
+            return rootText
+        return [rootText] + extras
+
+    component = {"text": rootText}
+    for index, flag in enumerate(FLAGS):
+        if root[index]:
+            component[flag] = True
+    if root[-1] is not None:
+        component["color"] = root[-1]
+    if extras:
+        component["extra"] = extras
+    return component
+
+
+def commonStyle(runs):
+    """Each property's most common value across the runs, weighted by how many runs have it."""
+    return tuple(Counter(style[index] for _, style in runs).most_common(1)[0][0] for index in range(len(PLAIN)))
+
+
+def optimiseComponents(components):
+    """
+    Returns the smallest JSON text component found that renders the same as
+    the list of flat `components` (each {"text": ..., style flags, "color"}).
+
+    Adjacent runs with the same style are merged, styles shared by most runs
+    are set once on a root component and inherited by its extras, and only
+    the properties a run doesn't inherit are written out.
+
+    A run turning off a property its root sets writes it back explicitly
+    ("color": "white", "italic": false), which matches the flat form only
+    where unstyled text is white and not italic: chat, titles and the
+    actionbar, not lore or item names.
+    """
+    runs = mergeRuns(components)
+    if not runs:
+        return dumps("")
+
+    counts = Counter(style for _, style in runs)
+    candidates = dict.fromkeys([PLAIN, commonStyle(runs)] + [style for style, _ in counts.most_common(CANDIDATE_STYLES)])
+    return min((dumps(build(runs, root)) for root in candidates), key=len)
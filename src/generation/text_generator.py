@@ -1,6 +1,16 @@
 import json
+from PySide6.QtCore import QTimer
 from PySide6.QtGui import QTextCharFormat, QTextCursor, QFont, QColor
-from PySide6.QtWidgets import QDialog, QGridLayout, QPushButton, QColorDialog, QApplication
+from PySide6.QtWidgets import QDialog, QGridLayout, QPushButton, QColorDialog, QApplication, QCheckBox, QLabel
+
+from generation.text_components import optimiseComponents
+
+UPDATE_DELAY = 150      # ms of no typing before the output is rebuilt
+DEFAULT_COLORS = {"#000000", "#ffffff"}
+NEWLINE_COMPONENT = json.dumps({"text": "\n"}, separators=(",", ":"))
+# Outputs shown where unstyled text is white and not italic, so compacted components render the same there.
+# Raw JSON may be pasted into lore or item names, which default to italic purple, and stays flat.
+COMPACT_TYPES = ("Tellraw Command", "Title", "Subtitle", "Actionbar")
 
 
 class TextGenerator:
@@ -9,6 +19,28 @@ class TextGenerator:
         self.OBFUSCATE_PROPERTY = obfuscate_property
         self.MINECRAFT_COLORS = minecraft_colors
 
+        # Each block's fragments are converted once and reused until the block changes.
+        # Blocks are tagged with an id (their user state) keying into blockCache.
+        self.blockCache = {}    # id -> (block revision, runs, component JSON strings)
+        self.nextBlockId = 0
+        self.ui.textGeneratorTextBox.document().contentsChange.connect(self.tg_InvalidateBlocks)
+
+        self.updateTimer = QTimer()
+        self.updateTimer.setSingleShot(True)
+        self.updateTimer.setInterval(UPDATE_DELAY)
+        self.updateTimer.timeout.connect(self.tg_UpdateTextComponentOutput)
+
+        self.compactBox = QCheckBox("Compact")
+        self.compactBox.setChecked(True)
+        self.compactBox.setToolTip("Merge same-styled text and share styles between components, for shorter commands.\n"
+                                   "Used for tellraw, title, subtitle and actionbar output, where text defaults to white and not italic.\n"
+                                   "Raw JSON is never compacted, as lore and item names style unstyled text differently.")
+        self.compactBox.toggled.connect(self.tg_UpdateTextComponentOutput)
+        self.sizeLabel = QLabel()
+        self.ui.horizontalLayout_3.addWidget(self.compactBox)
+        self.ui.horizontalLayout_3.addWidget(self.sizeLabel)
+        self.ui.textGeneratorType.currentTextChanged.connect(self.tg_UpdateTextComponentOutput)
+
     def tg_MergeFormat(self, fmt: QTextCharFormat):
         cursor = self.ui.textGeneratorTextBox.textCursor()
         if not cursor.hasSelection():
@@ -133,61 +165,127 @@ class TextGenerator:
         if color.isValid():
             self.tg_ApplyColor(color.name(), dialog)
 
-    def tg_UpdateTextComponentOutput(self):
+    def tg_ScheduleUpdate(self):
+        # Typing restarts the timer, so the output is rebuilt once per pause rather than per keystroke
+        self.updateTimer.start()
+
+    def tg_InvalidateBlocks(self, position, removed, added):
+        # Format changes don't bump a block's revision, so every block an edit touches is dropped explicitly
         doc = self.ui.textGeneratorTextBox.document()
-        output = [""]
+        block = doc.findBlock(position)
+        last = doc.findBlock(position + added)
+        while block.isValid():
+            self.blockCache.pop(block.userState(), None)
+            if block == last:
+                break
+            block = block.next()
 
-        block = doc.begin()
-        default_colors = {"#000000", "#ffffff"}
+    def tg_BlockRuns(self, block):
+        """(text, (color, bold, italic, underline, strikethrough, obfuscated)) for each non-empty fragment of a block."""
+        runs = []
+        it = block.begin()
+        while not it.atEnd():
+            frag = it.fragment()
+            if frag.isValid():
+                fmt = frag.charFormat()
 
-        while block.isValid():
-            it = block.begin()
-            while not it.atEnd():
-                frag = it.fragment()
-                if frag.isValid():
-                    fmt = frag.charFormat()
-                    
-                    text = frag.text()
-                    if fmt.property(self.OBFUSCATE_PROPERTY):
-                        original_text = fmt.property(self.OBFUSCATE_PROPERTY + 1)
-                        if original_text:
-                            text = original_text
-
-                    if text == "":
-                        it += 1
-                        continue
-
-                    component = {"text": text}
-
-                    if fmt.fontWeight() > QFont.Normal:
-                        component["bold"] = True
-                        
-                    if fmt.fontItalic():
-                        component["italic"] = True
-                        
-                    if fmt.fontUnderline():
-                        component["underlined"] = True
-                        
-                    if fmt.fontStrikeOut():
-                        component["strikethrough"] = True
-                        
-                    if bool(fmt.property(self.OBFUSCATE_PROPERTY)):
-                        component["obfuscated"] = True
+                text = frag.text()
+                obfuscated = bool(fmt.property(self.OBFUSCATE_PROPERTY))
+                if obfuscated:
+                    original_text = fmt.property(self.OBFUSCATE_PROPERTY + 1)
+                    if original_text:
+                        text = original_text
 
+                if text != "":
                     color = fmt.foreground().color()
-                    if color.isValid():
-                        hex_color = color.name()
-                        if hex_color not in default_colors:
-                            component["color"] = hex_color
+                    runs.append((text, (
+                        color.name() if color.isValid() else None,
+                        fmt.fontWeight() > QFont.Normal,
+                        fmt.fontItalic(),
+                        fmt.fontUnderline(),
+                        fmt.fontStrikeOut(),
+                        obfuscated
+                    )))
+            it += 1
+        return runs
 
-                    output.append(component)
-                it += 1
+    def tg_RunComponent(self, text, style):
+        color, bold, italic, underline, strikethrough, obfuscated = style
+        component = {"text": text}
+        if bold:
+            component["bold"] = True
+        if italic:
+            component["italic"] = True
+        if underline:
+            component["underlined"] = True
+        if strikethrough:
+            component["strikethrough"] = True
+        if obfuscated:
+            component["obfuscated"] = True
+        if color is not None and color not in DEFAULT_COLORS:
+            component["color"] = color
+        return component
 
-            if block.next().isValid():
-                output.append({"text": "\n"})
+    def tg_Blocks(self):
+        """(runs, component JSON strings) of every block, converting only those changed since the last call."""
+        doc = self.ui.textGeneratorTextBox.document()
+        blocks = []
+        seen = set()
+
+        block = doc.begin()
+        while block.isValid():
+            key = block.userState()
+            cached = self.blockCache.get(key)
+            # A split block's new half can inherit its id, so an id is only trusted once per pass
+            if cached is None or cached[0] != block.revision() or key in seen:
+                runs = self.tg_BlockRuns(block)
+                components = [json.dumps(self.tg_RunComponent(text, style), separators=(",", ":")) for text, style in runs]
+                key = self.nextBlockId
+                self.nextBlockId += 1
+                block.setUserState(key)
+                cached = (block.revision(), runs, components)
+                self.blockCache[key] = cached
+            seen.add(key)
+            blocks.append(cached)
             block = block.next()
 
-        json_str = json.dumps(output, separators=(",", ":"))
+        # Deleted blocks
+        for key in self.blockCache.keys() - seen:
+            del self.blockCache[key]
+        return blocks
+
+    def tg_Components(self, blocks):
+        """The flat component list the uncompacted output is made of, without its leading ""."""
+        components = []
+        for index, (_, runs, _) in enumerate(blocks):
+            if index:
+                components.append({"text": "\n"})
+            components.extend(self.tg_RunComponent(text, style) for text, style in runs)
+        return components
+
+    def tg_UpdateTextComponentOutput(self):
+        self.updateTimer.stop()
+        blocks = self.tg_Blocks()
+
+        # Same bytes as json.dumps() of [""] + every block's components with newline components between blocks
+        pieces = ['""']
+        for index, (_, _, components) in enumerate(blocks):
+            if index:
+                pieces.append(NEWLINE_COMPONENT)
+            pieces.extend(components)
+        json_str = "[" + ",".join(pieces) + "]"
+
+        outputType = self.ui.textGeneratorType.currentText()
+        self.compactBox.setEnabled(outputType in COMPACT_TYPES)
+        if outputType == "MOTD":
+            self.sizeLabel.clear()
+        elif self.compactBox.isChecked() and outputType in COMPACT_TYPES:
+            full_size = len(json_str.encode())
+            json_str = optimiseComponents(self.tg_Components(blocks))
+            size = len(json_str.encode())
+            self.sizeLabel.setText(f"{size} bytes (was {full_size}, -{100 - size * 100 // max(full_size, 1)}%)")
+        else:
+            self.sizeLabel.setText(f"{len(json_str.encode())} bytes")
 
         if self.ui.textGeneratorType.currentText() == "Raw JSON":
             output_string = json_str
@@ -200,15 +298,16 @@ class TextGenerator:
         elif self.ui.textGeneratorType.currentText() == "Actionbar":
             output_string = "/title @a actionbar " + json_str
         elif self.ui.textGeneratorType.currentText() == "MOTD":
-            output_string = self.tg_ConvertToMOTD()
+            output_string = self.tg_ConvertToMOTD(blocks)
         else:
             output_string = json_str
 
         self.ui.textGeneratorOutput.setText(output_string)
 
-    def tg_ConvertToMOTD(self):
-        doc = self.ui.textGeneratorTextBox.document()
-        motd_text = ""
+    def tg_ConvertToMOTD(self, blocks=None):
+        if blocks is None:
+            blocks = self.tg_Blocks()
+        motd_text = []
         
         color_codes = {
             "#000000": "&0",  # Black
@@ -229,7 +328,6 @@ class TextGenerator:
             "#ffffff": "&f",  # White
         }
         
-        block = doc.begin()
         current_color = None
         current_bold = False
         current_italic = False
@@ -237,68 +335,44 @@ class TextGenerator:
         current_strikethrough = False
         current_obfuscated = False
         
-        while block.isValid():
-            it = block.begin()
-            while not it.atEnd():
-                frag = it.fragment()
-                if frag.isValid():
-                    fmt = frag.charFormat()
-                    
-                    text = frag.text()
-                    if fmt.property(self.OBFUSCATE_PROPERTY):
-                        original_text = fmt.property(self.OBFUSCATE_PROPERTY + 1)
-                        if original_text:
-                            text = original_text
-                    
-                    if text == "":
-                        it += 1
-                        continue
-                    
-                    color = fmt.foreground().color()
-                    hex_color = color.name().lower() if color.isValid() else None
-                    bold = fmt.fontWeight() > QFont.Normal
-                    italic = fmt.fontItalic()
-                    underline = fmt.fontUnderline()
-                    strikethrough = fmt.fontStrikeOut()
-                    obfuscated = bool(fmt.property(self.OBFUSCATE_PROPERTY))
-                    
-                    if hex_color != current_color:
-                        if hex_color in color_codes:
-                            motd_text += color_codes[hex_color]
-                        current_color = hex_color
-                        current_bold = False
-                        current_italic = False
-                        current_underline = False
-                        current_strikethrough = False
-                        current_obfuscated = False
-                    
-                    if bold and not current_bold:
-                        motd_text += "&l"
-                        current_bold = True
-                    if italic and not current_italic:
-                        motd_text += "&o"
-                        current_italic = True
-                    if underline and not current_underline:
-                        motd_text += "&n"
-                        current_underline = True
-                    if strikethrough and not current_strikethrough:
-                        motd_text += "&m"
-                        current_strikethrough = True
-                    if obfuscated and not current_obfuscated:
-                        motd_text += "&k"
-                        current_obfuscated = True
-                    
-                    motd_text += text
-                    
-                it += 1
-            
-            if block.next().isValid():
-                motd_text += "\\n"
-            block = block.next()
+        for index, (_, runs, _) in enumerate(blocks):
+            if index:
+                motd_text.append("\\n")
+
+            for text, (hex_color, bold, italic, underline, strikethrough, obfuscated) in runs:
+                if hex_color != current_color:
+                    if hex_color in color_codes:
+                        motd_text.append(color_codes[hex_color])
+                    current_color = hex_color
+                    current_bold = False
+                    current_italic = False
+                    current_underline = False
+                    current_strikethrough = False
+                    current_obfuscated = False
+                
+                if bold and not current_bold:
+                    motd_text.append("&l")
+                    current_bold = True
+                if italic and not current_italic:
+                    motd_text.append("&o")
+                    current_italic = True
+                if underline and not current_underline:
+                    motd_text.append("&n")
+                    current_underline = True
+                if strikethrough and not current_strikethrough:
+                    motd_text.append("&m")
+                    current_strikethrough = True
+                if obfuscated and not current_obfuscated:
+                    motd_text.append("&k")
+                    current_obfuscated = True
+                
+                motd_text.append(text)
         
-        return motd_text
+        return "".join(motd_text)
     
     def tg_CopyOutput(self):
+        if self.updateTimer.isActive():
+            self.tg_UpdateTextComponentOutput()
         clipboard = QApplication.clipboard()
         text = self.ui.textGeneratorOutput.text()
         clipboard.setText(text)
\ No newline at end of file
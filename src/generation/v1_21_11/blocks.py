@@ -1,5 +1,5 @@
 import ast, os, shutil
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import Environment, PackageLoader
 
 class BlockGenerator:
     def __init__(self, header, namespaceDir, packNamespace, packAuthor, blocks, items, equipment):
@@ -12,7 +12,7 @@ class BlockGenerator:
         self.equipment = equipment
 
         self.env = Environment(
-            loader=FileSystemLoader(os.path.join(os.path.dirname(os.path.realpath(__file__)), 'block_templates')),
+            loader=PackageLoader(__package__, 'block_templates'),
             autoescape=True
         )
     
@@ -20,7 +20,7 @@ class BlockGenerator:
         temp = self.env.get_template(template)
         return temp.render(context)
 
-    def generate(self):
+    def generate(self, progress=None):
         os.makedirs(f'{self.namespaceDirectory}/function/blocks', exist_ok=True)
 
         # Create Placed Item Frame Advancement
@@ -52,6 +52,7 @@ class BlockGenerator:
 
         # block/* Functions
         for block in self.blocks:
+            if progress: progress(block)
             os.mkdir(f'{self.namespaceDirectory}/function/blocks/{block}')
 
             # block/place
@@ -132,7 +133,7 @@ class BlockResourcer:
         self.packNamespace = packNamespace
 
         self.env = Environment(
-            loader=FileSystemLoader(os.path.join(os.path.dirname(os.path.realpath(__file__)), 'block_templates')),
+            loader=PackageLoader(__package__, 'block_templates'),
             autoescape=True
         )
     
@@ -140,9 +141,10 @@ class BlockResourcer:
         temp = self.env.get_template(template)
         return temp.render(context)
 
-    def generate(self):
+    def generate(self, progress=None):
         # Block Model Definition
         for block in self.blocks:
+            if progress: progress(block)
             content = self.getTemplate('modelDef.json.j2', {
                 'packNamespace': self.packNamespace,
                 'block': block
@@ -157,12 +159,12 @@ class BlockResourcer:
                 f'{self.resPackDirectory}/assets/{self.packNamespace}/textures/item/'
             )
 
-            if ".json" not in self.blocks[block]["model"]:
-                for path in self.blocks[block]["textures"].values():
+            if ".json" not in self.blocks[block].model:
+                for path in self.blocks[block].textures.values():
                     if not os.path.exists(os.path.join(texturePath, os.path.splitext(os.path.basename(str(path)))[-2] + ".png",)):
                         shutil.copy(path, os.path.join(texturePath, os.path.splitext(os.path.basename(str(path)))[-2] + ".png",),)
             else:
-                path = self.blocks[block]["textures"]["5"]
+                path = self.blocks[block].textures["5"]
                 if not os.path.exists(os.path.join(texturePath, os.path.splitext(os.path.basename(str(path)))[-2] + ".png",)):
                     shutil.copy(path, os.path.join(texturePath, os.path.splitext(os.path.basename(str(path)))[-2] + ".png",),)
         
@@ -170,18 +172,18 @@ class BlockResourcer:
         for block in self.blocks:
             textureNames = []
 
-            for texture in self.blocks[block]["textures"]:
-                textureNames.append(os.path.splitext(os.path.basename(self.blocks[block]["textures"][texture]))[0])
+            for texture in self.blocks[block].textures:
+                textureNames.append(os.path.splitext(os.path.basename(self.blocks[block].textures[texture]))[0])
             
             content = self.getTemplate('model.json.j2', {
                 'textureNames': textureNames,
                 'packNamespace': self.packNamespace
             })
-            with open(f'{self.resPackDirectory}/assets/{self.packNamespace}/models/item/{self.blocks[block]["name"]}.json', 'w') as file:
-                if ".json" not in self.blocks[block]["model"]:
+            with open(f'{self.resPackDirectory}/assets/{self.packNamespace}/models/item/{self.blocks[block].name}.json', 'w') as file:
+                if ".json" not in self.blocks[block].model:
                     file.write(content)
                 else:
-                    with open(self.blocks[block]["model"], "r") as f:
+                    with open(self.blocks[block].model, "r") as f:
                         model = ast.literal_eval(f.read())
                     for texture in model["textures"]:
                         model["textures"][
@@ -1,5 +1,5 @@
 import ast, os, shutil, json
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import Environment, PackageLoader
 
 class EquipmentGenerator:
     def __init__(self, header, namespaceDirectory, equipment, namespace):
@@ -9,7 +9,7 @@ class EquipmentGenerator:
         self.packNamespace = namespace
 
         self.env = Environment(
-            loader=FileSystemLoader(os.path.join(os.path.dirname(os.path.realpath(__file__)), 'equipment_templates')),
+            loader=PackageLoader(__package__, 'equipment_templates'),
             autoescape=True
         )
 
@@ -17,7 +17,9 @@ class EquipmentGenerator:
         temp = self.env.get_template(template)
         return temp.render(context)
         
-    def generate(self):
+    def generate(self, progress=None):
+        for equip in self.equipment:
+            if progress: progress(equip)
 
         # Give Equipment Function
         content = self.getTemplate('giveEquipment.mcfunction.j2', {
@@ -37,7 +39,7 @@ class EquipmentResourcer:
         self.equipment = equipment
 
         self.env = Environment(
-            loader=FileSystemLoader(os.path.join(os.path.dirname(os.path.realpath(__file__)), 'equipment_templates')),
+            loader=PackageLoader(__package__, 'equipment_templates'),
             autoescape=True
         )
     
@@ -45,11 +47,12 @@ class EquipmentResourcer:
         temp = self.env.get_template(template)
         return temp.render(context)
     
-    def generate(self):
+    def generate(self, progress=None):
         # Create namespace/models/item/*.json
         for equip in self.equipment:
-            equipmentName = self.equipment[equip]["name"]
-            horse = self.equipment[equip]["includeHorse"]
+            if progress: progress(equip)
+            equipmentName = self.equipment[equip].name
+            horse = self.equipment[equip].includeHorse
 
             # Generate it for helmet, chestplate, leggings, and boots
             for item in ["helmet", "chestplate", "leggings", "boots"]:
@@ -76,8 +79,8 @@ class EquipmentResourcer:
         
         # Create namespace/items/*.json
         for equip in self.equipment:
-            horse = self.equipment[equip]["includeHorse"]
-            equipmentName = self.equipment[equip]["name"]
+            horse = self.equipment[equip].includeHorse
+            equipmentName = self.equipment[equip].name
 
             # Generate it for helmet, chestplate, leggings, and boots
             for item in ["helmet", "chestplate", "leggings", "boots"]:
@@ -104,7 +107,7 @@ class EquipmentResourcer:
         
         # Create namespace/equipment/NAME.json
         for equip in self.equipment:
-            horse = self.equipment[equip]["includeHorse"]
+            horse = self.equipment[equip].includeHorse
             equipmentName = equip
 
             modelPath = f'{self.resPackDirectory}/assets/{self.packNamespace}/equipment/'
@@ -124,24 +127,24 @@ class EquipmentResourcer:
         
         # Copy namespace/textures/item/*.png
         for equip in self.equipment:
-            horse = self.equipment[equip]["includeHorse"]
+            horse = self.equipment[equip].includeHorse
             currentPath = f'{self.resPackDirectory}/assets/{self.packNamespace}/textures/item/'
-            for texture in self.equipment[equip]["itemTextures"]:
-                name = self.equipment[equip]["name"] + "_" + texture
+            for texture in self.equipment[equip].itemTextures:
+                name = self.equipment[equip].name + "_" + texture
                 if texture == "horseArmor":
-                    name = self.equipment[equip]["name"] + "_horse_armor"
+                    name = self.equipment[equip].name + "_horse_armor"
                 shutil.copy(
-                    self.equipment[equip]["itemTextures"][texture], 
+                    self.equipment[equip].itemTextures[texture], 
                     os.path.normpath(f'{currentPath}/{name}.png')
                     )
         
         # Copy namespace/textures/entity/equipment/*/*.png
         for equip in self.equipment:
-            for texture in self.equipment[equip]["modelTextures"]:
+            for texture in self.equipment[equip].modelTextures:
                 if texture == "h_l": currentPath = f'{self.resPackDirectory}/assets/{self.packNamespace}/textures/entity/equipment/humanoid_leggings/'
                 elif texture == "horseArmor": currentPath = f'{self.resPackDirectory}/assets/{self.packNamespace}/textures/entity/equipment/horse_body/'
                 else: currentPath = f'{self.resPackDirectory}/assets/{self.packNamespace}/textures/entity/equipment/humanoid/'
                 shutil.copy(
-                    self.equipment[equip]["modelTextures"][texture], 
+                    self.equipment[equip].modelTextures[texture], 
                     os.path.normpath(f'{currentPath}/emerald.png')
                     )
\ No newline at end of file
@@ -9,7 +9,7 @@ from . import structures
 from . import equipment
 
 class Generator():
-    def __init__(self, app_ver, packDetails, dataFormat, resourceFormat, header, blocks, items, recipes, paintings, data, directory, structures=None, equipment=None):
+    def __init__(self, app_ver, packDetails, dataFormat, resourceFormat, header, blocks, items, recipes, paintings, data, directory, structures=None, equipment=None, progress=None):
         self.APP_VERSION = app_ver
         self.packDetails = packDetails
         self.dataFormat = dataFormat
@@ -22,6 +22,20 @@ class Generator():
         self.structures = structures
         self.equipment = equipment
         self.outputDir = directory
+        self.progress = progress    # Called as progress(stage, element, done, total); element is None when a stage starts
+        self.done = 0
+        self.total = 0
+
+    def stage(self, name):
+        """Reports the start of a stage and returns the per-element callback for its generator."""
+        if self.progress is None:
+            return None
+        self.progress(name, None, self.done, self.total)
+
+        def elementDone(element):
+            self.done += 1
+            self.progress(name, element, self.done, self.total)
+        return elementDone
 
     def generateResourcePack(self):
         self.resPackDirectory = os.path.join(self.outputDir, f'{self.packName} Resource Pack')
@@ -64,7 +78,7 @@ class Generator():
         # Generate resources
         if self.blocks:
             blockResourcer = blockResourcer(self.resPackDirectory, self.packNamespace, self.blocks)
-            blockResourcer.generate()
+            blockResourcer.generate(self.stage('Block resources'))
 
         if self.items:
             itemResourcer = itemResourcer(
@@ -72,7 +86,7 @@ class Generator():
                 self.packNamespace,
                 self.items,
             )
-            itemResourcer.generate()
+            itemResourcer.generate(self.stage('Item resources'))
 
         if self.paintings:
             paintingResourcer = paintingResourcer(
@@ -80,7 +94,7 @@ class Generator():
                 self.packNamespace,
                 self.paintings
             )
-            paintingResourcer.generate()
+            paintingResourcer.generate(self.stage('Painting resources'))
         
         if self.equipment:
             equipmentResourcer = equipmentResourcer(
@@ -88,7 +102,7 @@ class Generator():
                 self.packNamespace,
                 self.equipment
             )
-            equipmentResourcer.generate()
+            equipmentResourcer.generate(self.stage('Equipment resources'))
 
     def generateDatapack(self):
         self.packName = self.packDetails["name"]
@@ -99,6 +113,10 @@ class Generator():
         
         self.packDirectory = os.path.join(self.outputDir, self.packName)
 
+        # One step per element in every stage that reports its elements
+        self.done = 0
+        self.total = 2 * len(self.blocks) + 2 * len(self.items) + len(self.recipes) + 2 * len(self.paintings) + len(self.structures or {}) + 2 * len(self.equipment or {})
+
         # Create base directories
         os.makedirs(self.packDirectory, exist_ok=True)
         os.makedirs(os.path.join(self.packDirectory, "data"), exist_ok=True)
@@ -181,7 +199,7 @@ class Generator():
                 self.equipment
             )
 
-            blockGenerator.generate()
+            blockGenerator.generate(self.stage('Blocks'))
 
         #######################
         # CUSTOM ITEMS        #
@@ -195,7 +213,7 @@ class Generator():
                 self.packNamespace
             )
 
-            itemGenerator.generate()
+            itemGenerator.generate(self.stage('Items'))
 
         #######################
         # CUSTOM RECIPES      #
@@ -212,7 +230,7 @@ class Generator():
                 self.equipment
             )
 
-            recipeGenerator.generate()
+            recipeGenerator.generate(self.stage('Recipes'))
         
         #######################
         # CUSTOM PAINTINGS    #
@@ -228,7 +246,7 @@ class Generator():
                 self.minecraftDirectory,
             )
 
-            paintingGenerator.generate()
+            paintingGenerator.generate(self.stage('Paintings'))
         
         #######################
         # CUSTOM STRUCTURES   #
@@ -241,7 +259,7 @@ class Generator():
                 self.packAuthor,
                 self.structures
             )
-            structureGenerator.generate()
+            structureGenerator.generate(self.stage('Structures'))
         
         #######################
         # CUSTOM EQUIPMENT    #
@@ -254,7 +272,7 @@ class Generator():
                 self.equipment,
                 self.packNamespace
             )
-            equipmentGenerator.generate()
+            equipmentGenerator.generate(self.stage('Equipment'))
 
         #######################
         # RESOURCE PACK       #
@@ -1,5 +1,5 @@
 import ast, os, shutil, json
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import Environment, PackageLoader
 
 class ItemGenerator:
     def __init__(self, header, namespaceDirectory, items, namespace):
@@ -9,7 +9,7 @@ class ItemGenerator:
         self.packNamespace = namespace
 
         self.env = Environment(
-            loader=FileSystemLoader(os.path.join(os.path.dirname(os.path.realpath(__file__)), 'item_templates')),
+            loader=PackageLoader(__package__, 'item_templates'),
             autoescape=True
         )
     
@@ -17,7 +17,7 @@ class ItemGenerator:
         temp = self.env.get_template(template)
         return temp.render(context)
 
-    def generate(self):
+    def generate(self, progress=None):
         os.mkdir(f'{self.namespaceDirectory}/function/items')
 
         # Give Items Function
@@ -32,16 +32,17 @@ class ItemGenerator:
 
         # Item, Cooldown, & Execute Functions
         for item in self.items:
+            if progress: progress(item)
             os.mkdir(f'{self.namespaceDirectory}/function/items/{item}')
-            rightClick = self.items[item]["rightClick"]
-            if rightClick["enabled"]:
+            rightClick = self.items[item].rightClick
+            if rightClick.enabled:
 
                 # Item
                 content = self.getTemplate('item.mcfunction.j2', {
                     'header': self.header,
                     'item': item,
                     'packNamespace': self.packNamespace,
-                    'mode': rightClick["mode"]
+                    'mode': rightClick.mode
                 })
 
                 with open(f'{self.namespaceDirectory}/function/items/{item}/{item}.mcfunction', 'w') as file:
@@ -52,7 +53,7 @@ class ItemGenerator:
                     'header': self.header,
                     'item': item,
                     'packNamespace': self.packNamespace,
-                    'mode': rightClick["mode"]
+                    'mode': rightClick.mode
                 })
 
                 with open(f'{self.namespaceDirectory}/function/items/{item}/cooldown.mcfunction', 'w') as file:
@@ -69,8 +70,8 @@ class ItemGenerator:
         
         # Cooldown & Use Advancements
         for item in self.items:
-            rightClick = self.items[item]["rightClick"]
-            if rightClick["enabled"]:
+            rightClick = self.items[item].rightClick
+            if rightClick.enabled:
 
                 # Use
                 content = self.getTemplate('itemUse.json.j2', {
@@ -87,16 +88,16 @@ class ItemGenerator:
                     'item': item
                 })
 
-                if rightClick["mode"] == "impulse":
+                if rightClick.mode == "impulse":
                     with open(f'{self.namespaceDirectory}/advancement/{item}_cooldown.json', 'w') as file:
                         file.write(content)
         
         # Append Scoreboard Declerations Within Load
         with open(f'{self.namespaceDirectory}/function/load.mcfunction', 'a') as f:
             for item in self.items:
-                rightClick = self.items[item]["rightClick"]
-                if rightClick["enabled"]:
-                    if rightClick["mode"] == "impulse": f.write(f'\nscoreboard objectives add {self.items[item]["name"]}_cooldown dummy')
+                rightClick = self.items[item].rightClick
+                if rightClick.enabled:
+                    if rightClick.mode == "impulse": f.write(f'\nscoreboard objectives add {self.items[item].name}_cooldown dummy')
 
 
 class ItemResourcer:
@@ -106,7 +107,7 @@ class ItemResourcer:
         self.packNamespace = packNamespace
 
         self.env = Environment(
-            loader=FileSystemLoader(os.path.join(os.path.dirname(os.path.realpath(__file__)), 'item_templates')),
+            loader=PackageLoader(__package__, 'item_templates'),
             autoescape=True
         )
     
@@ -114,10 +115,11 @@ class ItemResourcer:
         temp = self.env.get_template(template)
         return temp.render(context)
     
-    def generate(self):
+    def generate(self, progress=None):
         # Write Item Model Definition
         modelPath = f'{self.resPackDirectory}/assets/{self.packNamespace}/items/'
         for item in self.items:
+            if progress: progress(item)
             content = self.getTemplate('modelDef.json.j2', {
                 'packNamespace': self.packNamespace,
                 'item': item
@@ -130,14 +132,14 @@ class ItemResourcer:
         for item in self.items:
             currentPath = f'{self.resPackDirectory}/assets/{self.packNamespace}/models/item'
             content = self.getTemplate('model.json.j2', {
-                'model': self.items[item]["model"],
+                'model': self.items[item].model,
                 'packNamespace': self.packNamespace,
-                'texture': os.path.splitext(os.path.basename(str(self.items[item]["texture"])))[-2]
+                'texture': os.path.splitext(os.path.basename(str(self.items[item].texture)))[-2]
             })
 
             with open(f'{currentPath}/{item}.json', "w") as file:
-                if ".json" in self.items[item]["model"]: # Checking for custom model. If so, copy it.
-                    with open(self.items[item]["model"], "r") as f:
+                if ".json" in self.items[item].model: # Checking for custom model. If so, copy it.
+                    with open(self.items[item].model, "r") as f:
                         model = ast.literal_eval(f.read())
                     for texture in model["textures"]:
                         model["textures"][texture] = f'item/{model["textures"][texture]}'
@@ -149,6 +151,6 @@ class ItemResourcer:
         for item in self.items:
             currentPath = f'{self.resPackDirectory}/assets/{self.packNamespace}/textures/item'
             shutil.copy(
-                self.items[item]["texture"], 
-                os.path.normpath(f'{currentPath}/{os.path.splitext(os.path.basename(str(self.items[item]["texture"])))[-2]}.png')
+                self.items[item].texture, 
+                os.path.normpath(f'{currentPath}/{os.path.splitext(os.path.basename(str(self.items[item].texture)))[-2]}.png')
                 )
\ No newline at end of file
@@ -1,5 +1,5 @@
 import os, shutil, json
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import Environment, PackageLoader
 
 class PaintingGenerator:
     def __init__(self, header, namespaceDirectory, packNamespace, packAuthor, paintings, minecraftDirectory):
@@ -11,7 +11,7 @@ class PaintingGenerator:
         self.minecraftDirectory = minecraftDirectory
 
         self.env = Environment(
-            loader=FileSystemLoader(os.path.join(os.path.dirname(os.path.realpath(__file__)), 'painting_templates')),
+            loader=PackageLoader(__package__, 'painting_templates'),
             autoescape=True
         )
     
@@ -19,11 +19,12 @@ class PaintingGenerator:
         temp = self.env.get_template(template)
         return temp.render(context)
     
-    def generate(self):
+    def generate(self, progress=None):
         os.mkdir(f'{self.namespaceDirectory}/painting_variant')
         os.mkdir(f'{self.minecraftDirectory}/tags/painting_variant')
 
         for painting in self.paintings:
+            if progress: progress(painting)
             
             # Painting Variant JSON
             content = self.getTemplate('painting.json.j2', {
@@ -31,7 +32,7 @@ class PaintingGenerator:
                 'painting': painting,
                 'packAuthor': self.packAuthor,
                 'packNamespace': self.packNamespace,
-                'texture': os.path.splitext(os.path.basename(str(self.paintings[painting]["texture"])))[-2]
+                'texture': os.path.splitext(os.path.basename(str(self.paintings[painting].texture)))[-2]
             })
 
             with open(f'{self.namespaceDirectory}/painting_variant/{painting}.json', 'w') as file:
@@ -63,13 +64,14 @@ class PaintingResourcer:
         self.packNamespace = packNamespace
         self.paintings = paintings
 
-    def generate(self):
+    def generate(self, progress=None):
         # Copy Painting Texture To Pack
         for painting in self.paintings:
+            if progress: progress(painting)
             currentPath = f'{self.resPackDirectory}/assets/{self.packNamespace}/textures/painting'
             shutil.copy(
-                self.paintings[painting]["texture"],
+                self.paintings[painting].texture,
                 os.path.normpath(
-                    f'{currentPath}/{os.path.splitext(os.path.basename(str(self.paintings[painting]["texture"])))[-2]}.png'
+                    f'{currentPath}/{os.path.splitext(os.path.basename(str(self.paintings[painting].texture)))[-2]}.png'
                 ),
             )
\ No newline at end of file
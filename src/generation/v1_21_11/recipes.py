@@ -1,5 +1,4 @@
-import os
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import Environment, PackageLoader
 
 class RecipeGenerator:
     def __init__(self, namespaceDirectory, packNamespace, packAuthor, blocks, items, recipes, equipment):
@@ -12,7 +11,7 @@ class RecipeGenerator:
         self.packNamespace = packNamespace
 
         self.env = Environment(
-            loader=FileSystemLoader(os.path.join(os.path.dirname(os.path.realpath(__file__)), 'recipe_templates')),
+            loader=PackageLoader(__package__, 'recipe_templates'),
             autoescape=True
         )
     
@@ -20,16 +19,17 @@ class RecipeGenerator:
         temp = self.env.get_template(template)
         return temp.render(context)
 
-    def generate(self):
+    def generate(self, progress=None):
         for recipe in self.recipes:
-            if self.recipes[recipe]["type"] == "crafting":
-                if self.recipes[recipe]["exact"]:
-                    recip = self.recipes[recipe]["items"]
+            if progress: progress(recipe)
+            if self.recipes[recipe].type == "crafting":
+                if self.recipes[recipe].exact:
+                    recip = self.recipes[recipe].items
                     letters = {"0": "A", "1": "B", "2": "C", "3": "D", "4": "E", "5": "F", "6": "G", "7": "H", "8": "I"}
 
                     content = self.getTemplate('shaped.json.j2', {
                         'ingredients': recip,
-                        'outputCount': self.recipes[recipe]['outputCount'],
+                        'outputCount': self.recipes[recipe].outputCount,
                         'letters': letters,
                         'blocks': self.blocks,
                         'items': self.items,
@@ -38,13 +38,13 @@ class RecipeGenerator:
                         'packAuthor': self.packAuthor
                     })
 
-                    with open(f'{self.namespaceDirectory}/recipe/{self.recipes[recipe]["name"]}.json', 'w') as file:
+                    with open(f'{self.namespaceDirectory}/recipe/{self.recipes[recipe].name}.json', 'w') as file:
                         file.write(content)
                 
                 else:
                     content = self.getTemplate('shapeless.json.j2', {
-                        'ingredients': self.recipes[recipe]["items"],
-                        'outputCount': self.recipes[recipe]['outputCount'],
+                        'ingredients': self.recipes[recipe].items,
+                        'outputCount': self.recipes[recipe].outputCount,
                         'blocks': self.blocks,
                         'items': self.items,
                         'equipment': self.equipment,
@@ -52,14 +52,14 @@ class RecipeGenerator:
                         'packAuthor': self.packAuthor
                     })
 
-                    with open(f'{self.namespaceDirectory}/recipe/{self.recipes[recipe]["name"]}.json', 'w') as file:
+                    with open(f'{self.namespaceDirectory}/recipe/{self.recipes[recipe].name}.json', 'w') as file:
                         file.write(content)
             
-            elif self.recipes[recipe]["type"] in ("smelting", "blasting", "smoking", "campfire_cooking"):
+            elif self.recipes[recipe].type in ("smelting", "blasting", "smoking", "campfire_cooking"):
                 content = self.getTemplate('fire.json.j2', {
-                    'recipe_type': self.recipes[recipe]["type"],
-                    'ingredient': self.recipes[recipe]["items"]["10"],
-                    'result': self.recipes[recipe]["items"]["11"],
+                    'recipe_type': self.recipes[recipe].type,
+                    'ingredient': self.recipes[recipe].items["10"],
+                    'result': self.recipes[recipe].items["11"],
                     'items': self.items,
                     'blocks': self.blocks,
                     'equipment': self.equipment,
@@ -67,14 +67,14 @@ class RecipeGenerator:
                     'packAuthor': self.packAuthor
                 })
 
-                with open(f'{self.namespaceDirectory}/recipe/{self.recipes[recipe]["name"]}.json', 'w') as file:
+                with open(f'{self.namespaceDirectory}/recipe/{self.recipes[recipe].name}.json', 'w') as file:
                         file.write(content)
 
-            elif self.recipes[recipe]["type"] == "stonecutting":
+            elif self.recipes[recipe].type == "stonecutting":
                 content = self.getTemplate('stonecutting.json.j2', {
-                    'ingredient': self.recipes[recipe]["items"]["10"],
-                    'result': self.recipes[recipe]["items"]["11"],
-                    'outputCount': self.recipes[recipe]["outputCount2"],
+                    'ingredient': self.recipes[recipe].items["10"],
+                    'result': self.recipes[recipe].items["11"],
+                    'outputCount': self.recipes[recipe].outputCount2,
                     'items': self.items,
                     'blocks': self.blocks,
                     'equipment': self.equipment,
@@ -82,5 +82,5 @@ class RecipeGenerator:
                     'packAuthor': self.packAuthor
                 })
 
-                with open(f'{self.namespaceDirectory}/recipe/{self.recipes[recipe]["name"]}.json', 'w') as file:
+                with open(f'{self.namespaceDirectory}/recipe/{self.recipes[recipe].name}.json', 'w') as file:
                         file.write(content)
\ No newline at end of file
@@ -1,5 +1,5 @@
 import os, shutil, json
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import Environment, PackageLoader
 
 class StructureGenerator:
     def __init__(self, namespaceDirectory, packNamespace, packAuthor, structures):
@@ -9,7 +9,7 @@ class StructureGenerator:
         self.structures = structures
 
         self.env = Environment(
-            loader=FileSystemLoader(os.path.join(os.path.dirname(os.path.realpath(__file__)), 'structure_templates')),
+            loader=PackageLoader(__package__, 'structure_templates'),
             autoescape=True
         )
 
@@ -17,7 +17,7 @@ class StructureGenerator:
         temp = self.env.get_template(template)
         return temp.render(context)
 
-    def generate(self):
+    def generate(self, progress=None):
         # Generate required folders
         os.makedirs(os.path.join(self.namespaceDirectory, "worldgen", "structure"), exist_ok=True)
         os.makedirs(os.path.join(self.namespaceDirectory, "worldgen", "structure_set"), exist_ok=True)
@@ -35,46 +35,52 @@ class StructureGenerator:
 
         # Loop through all structures
         for structure in self.structures:
+            if progress: progress(structure)
             struct = self.structures[structure]
 
+            # A biome tag is written as a single "#tag" string rather than a list
+            biomes = struct.biomes
+            if len(biomes) == 1 and biomes[0].startswith('#'):
+                biomes = biomes[0]
+
             # Write to worldgen/structure/.json
             content = self.getTemplate('structure.json.j2', {
-                'biomes': struct['biomes'],
-                'step': struct['step'].replace(' ', '_').lower(),
-                'terrain_adaptation': struct['terrain_adaptation'].lower(),
+                'biomes': biomes,
+                'step': struct.step.replace(' ', '_').lower(),
+                'terrain_adaptation': struct.terrain_adaptation.lower(),
                 'namespace': self.packNamespace,
-                'name': struct['name'],
-                'start_height': struct['start_height'],
-                'psth': psth[struct['psth']]
+                'name': struct.name,
+                'start_height': struct.start_height,
+                'psth': psth[struct.psth]
             })
 
-            path = os.path.join(self.namespaceDirectory, "worldgen", "structure", f'{struct['name']}.json')
+            path = os.path.join(self.namespaceDirectory, "worldgen", "structure", f'{struct.name}.json')
             with open(path, 'w') as file:
                 file.write(content)
             
             # Write to worldgen/structure_set/.json
             content = self.getTemplate('structure_set.json.j2', {
                 'namespace': self.packNamespace,
-                'name': struct['name'],
-                'spacing': struct['spacing'],
-                'seperation': struct['seperation']
+                'name': struct.name,
+                'spacing': struct.spacing,
+                'seperation': struct.seperation
             })
 
-            path = os.path.join(self.namespaceDirectory, "worldgen", "structure_set", f'{struct['name']}.json')
+            path = os.path.join(self.namespaceDirectory, "worldgen", "structure_set", f'{struct.name}.json')
             with open(path, 'w') as file:
                 file.write(content)
             
             # Write to worldgen/template_pool/.json
             content = self.getTemplate('template_pool.json.j2', {
                 'namespace': self.packNamespace,
-                'name': struct['name']
+                'name': struct.name
             })
 
-            path = os.path.join(self.namespaceDirectory, "worldgen", "template_pool", f'{struct['name']}.json')
+            path = os.path.join(self.namespaceDirectory, "worldgen", "template_pool", f'{struct.name}.json')
             with open(path, 'w') as file:
                 file.write(content)
 
             # Copy Structure .nbt
             path = os.path.join(self.namespaceDirectory, 'structure')
-            destPath = os.path.join(path, os.path.splitext(os.path.basename(str(struct["structure"])))[-2])
-            shutil.copy(struct['structure'], os.path.normpath(f'{destPath}.nbt'))
\ No newline at end of file
+            destPath = os.path.join(path, os.path.splitext(os.path.basename(str(struct.structure)))[-2])
+            shutil.copy(struct.structure, os.path.normpath(f'{destPath}.nbt'))
\ No newline at end of file
@@ -1,14 +1,18 @@
 import os
 import sys
-import importlib
+import time
+
+STARTED = time.perf_counter()   # Taken before the imports below so --profile-startup can time them
+
+import copy
 import shutil
 import subprocess
 import logging
 from pathlib import Path
 
 from PySide6.QtCore import Qt, QTimer
-from PySide6.QtGui import QImage, QPixmap, QFont, QIcon, QFontDatabase
-from PySide6.QtWidgets import QApplication, QFileDialog, QMainWindow, QWidget, QTreeWidgetItem, QCheckBox, QMessageBox
+from PySide6.QtGui import QFont, QIcon, QFontDatabase, QAction, QKeySequence
+from PySide6.QtWidgets import QApplication, QFileDialog, QMainWindow, QWidget, QTreeView, QListView, QLineEdit, QVBoxLayout, QMessageBox, QMenu, QCompleter, QProgressBar, QPushButton
 
 from utils.field_validator import FieldValidator
 from utils.field_resetter import FieldResetter
@@ -16,17 +20,25 @@ from utils.enums import BlockFace, ElementPage
 from utils.alert import alert
 from utils.const import *
 from utils.drop_handler import DropHandler
+from utils.search_completer import SearchCompleter
+from utils.startup_profile import StartupProfile
 
-import ui.select_item as select_item
 from ui.ui import Ui_MainWindow
 
-from generation.text_generator import TextGenerator
-from generation.potion_generator import PotionGenerator, PotionEffectWidget, PotionColorPicker
-
 from settings import SettingsManager
 
 from core.project_manager import ProjectManager
 from core.settings_controller import SettingsController
+from core.elements import Block, Item, Recipe, Painting, Structure, Equipment, RightClick
+from core.bulk_importer import BulkImporter
+from core.module_loader import loadGenerator
+from core.pack_exporter import PackExporter
+from core.item_model import ItemNameFilter, SELF, PROJECT, VANILLA
+from core.element_tree import ElementRole
+from core.thumbnail_cache import ThumbnailCache
+from core.asset_importer import AssetImporter, ASSET_FOLDERS, choosePage, destinationPaths, matchAssets
+
+startup = StartupProfile('--profile-startup' in sys.argv or bool(os.environ.get('MDIRT_PROFILE_STARTUP')), STARTED)
 
 class App(QMainWindow):
     def __init__(self):
@@ -34,6 +46,7 @@ class App(QMainWindow):
 
         self.ui = Ui_MainWindow()
         self.ui.setupUi(self)
+        startup.mark("main window UI")
 
         if getattr(sys, 'frozen', False):
             # Binary mode
@@ -56,6 +69,8 @@ class App(QMainWindow):
         self.settingsController = SettingsController(app, self.ui, self.settings, self.autoSaveTimer, self.mainDirectory)
 
         self.settingsController.setAutoSaveInterval()
+        self.project.history.budget = self.settings.get('editor', 'undo_memory_mb') * 1024 * 1024
+        startup.mark("project and settings")
 
         self.logger = logging.getLogger("mDirt")
         self.logger.setLevel(logging.DEBUG)
@@ -76,12 +91,8 @@ class App(QMainWindow):
             self.logger.setLevel(logging.WARNING)
 
         self.settingsController.disableUnusedSettings()
+        startup.mark("logging")
 
-        if self.settings.get('general', 'open_last_project'):
-            project = self.settings.get('data', 'last_project_path')
-            if os.path.exists(project):
-                self.project.loadProject(self.settings.get('data', 'last_project_namespace'))
-        
         showTips = self.settings.get('appearance', 'show_tips')
         if not showTips:
             self.ui.textEdit.setText("")
@@ -101,21 +112,27 @@ class App(QMainWindow):
 
         # Create Workspaces folder
         os.makedirs(self.mainDirectory / 'workspaces', exist_ok=True)
+        startup.mark("welcome screen")
 
         # Load Themes
         path = self.mainDirectory / 'assets' / 'themes'
         self.settingsController.loadThemes(path)
+        startup.mark("themes")
 
-        # Load Fonts
-        self.fontIDS = self.loadFonts()
-        
-        family = QFontDatabase.applicationFontFamilies(self.fontIDS[0])[0]
-        self.minecraftFont = QFont(family, 12)
+        # Texture previews are cached per project under its workspace
+        self.thumbnails = ThumbnailCache(self.thumbnailDirectory)
 
         # Tools Setup
-        self.text_generator = TextGenerator(self.ui, OBFUSCATE_PROPERTY, MINECRAFT_COLORS)
+        # Tool pages (and the imports behind them) are set up the first time they are shown
+        self.pageSetups = {ElementPage.TEXT_GENERATOR: self.setupTextGenerator}
+        self.ui.elementEditor.currentChanged.connect(self.preparePage)
+        self.text_generator = None
         self.potion_generator = None
         self.effectWidgets = []
+        self.itemPicker = None
+        self.blockDropNames = ItemNameFilter(self.project.itemNames, (SELF, PROJECT, VANILLA), self)
+        self.setupItemNameBox(self.ui.blockDropBox, self.blockDropNames)
+        self.startupFinished = False
 
         # CONNECTIONS
         self.ui.actionNew_Project.triggered.connect(self.project.openProjectMenu)
@@ -125,7 +142,19 @@ class App(QMainWindow):
         self.ui.actionSave_2.triggered.connect(self.project.saveProject)
         self.ui.actionSettings.triggered.connect(self.settingsController.openSettings)
 
-        self.ui.elementViewer.itemDoubleClicked.connect(self.elementClicked)
+        self.setupElementViewer()
+        self.elementView.doubleClicked.connect(self.elementClicked)
+        self.elementView.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
+        self.elementView.customContextMenuRequested.connect(self.elementContextMenu)
+        self.editingElement = None
+        self.elementEditors = {
+            "blocks": self.editBlock,
+            "items": self.editItem,
+            "recipes": self.editRecipe,
+            "paintings": self.editPainting,
+            "structures": self.editStructure,
+            "equipment": self.editEquipment
+        }
 
         self.ui.actionBlock.triggered.connect(self.newBlock)
         self.ui.actionItem.triggered.connect(self.newItem)
@@ -134,6 +163,51 @@ class App(QMainWindow):
         self.ui.actionStructure.triggered.connect(self.newStructure)
         self.ui.actionEquipmentSet.triggered.connect(self.newEquipment)
 
+        # Files and folders dropped on the element viewer or an editor are sorted into the editor they fit
+        self.assetImporter = None
+        self.blockTexture = {}
+        self.itemTexture = None
+        self.paintingTexture = None
+        self.structure = None
+        self.assetEditors = {
+            ElementPage.BLOCKS: self.newBlock,
+            ElementPage.ITEMS: self.newItem,
+            ElementPage.PAINTINGS: self.newPainting,
+            ElementPage.STRUCTURES: self.newStructure,
+            ElementPage.EQUIPMENT: self.newEquipment
+        }
+        self.dropViewer = DropHandler(self.elementView.viewport(), ('.png', '.nbt'), self.dropAssets, multiple=True)
+        self.dropEditor = DropHandler(self.ui.elementEditor, ('.png', '.nbt'), self.dropAssets, multiple=True)
+
+        self.menuEdit = QMenu("Edit", self.ui.menuBar)
+        self.ui.menuBar.insertMenu(self.ui.menuNew_Element.menuAction(), self.menuEdit)
+        self.actionUndo = self.menuEdit.addAction("Undo")
+        self.actionUndo.setShortcut(QKeySequence.StandardKey.Undo)
+        self.actionUndo.triggered.connect(self.undo)
+        self.actionRedo = self.menuEdit.addAction("Redo")
+        self.actionRedo.setShortcut(QKeySequence.StandardKey.Redo)
+        self.actionRedo.triggered.connect(self.redo)
+
+        self.exporter = None
+        self.exportProgress = QProgressBar(self)
+        self.exportProgress.setMaximumWidth(300)
+        self.exportProgress.setTextVisible(True)
+        self.exportCancelButton = QPushButton("Cancel Export", self)
+        self.exportCancelButton.clicked.connect(self.cancelExport)
+        self.ui.statusbar.addPermanentWidget(self.exportProgress)
+        self.importProgress = QProgressBar(self)
+        self.importProgress.setMaximumWidth(200)
+        self.importProgress.setFormat("Importing %v/%m")
+        self.ui.statusbar.addPermanentWidget(self.importProgress)
+        self.importProgress.hide()
+        self.ui.statusbar.addPermanentWidget(self.exportCancelButton)
+        self.exportProgress.hide()
+        self.exportCancelButton.hide()
+
+        self.actionBulkImportItems = QAction("Bulk Import Items...", self)
+        self.ui.menuNew_Element.addAction(self.actionBulkImportItems)
+        self.actionBulkImportItems.triggered.connect(self.bulkImportItems)
+
         self.ui.actionText_Generator.triggered.connect(self.textGenerator)
         self.ui.actionPotion_Generator.triggered.connect(self.potionGenerator)
 
@@ -145,21 +219,33 @@ class App(QMainWindow):
         self.ui.blockTextureButtonFront.clicked.connect(lambda: self.addBlockTexture(BlockFace.FRONT))
         self.ui.blockTextureButtonBottom.clicked.connect(lambda: self.addBlockTexture(BlockFace.BOTTOM))
 
-        self.dropTop = DropHandler(self.ui.blockTextureButtonTop, '.png', lambda path: self.addBlockTexture(BlockFace.TOP, path))
-        self.dropLeft = DropHandler(self.ui.blockTextureButtonLeft, '.png', lambda path: self.addBlockTexture(BlockFace.LEFT, path))
-        self.dropBack = DropHandler(self.ui.blockTextureButtonBack, '.png', lambda path: self.addBlockTexture(BlockFace.BACK, path))
-        self.dropRight = DropHandler(self.ui.blockTextureButtonRight, '.png', lambda path: self.addBlockTexture(BlockFace.RIGHT, path))
-        self.dropFront = DropHandler(self.ui.blockTextureButtonFront, '.png', lambda path: self.addBlockTexture(BlockFace.FRONT, path))
-        self.dropBottom = DropHandler(self.ui.blockTextureButtonBottom, '.png', lambda path: self.addBlockTexture(BlockFace.BOTTOM, path))
+        self.dropTop = DropHandler(self.ui.blockTextureButtonTop, '.png', lambda paths: self.importAssets(paths, ElementPage.BLOCKS, BlockFace.TOP), multiple=True)
+        self.dropLeft = DropHandler(self.ui.blockTextureButtonLeft, '.png', lambda paths: self.importAssets(paths, ElementPage.BLOCKS, BlockFace.LEFT), multiple=True)
+        self.dropBack = DropHandler(self.ui.blockTextureButtonBack, '.png', lambda paths: self.importAssets(paths, ElementPage.BLOCKS, BlockFace.BACK), multiple=True)
+        self.dropRight = DropHandler(self.ui.blockTextureButtonRight, '.png', lambda paths: self.importAssets(paths, ElementPage.BLOCKS, BlockFace.RIGHT), multiple=True)
+        self.dropFront = DropHandler(self.ui.blockTextureButtonFront, '.png', lambda paths: self.importAssets(paths, ElementPage.BLOCKS, BlockFace.FRONT), multiple=True)
+        self.dropBottom = DropHandler(self.ui.blockTextureButtonBottom, '.png', lambda paths: self.importAssets(paths, ElementPage.BLOCKS, BlockFace.BOTTOM), multiple=True)
 
         self.ui.blockModel.currentTextChanged.connect(self.getBlockModel)
+        self.blockTextureLabels = {
+            BlockFace.TOP: self.ui.blockTextureLabelTop,
+            BlockFace.LEFT: self.ui.blockTextureLabelLeft,
+            BlockFace.BACK: self.ui.blockTextureLabelBack,
+            BlockFace.RIGHT: self.ui.blockTextureLabelRight,
+            BlockFace.FRONT: self.ui.blockTextureLabelFront,
+            BlockFace.BOTTOM: self.ui.blockTextureLabelBottom,
+        }
         self.ui.blockConfirmButton.clicked.connect(self.addBlock)
 
+        self.baseBlockCompleter = SearchCompleter(self.ui.blockBaseBlock, self.baseBlockCompletions, self)
+        self.placeSoundCompleter = SearchCompleter(self.ui.blockPlaceSound, lambda text: self.project.data.search("sound_events").search(text), self)
+
         # Item Specific Connections
+        self.baseItemCompleter = SearchCompleter(self.ui.itemBaseItem, lambda text: self.project.data.search("items").search(text), self)
         self.ui.itemTextureButton.clicked.connect(self.addItemTexture)
         self.ui.itemConfirmButton.clicked.connect(self.addItem)
 
-        self.dropItem = DropHandler(self.ui.itemTextureButton, '.png', self.addItemTexture)
+        self.dropItem = DropHandler(self.ui.itemTextureButton, '.png', lambda paths: self.importAssets(paths, ElementPage.ITEMS), multiple=True)
 
         # Recipe Specific Connections
         self.ui.slot0Button.clicked.connect(lambda: self.getRecipeItem(0))
@@ -185,62 +271,39 @@ class App(QMainWindow):
         self.ui.paintingTextureButton.clicked.connect(self.addPaintingTexture)
         self.ui.paintingConfirmButton.clicked.connect(self.addPainting)
 
-        self.dropPainting = DropHandler(self.ui.paintingTextureButton, '.png', self.addPaintingTexture)
+        self.dropPainting = DropHandler(self.ui.paintingTextureButton, '.png', lambda paths: self.importAssets(paths, ElementPage.PAINTINGS), multiple=True)
 
         # Structure Specific Connections
         self.ui.structureNBTButton.clicked.connect(self.addStructureNBT)
         self.ui.structureConfirmButton.clicked.connect(self.addStructure)
+        self.biomeView = QListView()
+        self.biomeView.setModel(self.project.biomeList)
+        self.biomeView.setUniformItemSizes(True)
+        self.ui.verticalLayout_3.addWidget(self.biomeView)
 
-        self.dropStructure = DropHandler(self.ui.structureNBTButton, '.nbt', self.addStructureNBT)
+        self.dropStructure = DropHandler(self.ui.structureNBTButton, '.nbt', lambda paths: self.importAssets(paths, ElementPage.STRUCTURES), multiple=True)
 
         # Equipment Specific Connections
-        button_map = [
-            ("helmet", "Item"),
-            ("chestplate", "Item"),
-            ("leggings", "Item"),
-            ("boots", "Item"),
-            ("horseArmor", "Item")
-        ]
-
-        for part, type_ in button_map:
-            btn_attr = f"{part}{type_}"
-            label_attr = f"{btn_attr}Label"
-            
-            button = getattr(self.ui, btn_attr)
-            label = getattr(self.ui, label_attr)
-
-            button.clicked.connect(
-                lambda _, t=type_, p=part, l=label: self.addEquipmentTexture(t, p, l)
-            )
-        
-        self.ui.chestplateModel.clicked.connect(lambda: self.addEquipmentTexture("humanoid", None, self.ui.chestplateModelLabel))
-        self.ui.leggingsModel.clicked.connect(lambda: self.addEquipmentTexture("humanoid_leggings", None, self.ui.leggingsModelLabel))
-        self.ui.horseArmorModel.clicked.connect(lambda: self.addEquipmentTexture("horseArmor1", None, self.ui.horseArmorModelLabel))
-
-        self.dropHelmet = DropHandler(self.ui.helmetItem, '.png', lambda path: self.addEquipmentTexture("Item", "helmet", self.ui.helmetItemLabel, path))
-        self.dropChestplate = DropHandler(self.ui.chestplateItem, '.png', lambda path: self.addEquipmentTexture("Item", "chestplate", self.ui.chestplateItemLabel, path))
-        self.dropLeggings = DropHandler(self.ui.leggingsItem, '.png', lambda path: self.addEquipmentTexture("Item", "leggings", self.ui.leggingsItemLabel, path))
-        self.dropBoots = DropHandler(self.ui.bootsItem, '.png', lambda path: self.addEquipmentTexture("Item", "boots", self.ui.bootsItemLabel, path))
-        self.dropHorse = DropHandler(self.ui.horseArmorItem, '.png', lambda path: self.addEquipmentTexture("Item", "horseArmor", self.ui.horseArmorItemLabel, path))
+        # (project dict, key) of each equipment texture -> its button and preview
+        equipmentSlots = {
+            ('item', 'helmet'): (self.ui.helmetItem, self.ui.helmetItemLabel),
+            ('item', 'chestplate'): (self.ui.chestplateItem, self.ui.chestplateItemLabel),
+            ('item', 'leggings'): (self.ui.leggingsItem, self.ui.leggingsItemLabel),
+            ('item', 'boots'): (self.ui.bootsItem, self.ui.bootsItemLabel),
+            ('item', 'horseArmor'): (self.ui.horseArmorItem, self.ui.horseArmorItemLabel),
+            ('model', 'h'): (self.ui.chestplateModel, self.ui.chestplateModelLabel),
+            ('model', 'h_l'): (self.ui.leggingsModel, self.ui.leggingsModelLabel),
+            ('model', 'horseArmor'): (self.ui.horseArmorModel, self.ui.horseArmorModelLabel),
+        }
+        self.equipmentLabels = {slot: label for slot, (_, label) in equipmentSlots.items()}
+        self.equipmentDrops = []
 
-        self.dropChestplateModel = DropHandler(self.ui.chestplateModel, '.png', lambda path: self.addEquipmentTexture("humanoid", None, self.ui.chestplateModelLabel, path))
-        self.dropLeggingsModel = DropHandler(self.ui.leggingsModel, '.png', lambda path: self.addEquipmentTexture("humanoid_leggings", None, self.ui.leggingsModelLabel, path))
-        self.dropHorseModel = DropHandler(self.ui.horseArmorModel, '.png', lambda path: self.addEquipmentTexture("horseArmor1", None, self.ui.horseArmorModelLabel, path))
+        for slot, (button, _) in equipmentSlots.items():
+            button.clicked.connect(lambda _, s=slot: self.addEquipmentTexture(s))
+            self.equipmentDrops.append(DropHandler(button, '.png', lambda paths, s=slot: self.importAssets(paths, ElementPage.EQUIPMENT, s), multiple=True))
 
         self.ui.equipmentConfirmButton.clicked.connect(self.addEquipment)
 
-        # Text Generator Connections
-        self.ui.textGeneratorBold.clicked.connect(self.text_generator.tg_ToggleBold)
-        self.ui.textGeneratorItalic.clicked.connect(self.text_generator.tg_ToggleItalic)
-        self.ui.textGeneratorUnderline.clicked.connect(self.text_generator.tg_ToggleUnderline)
-        self.ui.textGeneratorStrikethrough.clicked.connect(self.text_generator.tg_ToggleStrikethrough)
-        self.ui.textGeneratorObfuscated.clicked.connect(self.text_generator.tg_ToggleObfuscate)
-        self.ui.textGeneratorColor.clicked.connect(self.text_generator.tg_Color)
-        self.ui.textGeneratorTextBox.textChanged.connect(self.text_generator.tg_UpdateTextComponentOutput)
-        self.ui.textGeneratorCopy.clicked.connect(self.text_generator.tg_CopyOutput)
-
-        self.ui.textGeneratorOutput.setReadOnly(True)
-
         # Potion Generator Connections
         self.ui.potionAddEffect.clicked.connect(self.addPotionEffect)
         self.ui.potionColor.clicked.connect(self.getPotionColor)
@@ -253,9 +316,35 @@ class App(QMainWindow):
         self.ui.settingsWorkspacePathButton.clicked.connect(self.workspacePathChanged)
         self.ui.settingsDefaultExportButton.clicked.connect(self.exportPathChanged)
 
+        startup.mark("editors and connections")
+
         self.settingsController.refreshSettings()
+        startup.mark("apply settings")
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if not self.startupFinished:
+            self.startupFinished = True
+            # Queued behind the first paint, so a slow project load or updater launch doesn't hold up the window
+            QTimer.singleShot(0, self.finishStartup)
+
+    def finishStartup(self):
+        startup.mark("show and first paint")
+
+        if self.settings.get('general', 'open_last_project'):
+            project = self.settings.get('data', 'last_project_path')
+            if os.path.exists(project):
+                self.project.loadProject(self.settings.get('data', 'last_project_namespace'))
+        startup.mark("open last project")
 
         self.checkUpdates()
+        startup.mark("updater")
+        startup.report()
+
+    def preparePage(self, page):
+        setup = self.pageSetups.pop(page, None)
+        if setup:
+            setup()
 
     def checkUpdates(self):
         if not self.settings.get('network', 'check_updates'): return
@@ -292,12 +381,17 @@ class App(QMainWindow):
                 QMessageBox.No
             )
             if reply == QMessageBox.Yes:
+                self.project.discardJournal()   # The user chose to throw these edits away.
                 event.accept()
             else:
                 event.ignore()
         else:
             event.accept()
 
+        if event.isAccepted() and self.exporter is not None:
+            self.exporter.cancel()      # A running export is stopped and its partial output removed
+            self.exporter.wait()
+
     #######################
     # SETTINGS            #
     #######################
@@ -314,22 +408,210 @@ class App(QMainWindow):
     # ELEMENT MANAGER     #
     #######################
 
-    def elementClicked(self, item, column):
-        element_type = item.parent()
-        if element_type is None: return
-
-        if element_type.text(column) == "Blocks":
-            self.editBlock(item.text(column)) 
-        elif element_type.text(column) == "Items":
-            self.editItem(item.text(column))
-        elif element_type.text(column) == "Recipes":
-            self.editRecipe(item.text(column))
-        elif element_type.text(column) == "Paintings":
-            self.editPainting(item.text(column))
-        elif element_type.text(column) == "Structures":
-            self.editStructure(item.text(column))
-        elif element_type.text(column) == "Equipment":
-            self.editEquipment(item.text(column))
+    def setupElementViewer(self):
+        # The generated QTreeWidget is swapped for a view over the project's element model, with a search box on top
+        self.elementView = QTreeView()
+        self.elementView.setObjectName("elementViewer")
+        self.elementView.setModel(self.project.elementTree)
+        self.elementView.setUniformRowHeights(True)
+        self.elementView.setMinimumSize(self.ui.elementViewer.minimumSize())
+
+        self.elementSearch = QLineEdit()
+        self.elementSearch.setPlaceholderText("Search elements...")
+        self.elementSearch.setClearButtonEnabled(True)
+        self.elementSearch.textChanged.connect(self.filterElements)
+        self.expandedCategories = None
+
+        panel = QWidget()
+        layout = QVBoxLayout(panel)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.addWidget(self.elementSearch)
+        layout.addWidget(self.elementView)
+        self.ui.formLayout_2.replaceWidget(self.ui.elementViewer, panel)
+        self.ui.elementViewer.deleteLater()
+        del self.ui.elementViewer
+
+    def filterElements(self, text):
+        model = self.project.elementTree
+        categories = [model.index(row, 0) for row in range(model.rowCount())]
+
+        # Remember what was open before searching so clearing the search puts it back
+        if text.strip() and self.expandedCategories is None:
+            self.expandedCategories = [self.elementView.isExpanded(index) for index in categories]
+
+        model.setFilter(text)
+
+        if text.strip():
+            for index in categories:
+                self.elementView.setExpanded(index, model.hasChildren(index))
+            self.ui.statusbar.showMessage(f"{model.matchCount()} matching element(s)", 2000)
+        elif self.expandedCategories is not None:
+            for index, expanded in zip(categories, self.expandedCategories):
+                self.elementView.setExpanded(index, expanded)
+            self.expandedCategories = None
+
+    def elementClicked(self, index):
+        element = index.data(ElementRole)
+        if element is None: return
+
+        category, name = element
+        self.editingElement = element
+        self.elementEditors[category](name)
+
+    def elementContextMenu(self, pos):
+        element = self.elementView.indexAt(pos).data(ElementRole)
+        if element is None: return
+
+        category, name = element
+
+        menu = QMenu(self)
+        usagesAction = menu.addAction("Find Usages")
+        deleteAction = menu.addAction("Delete")
+        chosen = menu.exec(self.elementView.viewport().mapToGlobal(pos))
+
+        if chosen == usagesAction:
+            usages = self.project.findUsages(category, name)
+            if usages:
+                alert(f'"{name}" is used by:\n' + "\n".join(f'{other} ({cat})' for cat, other in usages))
+            else:
+                alert(f'"{name}" is not used by any other element.')
+        elif chosen == deleteAction:
+            self.deleteElement(category, name)
+
+    def deleteElement(self, category, name):
+        usages = self.project.findUsages(category, name)
+        if usages:
+            message = f'"{name}" is used by:\n' + "\n".join(f'{other} ({cat})' for cat, other in usages)
+            message += "\n\nThose elements will fall back to a vanilla item with this name. Delete anyway?"
+        elif self.settings.get('editor', 'confirm_deletes'):
+            message = f'Are you sure you want to delete "{name}"?'
+        else:
+            message = None
+
+        if message and QMessageBox.question(self, "Delete Element", message, QMessageBox.Yes | QMessageBox.No) != QMessageBox.Yes:
+            return
+
+        # The element tree drops the row itself when the project changes
+        if self.project.deleteElement(category, name):
+            if self.editingElement == (category, name):
+                self.editingElement = None
+
+    def undo(self):
+        self.syncEditor(self.project.undo())
+
+    def redo(self):
+        self.syncEditor(self.project.redo())
+
+    def syncEditor(self, changed):
+        for category, name in changed:
+            if self.editingElement == (category, name):
+                self.editingElement = None
+
+        if changed:
+            self.ui.elementEditor.setCurrentIndex(ElementPage.HOME)
+
+    def warnIfRenamed(self, category, newName):
+        editing, self.editingElement = self.editingElement, None
+        if editing is None or editing[0] != category or editing[1] == newName:
+            return
+
+        usages = self.project.findUsages(category, editing[1])
+        if usages:
+            alert(f'"{editing[1]}" was saved as "{newName}". These elements still use the old name:\n' + "\n".join(f'{other} ({cat})' for cat, other in usages))
+
+    #######################
+    # ASSET IMPORT        #
+    #######################
+
+    def thumbnailDirectory(self):
+        return f'{self.mainDirectory}/workspaces/{self.project.packDetails["namespace"]}/.thumbnails'
+
+    def dropAssets(self, paths):
+        page = choosePage(paths, ElementPage(self.ui.elementEditor.currentIndex()))
+        if page is None:
+            self.ui.statusbar.showMessage("None of the dropped files fit an editor.", 3000)
+            return
+        if page != self.ui.elementEditor.currentIndex():
+            self.assetEditors[page]()
+        self.importAssets(paths, page)
+
+    def importAssets(self, paths, page, fallback=None):
+        """
+        Copies files into the workspace and fills them into the editor on `page`,
+        matched to block faces or equipment textures by name (see matchAssets).
+        """
+        if self.assetImporter is not None:
+            self.ui.statusbar.showMessage("Still importing the last drop, try again in a moment.", 3000)
+            return
+
+        slots, unused = matchAssets(paths, page, fallback)
+        if not slots:
+            self.ui.statusbar.showMessage("None of the dropped files fit this editor.", 3000)
+            return
+
+        folder = f'{self.mainDirectory}/workspaces/{self.project.packDetails["namespace"]}/assets/{ASSET_FOLDERS[page]}'
+        destinations = destinationPaths(dict.fromkeys(slots.values()), folder)
+        self.importedSlots = (page, {slot: destinations[path] for slot, path in slots.items()}, len(unused))
+
+        self.assetImporter = AssetImporter(list(destinations.items()), self.thumbnailDirectory(), parent=self)
+        self.assetImporter.progress.connect(self.importProgressed)
+        self.assetImporter.imported.connect(self.assetsImported)
+        self.assetImporter.finished.connect(self.importFinished)
+
+        self.importProgress.setMaximum(len(destinations))
+        self.importProgress.setValue(0)
+        self.importProgress.show()
+        self.assetImporter.start()
+
+    def importProgressed(self, done, total):
+        self.importProgress.setMaximum(total)
+        self.importProgress.setValue(done)
+
+    def assetsImported(self, results, errors):
+        page, slots, unused = self.importedSlots
+        copied = set()
+        for destination, stamp, thumbnail in results:
+            # The worker already decoded the preview, so the labels fill in from memory
+            if thumbnail is not None:
+                self.thumbnails.loaded(destination, stamp, thumbnail)
+            copied.add(destination)
+
+        for slot, destination in slots.items():
+            if destination in copied:
+                self.assignAsset(page, slot, destination)
+
+        message = f"Imported {len(copied)} file(s)."
+        if unused:
+            message += f" {unused} file(s) didn't match a slot and were skipped."
+        self.ui.statusbar.showMessage(message, 4000)
+        if errors:
+            alert("Some files could not be imported:\n" + "\n".join(errors[:25]))
+
+    def assignAsset(self, page, slot, path):
+        match page:
+            case ElementPage.BLOCKS:
+                self.blockTexture[slot] = path
+                self.thumbnails.show(self.blockTextureLabels[slot], path)
+            case ElementPage.ITEMS:
+                self.itemTexture = path
+                self.thumbnails.show(self.ui.itemTexture, path)
+            case ElementPage.PAINTINGS:
+                self.paintingTexture = path
+                self.thumbnails.show(self.ui.paintingTexture, path)
+            case ElementPage.STRUCTURES:
+                self.structure = path
+                self.ui.structureNBTButton.setText(os.path.basename(path))
+            case ElementPage.EQUIPMENT:
+                group, key = slot
+                textures = self.project.equipmentTexture if group == 'item' else self.project.equipmentModel
+                textures[key] = path
+                self.thumbnails.show(self.equipmentLabels[slot], path)
+
+    def importFinished(self):
+        self.assetImporter.wait()
+        self.assetImporter.deleteLater()
+        self.assetImporter = None
+        self.importProgress.hide()
 
     #######################
     # BLOCKS TAB          #
@@ -343,45 +625,29 @@ class App(QMainWindow):
         else:
             texture = path
 
-        filename = os.path.basename(texture)
-        destinationPath = f'{self.mainDirectory}/workspaces/{self.packDetails["namespace"]}/assets/blocks/{filename}'
-        shutil.copyfile(texture, destinationPath)
-
-        self.blockTexture[face] = destinationPath
-
-        image = QImage(self.blockTexture[face])
-        pixmap = QPixmap.fromImage(image).scaled(50, 50, Qt.AspectRatioMode.KeepAspectRatio)
-
-        label_map = {
-            BlockFace.TOP: self.ui.blockTextureLabelTop,
-            BlockFace.LEFT: self.ui.blockTextureLabelLeft,
-            BlockFace.BACK: self.ui.blockTextureLabelBack,
-            BlockFace.RIGHT: self.ui.blockTextureLabelRight,
-            BlockFace.FRONT: self.ui.blockTextureLabelFront,
-            BlockFace.BOTTOM: self.ui.blockTextureLabelBottom,
-        }
-
-        label_map[face].setPixmap(pixmap)
+        self.importAssets([texture], ElementPage.BLOCKS, face)
 
     def newBlock(self):
         self.unsavedChanges = True
+        self.editingElement = None
         self.populateBlockDrop()
         self.ui.elementEditor.setCurrentIndex(ElementPage.BLOCKS)
 
     def populateBlockDrop(self):
-        self.ui.blockDropBox.clear()
-        self.ui.blockDropBox.addItem('self')
-        for block in self.project.blocks:
-            self.ui.blockDropBox.addItem(block)
-        for item in self.project.items:
-            self.ui.blockDropBox.addItem(item)
-        for equip in self.project.equipment: 
-                for item in ['helmet', 'chestplate', 'leggings', 'boots', 'horse_armor']:
-                    if not self.project.equipment[equip]["includeHorse"]:
-                        if item == "horse_armor": continue
-                    self.ui.blockDropBox.addItem(f'{self.project.equipment[equip]["name"]}_{item}')
-        for item in self.data["items"]:
-            self.ui.blockDropBox.addItem(item)
+        # The list itself comes from the shared item model; only the selection needs resetting
+        self.ui.blockDropBox.setCurrentIndex(0)
+
+    def baseBlockCompletions(self, text):
+        # Complete block names, then "name[key=value,..." once a state list is opened
+        if "[" not in text:
+            return self.project.data.search("blocks").search(text)
+
+        head = text[:max(text.rfind("["), text.rfind(",")) + 1]
+        name = text.partition("[")[0]
+        used = {pair.partition("=")[0] for pair in head[len(name) + 1:].split(",")}
+        states = self.project.data.get("block_states", {}).get(name, {})
+        completions = [f'{head}{key}={value}' for key, values in states.items() if key not in used for value in values]
+        return [completion for completion in completions if completion.startswith(text)]
 
     def getBlockModel(self):
         if self.ui.blockModel.currentText() != "Custom": return
@@ -390,7 +656,7 @@ class App(QMainWindow):
         filePath, _ = fileDialog.getOpenFileName(self, "Open JSON File", "", "JSON Files (*.json)")
         if filePath:
             fileName = os.path.basename(filePath)
-            destPath = f'{self.mainDirectory}/workspaces/{self.packDetails["namespace"]}/assets/blocks/{fileName}'
+            destPath = f'{self.mainDirectory}/workspaces/{self.project.packDetails["namespace"]}/assets/blocks/{fileName}'
             shutil.copy(filePath, destPath)
             self.ui.blockModel.addItem(destPath)
             self.ui.blockModel.setCurrentText(destPath)
@@ -400,7 +666,7 @@ class App(QMainWindow):
             return 0
         if not FieldValidator.validate_text_field(self.ui.blockName, "abcdefghijklmnopqrstuvwxyz_0123456789", "Name"):
             return 0
-        if not FieldValidator.validate_dropdown_selection(self.ui.blockBaseBlock, list(self.data["blocks"]), "Base Block"):
+        if not FieldValidator.validate_block_state(self.ui.blockBaseBlock, self.project.data["blocks"], self.project.data.get("block_states"), "Base Block"):
             return 0
 
         return 1
@@ -417,7 +683,7 @@ class App(QMainWindow):
             self.ui.blockModel
         )
 
-        FieldResetter.clear_labels(
+        self.thumbnails.clear(
             self.ui.blockTextureLabelTop,
             self.ui.blockTextureLabelLeft,
             self.ui.blockTextureLabelBack,
@@ -427,7 +693,7 @@ class App(QMainWindow):
         )
 
         FieldResetter.uncheck_boxes(self.ui.blockDirectional)
-        FieldResetter.clear_tree_selection(self.ui.elementViewer)
+        FieldResetter.clear_tree_selection(self.elementView)
 
         self.blockTexture = {}
         self.populateBlockDrop()
@@ -435,21 +701,18 @@ class App(QMainWindow):
     def addBlock(self):
         if self.validateBlockDetails() == 0: return
 
-        self.blockProperties = {
-            "name": self.ui.blockName.text(),
-            "displayName": self.ui.blockDisplayName.text(),
-            "baseBlock": self.ui.blockBaseBlock.text(),
-            "textures": self.blockTexture,
-            "placeSound": self.ui.blockPlaceSound.text(),
-            "blockDrop": self.ui.blockDropBox.currentText(),
-            "directional": self.ui.blockDirectional.isChecked(),
-            "model": self.ui.blockModel.currentText(),
-        }
-        if not self.blockProperties["name"] in self.project.blocks:
-            self.project.blocks[self.blockProperties["name"]] = self.blockProperties
-            QTreeWidgetItem(self.project.blocks_tree, [self.blockProperties["name"]])
-        else:
-            self.project.blocks[self.blockProperties["name"]] = self.blockProperties
+        self.blockProperties = Block(
+            name=self.ui.blockName.text(),
+            displayName=self.ui.blockDisplayName.text(),
+            baseBlock=self.ui.blockBaseBlock.text(),
+            textures={str(int(face)): path for face, path in self.blockTexture.items()},
+            placeSound=self.ui.blockPlaceSound.text(),
+            blockDrop=self.ui.blockDropBox.currentText(),
+            directional=self.ui.blockDirectional.isChecked(),
+            model=self.ui.blockModel.currentText(),
+        )
+        self.warnIfRenamed('blocks', self.blockProperties.name)
+        self.project.setElement('blocks', self.blockProperties)
 
         self.clearBlockFields()
 
@@ -459,30 +722,19 @@ class App(QMainWindow):
     def editBlock(self, block):
         properties = self.project.blocks[block]
 
-        self.ui.blockName.setText(properties["name"])
-        self.ui.blockDisplayName.setText(properties["displayName"])
-        self.ui.blockBaseBlock.setText(properties["baseBlock"])
-        self.ui.blockDropBox.setCurrentText(properties["blockDrop"])
-        self.ui.blockPlaceSound.setText(properties["placeSound"])
-        self.ui.blockDirectional.setChecked(properties["directional"])
-        self.ui.blockModel.setCurrentText(properties["model"])
-        self.blockTexture = properties["textures"]
+        self.ui.blockName.setText(properties.name)
+        self.ui.blockDisplayName.setText(properties.displayName)
+        self.ui.blockBaseBlock.setText(properties.baseBlock)
+        self.ui.blockDropBox.setCurrentText(properties.blockDrop)
+        self.ui.blockPlaceSound.setText(properties.placeSound)
+        self.ui.blockDirectional.setChecked(properties.directional)
+        self.ui.blockModel.setCurrentText(properties.model)
+        self.blockTexture = {BlockFace(int(face)): path for face, path in properties.textures.items()}
 
         for face, path in self.blockTexture.items():
-            pixmap = QPixmap.fromImage(QImage(path)).scaled(50, 50, Qt.AspectRatioMode.KeepAspectRatio)
-
-            label_map = {
-                BlockFace.TOP: self.ui.blockTextureLabelTop,
-                BlockFace.LEFT: self.ui.blockTextureLabelLeft,
-                BlockFace.BACK: self.ui.blockTextureLabelBack,
-                BlockFace.RIGHT: self.ui.blockTextureLabelRight,
-                BlockFace.FRONT: self.ui.blockTextureLabelFront,
-                BlockFace.BOTTOM: self.ui.blockTextureLabelBottom,
-            }
-
-            label = label_map.get(BlockFace(int(face)))
+            label = self.blockTextureLabels.get(face)
             if label:
-                label.setPixmap(pixmap)
+                self.thumbnails.show(label, path)
 
         
         self.ui.elementEditor.setCurrentIndex(ElementPage.BLOCKS)
@@ -498,20 +750,12 @@ class App(QMainWindow):
                 return
         else:
             texture = path
-        
-        filename = os.path.basename(texture)
-        destinationPath = f'{self.mainDirectory}/workspaces/{self.packDetails["namespace"]}/assets/items/{filename}'
-        shutil.copyfile(texture, destinationPath)
 
-        self.itemTexture = destinationPath
-
-        image = QImage(self.itemTexture)
-        pixmap = QPixmap.fromImage(image).scaled(50, 50, Qt.AspectRatioMode.KeepAspectRatio)
-
-        self.ui.itemTexture.setPixmap(pixmap)
+        self.importAssets([texture], ElementPage.ITEMS)
 
     def newItem(self):
         self.unsavedChanges = True
+        self.editingElement = None
         self.ui.elementEditor.setCurrentIndex(ElementPage.ITEMS)
 
     def getItemModel(self):
@@ -521,19 +765,20 @@ class App(QMainWindow):
         filePath, _ = fileDialog.getOpenFileName(self, "Open JSON File", "", "JSON Files (*.json)")
         if filePath:
             fileName = os.path.basename(filePath)
-            destPath = f'{self.mainDirectory}/workspaces/{self.packDetails["namespace"]}/assets/items/{fileName}'
+            destPath = f'{self.mainDirectory}/workspaces/{self.project.packDetails["namespace"]}/assets/items/{fileName}'
             shutil.copy(filePath, destPath)
             self.ui.itemModel.addItem(destPath)
             self.ui.itemModel.setCurrentText(destPath)
 
     def validateItemDetails(self):
-        if not FieldValidator.validate_text_field(self.ui.itemDisplayName, "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz _-!0123456789", "Display Name"):
+        if not FieldValidator.validate_text_field(self.ui.itemDisplayName, FieldValidator.DISPLAY_NAME_CHARS, "Display Name"):
             return 0
-        if not FieldValidator.validate_text_field(self.ui.itemName, "abcdefghijklmnopqrstuvwxyz_0123456789", "Item Name"):
+        if not FieldValidator.validate_text_field(self.ui.itemName, FieldValidator.NAME_CHARS, "Item Name"):
             return 0
-        if not self.ui.itemBaseItem.text() in self.data["items"]:
+        if not self.ui.itemBaseItem.text() in self.project.data["items"]:
             self.ui.itemBaseItem.setStyleSheet("QLineEdit { border: 1px solid red; }")
-            alert("Please input a Minecraft item to the Base Item field!")
+            suggestion = self.project.data.search("items").closest(self.ui.itemBaseItem.text())
+            alert("Please input a Minecraft item to the Base Item field!" + (f' Did you mean "{suggestion}"?' if suggestion else ""))
             return 0
         else:
             self.ui.itemBaseItem.setStyleSheet("")
@@ -566,7 +811,7 @@ class App(QMainWindow):
             self.ui.itemRightClickFunc
         )
 
-        FieldResetter.clear_labels(
+        self.thumbnails.clear(
             self.ui.itemTexture
         )
 
@@ -574,29 +819,27 @@ class App(QMainWindow):
             self.ui.itemRightClickCheck
         )
 
-        FieldResetter.clear_tree_selection(self.ui.elementViewer)
+        FieldResetter.clear_tree_selection(self.elementView)
 
         self.itemTexture = None
 
     def addItem(self):
         if self.validateItemDetails() == 0: return
 
-        rightClick = {"enabled":self.ui.itemRightClickCheck.isChecked(),"function":self.ui.itemRightClickFunc.toPlainText(),"mode":self.ui.itemRightClickMode.currentText().lower()}
+        rightClick = RightClick(enabled=self.ui.itemRightClickCheck.isChecked(), function=self.ui.itemRightClickFunc.toPlainText(), mode=self.ui.itemRightClickMode.currentText().lower())
 
-        self.itemProperties = {
-            "name": self.ui.itemName.text(),
-            "displayName": self.ui.itemDisplayName.text(),
-            "baseItem": self.ui.itemBaseItem.text(),
-            "texture": self.itemTexture,
-            "model": self.ui.itemModel.currentText().lower(),
-            "stackSize": self.ui.itemStackSize.value(),
-            "rightClick": rightClick,
-        }
-
-        if not self.itemProperties["name"] in self.project.items:
-            QTreeWidgetItem(self.project.items_tree, [self.itemProperties["name"]])
+        self.itemProperties = Item(
+            name=self.ui.itemName.text(),
+            displayName=self.ui.itemDisplayName.text(),
+            baseItem=self.ui.itemBaseItem.text(),
+            texture=self.itemTexture,
+            model=self.ui.itemModel.currentText().lower(),
+            stackSize=self.ui.itemStackSize.value(),
+            rightClick=rightClick,
+        )
 
-        self.project.items[self.itemProperties["name"]] = self.itemProperties
+        self.warnIfRenamed('items', self.itemProperties.name)
+        self.project.setElement('items', self.itemProperties)
 
         self.clearItemFields()
 
@@ -606,48 +849,101 @@ class App(QMainWindow):
     def editItem(self, item):
         properties = self.project.items[item]
 
-        self.ui.itemName.setText(properties["name"])
-        self.ui.itemDisplayName.setText(properties["displayName"])
-        self.ui.itemBaseItem.setText(properties["baseItem"])
-        self.ui.itemModel.setCurrentText(properties["model"])
-        self.ui.itemStackSize.setValue(properties["stackSize"])
-        self.ui.itemRightClickFunc.setPlainText(properties["rightClick"]["function"])
-        self.ui.itemRightClickMode.setCurrentText(properties["rightClick"]["mode"])
-        self.ui.itemRightClickCheck.setChecked(properties["rightClick"]["enabled"])
+        self.ui.itemName.setText(properties.name)
+        self.ui.itemDisplayName.setText(properties.displayName)
+        self.ui.itemBaseItem.setText(properties.baseItem)
+        self.ui.itemModel.setCurrentText(properties.model)
+        self.ui.itemStackSize.setValue(properties.stackSize)
+        self.ui.itemRightClickFunc.setPlainText(properties.rightClick.function)
+        self.ui.itemRightClickMode.setCurrentText(properties.rightClick.mode)
+        self.ui.itemRightClickCheck.setChecked(properties.rightClick.enabled)
         
-        self.itemTexture = properties["texture"]
+        self.itemTexture = properties.texture
 
-        pixmap = QPixmap.fromImage(QImage(properties["texture"])).scaled(50, 50, Qt.AspectRatioMode.KeepAspectRatio)
-        self.ui.itemTexture.setPixmap(pixmap)
+        self.thumbnails.show(self.ui.itemTexture, properties.texture)
 
         self.ui.elementEditor.setCurrentIndex(ElementPage.ITEMS)
 
+    def bulkImportItems(self):
+        directory = QFileDialog.getExistingDirectory(self, "Select Texture Folder")
+        if not directory:
+            return
+
+        manifest, _ = QFileDialog.getOpenFileName(self, "Open Manifest (Cancel to use file names)", directory, "Manifest Files (*.csv *.json)")
+
+        importer = BulkImporter(self.project.data["items"], f'{self.mainDirectory}/workspaces/{self.project.packDetails["namespace"]}/assets/items')
+        jobs, errors = importer.prepare(directory, manifest or None)
+        if errors:
+            shown = errors[:25]
+            if len(errors) > len(shown):
+                shown.append(f'...and {len(errors) - len(shown)} more.')
+            alert("Nothing was imported:\n" + "\n".join(shown))
+            return
+
+        existing = importer.collisions(jobs, self.project.items)
+        if existing:
+            shown = existing[:25]
+            if len(existing) > len(shown):
+                shown.append(f'...and {len(existing) - len(shown)} more.')
+            reply = QMessageBox.question(
+                self,
+                "Items Already Exist",
+                "These items are already in the project:\n" + "\n".join(shown) + "\n\nReplace them? Choose No to import only the new items.",
+                QMessageBox.Yes | QMessageBox.No | QMessageBox.Cancel,
+                QMessageBox.Cancel
+            )
+            if reply == QMessageBox.Cancel:
+                return
+            if reply == QMessageBox.No:
+                jobs = [job for job in jobs if job[1].name not in self.project.items]
+                if not jobs:
+                    alert("Nothing was imported: every item is already in the project.")
+                    return
+
+        try:
+            importer.copyTextures(jobs)
+        except OSError as e:
+            alert(f"Failed to copy textures: {e}")
+            return
+
+        self.project.setElements('items', [item for _, item in jobs])
+
+        alert(f"Imported {len(jobs)} items!")
+
     #######################
     # RECIPES TAB         #
     #######################
 
-    def getRecipeItem(self, id_):
-        slotId = id_
-        self.block_popup = QWidget()
-        self.ui_form = select_item.Ui_Form()
-        self.ui_form.setupUi(self.block_popup)
-
-        item_list = self.data["items"]
+    def setupItemPicker(self):
+        import ui.select_item as select_item
 
-        if slotId in (9, 11, 13):
-            for block in self.project.blocks: self.ui_form.itemsBox.addItem(f'{self.project.blocks[block]["name"]}')
-            for item in self.project.items: self.ui_form.itemsBox.addItem(f'{self.project.items[item]["name"]}')
-            for equip in self.project.equipment: 
-                for item in ['helmet', 'chestplate', 'leggings', 'boots', 'horse_armor']:
-                    if not self.project.equipment[equip]["includeHorse"]:
-                        if item == "horse_armor": continue
-                    self.ui_form.itemsBox.addItem(f'{self.project.equipment[equip]["name"]}_{item}')
+        self.pickerSlot = None
+        self.itemPicker = QWidget()
+        self.itemPickerForm = select_item.Ui_Form()
+        self.itemPickerForm.setupUi(self.itemPicker)
 
-        for item in item_list: self.ui_form.itemsBox.addItem(item)
+        self.pickerNames = ItemNameFilter(self.project.itemNames, (PROJECT, VANILLA), self)
+        self.setupItemNameBox(self.itemPickerForm.itemsBox, self.pickerNames)
+        self.itemPickerForm.pushButton.clicked.connect(lambda: self.recipeCloseForm(self.pickerSlot, self.itemPickerForm.itemsBox.currentText()))
 
-        self.ui_form.pushButton.clicked.connect(lambda: self.recipeCloseForm(slotId, self.ui_form.itemsBox.currentText()))
+    def setupItemNameBox(self, box, model):
+        box.setModel(model)
+        box.view().setUniformItemSizes(True)
+        completer = QCompleter(model, box)
+        completer.setCaseSensitivity(Qt.CaseInsensitive)
+        completer.setFilterMode(Qt.MatchContains)
+        box.setCompleter(completer)
 
-        self.block_popup.show()
+    def getRecipeItem(self, id_):
+        if self.itemPicker is None:
+            self.setupItemPicker()
+        self.pickerSlot = id_
+        # Only result slots can use the project's own blocks and items
+        self.pickerNames.setKinds((PROJECT, VANILLA) if id_ in (9, 11, 13) else (VANILLA,))
+        self.itemPickerForm.itemsBox.setCurrentIndex(0)
+        self.itemPicker.show()
+        self.itemPicker.raise_()
+        self.itemPicker.activateWindow()
 
     def recipeCloseForm(self, id_, item):
         self.recipe[id_] = item
@@ -668,10 +964,11 @@ class App(QMainWindow):
             case 12: self.ui.stoneCuttingInput.setText(item)
             case 13: self.ui.stoneCuttingOutput.setText(item)
 
-        self.block_popup.close()
+        self.itemPicker.close()
 
     def newRecipe(self):
         self.unsavedChanges = True
+        self.editingElement = None
         self.ui.elementEditor.setCurrentIndex(ElementPage.RECIPES)
 
     def validateRecipeDetails(self):
@@ -726,20 +1023,18 @@ class App(QMainWindow):
         elif self.ui.recipeSubTabs.tabText(self.ui.recipeSubTabs.currentIndex()).lower() == "stonecutting":
             mode = "stonecutting"
 
-        self.recipeProperties = {
-            "name": self.ui.recipeName.text(),
-            "items": self.recipe,
-            "outputCount": self.ui.slot9Count.value(),
-            "outputCount2": self.ui.stoneCuttingCount.value(),
-            "exact": self.ui.exactlyRadio.isChecked(),
-            "shapeless": self.ui.shapelessRadio.isChecked(),
-            "type": mode
-        }
-
-        if not self.recipeProperties["name"] in self.project.recipes:
-            QTreeWidgetItem(self.project.recipes_tree, [self.recipeProperties["name"]])
+        self.recipeProperties = Recipe(
+            name=self.ui.recipeName.text(),
+            items={str(slot): item for slot, item in self.recipe.items()},
+            outputCount=self.ui.slot9Count.value(),
+            outputCount2=self.ui.stoneCuttingCount.value(),
+            exact=self.ui.exactlyRadio.isChecked(),
+            shapeless=self.ui.shapelessRadio.isChecked(),
+            type=mode
+        )
 
-        self.project.recipes[self.recipeProperties["name"]] = self.recipeProperties
+        self.warnIfRenamed('recipes', self.recipeProperties.name)
+        self.project.setElement('recipes', self.recipeProperties)
 
         self.clearRecipeFields()
 
@@ -749,12 +1044,12 @@ class App(QMainWindow):
     def editRecipe(self, recipe):
         properties = self.project.recipes[recipe]
 
-        self.ui.recipeName.setText(properties["name"])
-        self.ui.shapelessRadio.setChecked(properties["shapeless"])
-        self.ui.exactlyRadio.setChecked(properties["exact"])
-        self.ui.slot9Count.setValue(properties["outputCount"])
+        self.ui.recipeName.setText(properties.name)
+        self.ui.shapelessRadio.setChecked(properties.shapeless)
+        self.ui.exactlyRadio.setChecked(properties.exact)
+        self.ui.slot9Count.setValue(properties.outputCount)
 
-        items = properties.get("items", {})
+        items = properties.items
 
         self.ui.slot0.setText(items.get("0", ""))
         self.ui.slot1.setText(items.get("1", ""))
@@ -783,19 +1078,11 @@ class App(QMainWindow):
         else:
             texture = path
 
-        filename = os.path.basename(texture)
-        destinationPath = f'{self.mainDirectory}/workspaces/{self.packDetails["namespace"]}/assets/paintings/{filename}'
-        shutil.copyfile(texture, destinationPath)
-
-        self.paintingTexture = destinationPath
-
-        image = QImage(self.paintingTexture)
-        pixmap = QPixmap.fromImage(image).scaled(50, 50, Qt.AspectRatioMode.KeepAspectRatio)
-
-        self.ui.paintingTexture.setPixmap(pixmap)
+        self.importAssets([texture], ElementPage.PAINTINGS)
 
     def newPainting(self):
         self.unsavedChanges = True
+        self.editingElement = None
         self.ui.elementEditor.setCurrentIndex(ElementPage.PAINTINGS)
 
     def validatePaintingDetails(self):
@@ -823,7 +1110,7 @@ class App(QMainWindow):
             self.ui.paintingHeight
         )
 
-        FieldResetter.clear_labels(
+        self.thumbnails.clear(
             self.ui.paintingTexture
         )
 
@@ -836,19 +1123,17 @@ class App(QMainWindow):
     def addPainting(self):
         if self.validatePaintingDetails() == 0: return
 
-        self.paintingProperties = {
-            "name": self.ui.paintingName.text(),
-            "displayName": self.ui.paintingDisplayName.text(),
-            "width": self.ui.paintingWidth.value(),
-            "height": self.ui.paintingHeight.value(),
-            "placeable": self.ui.paintingPlaceable.isChecked(),
-            "texture": self.paintingTexture
-        }
-
-        if not self.paintingProperties["name"] in self.project.paintings:
-            QTreeWidgetItem(self.project.paintings_tree, [self.paintingProperties["name"]])
+        self.paintingProperties = Painting(
+            name=self.ui.paintingName.text(),
+            displayName=self.ui.paintingDisplayName.text(),
+            width=self.ui.paintingWidth.value(),
+            height=self.ui.paintingHeight.value(),
+            placeable=self.ui.paintingPlaceable.isChecked(),
+            texture=self.paintingTexture
+        )
 
-        self.project.paintings[self.paintingProperties["name"]] = self.paintingProperties
+        self.warnIfRenamed('paintings', self.paintingProperties.name)
+        self.project.setElement('paintings', self.paintingProperties)
 
         self.clearPaintingFields()
 
@@ -858,15 +1143,14 @@ class App(QMainWindow):
     def editPainting(self, painting):
         properties = self.project.paintings[painting]
 
-        self.ui.paintingDisplayName.setText(properties["displayName"])
-        self.ui.paintingName.setText(properties["name"])
-        self.ui.paintingWidth.setValue(properties["width"])
-        self.ui.paintingHeight.setValue(properties["height"])
-        self.ui.paintingPlaceable.setChecked(properties["placeable"])
+        self.ui.paintingDisplayName.setText(properties.displayName)
+        self.ui.paintingName.setText(properties.name)
+        self.ui.paintingWidth.setValue(properties.width)
+        self.ui.paintingHeight.setValue(properties.height)
+        self.ui.paintingPlaceable.setChecked(properties.placeable)
         
-        self.paintingTexture = properties["texture"]
-        pixmap = QPixmap.fromImage(QImage(properties["texture"])).scaled(50, 50, Qt.AspectRatioMode.KeepAspectRatio)
-        self.ui.paintingTexture.setPixmap(pixmap)
+        self.paintingTexture = properties.texture
+        self.thumbnails.show(self.ui.paintingTexture, properties.texture)
 
         self.ui.elementEditor.setCurrentIndex(ElementPage.PAINTINGS)
 
@@ -881,30 +1165,17 @@ class App(QMainWindow):
                 return
         else:
             nbt = path
-        
-        filename = os.path.basename(nbt)
-        destinationPath = f'{self.mainDirectory}/workspaces/{self.packDetails["namespace"]}/assets/structures/{filename}'
-        shutil.copyfile(nbt, destinationPath)
 
-        self.structure = destinationPath
-        self.ui.structureNBTButton.setText(filename)
+        self.importAssets([nbt], ElementPage.STRUCTURES)
 
     def newStructure(self):
         self.unsavedChanges = True
+        self.editingElement = None
         self.ui.elementEditor.setCurrentIndex(ElementPage.STRUCTURES)
-        self.loadBiomeList()
-
-    def loadBiomeList(self):
-        self.biomeCheckboxes = {}
-        biomeList = self.data["biomes"]
+        self.project.biomeList.setCheckedNames(())
 
-        for biome in biomeList:
-            checkbox = QCheckBox(biome)
-            self.biomeCheckboxes[biome] = checkbox
-            self.ui.verticalLayout_3.addWidget(checkbox)
-    
     def getCheckedBiomes(self):
-        return [text for text, checkbox in self.biomeCheckboxes.items() if checkbox.isChecked()]
+        return self.project.biomeList.checkedNames()
 
     def validateStructureDetails(self):
         if not FieldValidator.validate_text_field(self.ui.structureName, "abcdefghijklmnopqrstuvwxyz_0123456789", "Structure Name"):
@@ -937,27 +1208,25 @@ class App(QMainWindow):
 
         self.ui.structureNBTButton.setText("...")
         self.structure = None
-        self.loadBiomeList()
+        self.project.biomeList.setCheckedNames(())
         
     def addStructure(self):
         if self.validateStructureDetails() == 0: return
 
-        self.structureProperties = {
-            "name": self.ui.structureName.text(),
-            "structure": self.structure,
-            "step": self.ui.structureLocation.currentText(),
-            "terrain_adaptation": self.ui.structureTerrainAdaptation.currentText(),
-            "start_height": self.ui.structureStartHeight.value(),
-            "psth": self.ui.structurePSTH.currentText(),
-            "spacing": self.ui.structureSpacing.value(),
-            "seperation": self.ui.structureSeperation.value(),
-            "biomes": self.getCheckedBiomes()
-        }
+        self.structureProperties = Structure(
+            name=self.ui.structureName.text(),
+            structure=self.structure,
+            step=self.ui.structureLocation.currentText(),
+            terrain_adaptation=self.ui.structureTerrainAdaptation.currentText(),
+            start_height=self.ui.structureStartHeight.value(),
+            psth=self.ui.structurePSTH.currentText(),
+            spacing=self.ui.structureSpacing.value(),
+            seperation=self.ui.structureSeperation.value(),
+            biomes=self.getCheckedBiomes()
+        )
 
-        if not self.structureProperties["name"] in self.project.structures:
-            QTreeWidgetItem(self.project.structures_tree, [self.structureProperties["name"]])
-        
-        self.project.structures[self.structureProperties["name"]] = self.structureProperties
+        self.warnIfRenamed('structures', self.structureProperties.name)
+        self.project.setElement('structures', self.structureProperties)
 
         self.clearStructureFields()
 
@@ -967,21 +1236,18 @@ class App(QMainWindow):
     def editStructure(self, struct):
         properties = self.project.structures[struct]
 
-        self.structure = properties["structure"]
+        self.structure = properties.structure
 
-        self.ui.structureName.setText(properties["name"])
+        self.ui.structureName.setText(properties.name)
         self.ui.structureNBTButton.setText(os.path.basename(self.structure))
-        self.ui.structureLocation.setCurrentText(properties["step"])
-        self.ui.structureTerrainAdaptation.setCurrentText(properties["terrain_adaptation"])
-        self.ui.structureStartHeight.setValue(properties["start_height"])
-        self.ui.structurePSTH.setCurrentText(properties["psth"])
-        self.ui.structureSpacing.setValue(properties["spacing"])
-        self.ui.structureSeperation.setValue(properties["seperation"])
-
-        self.loadBiomeList()
-        for biome in properties["biomes"]:
-            if biome in self.biomeCheckboxes:
-                self.biomeCheckboxes[biome].setChecked(True)
+        self.ui.structureLocation.setCurrentText(properties.step)
+        self.ui.structureTerrainAdaptation.setCurrentText(properties.terrain_adaptation)
+        self.ui.structureStartHeight.setValue(properties.start_height)
+        self.ui.structurePSTH.setCurrentText(properties.psth)
+        self.ui.structureSpacing.setValue(properties.spacing)
+        self.ui.structureSeperation.setValue(properties.seperation)
+
+        self.project.biomeList.setCheckedNames(properties.biomes)
 
         self.ui.elementEditor.setCurrentIndex(ElementPage.STRUCTURES)
 
@@ -989,34 +1255,19 @@ class App(QMainWindow):
     # EQUIPMENT TAB       #
     #######################
 
-    def addEquipmentTexture(self, type_, id, label_widget, path=None):
+    def addEquipmentTexture(self, slot, path=None):
         if not path:
             model, _ = QFileDialog.getOpenFileName(self, "Open Texture File", "", "PNG Files (*.png)")
             if not model:
                 return
         else:
             model = path
-        
-        filename = os.path.basename(model)
-        destinationPath = f'{self.mainDirectory}/workspaces/{self.packDetails["namespace"]}/assets/equipment/{filename}'
-        shutil.copyfile(model, destinationPath)
-
-        if type_.lower() == "humanoid":
-            self.project.equipmentModel["h"] = destinationPath
-        elif type_.lower() == "humanoid_leggings":
-            self.project.equipmentModel["h_l"] = destinationPath
-        elif type_.lower() == "horsearmor1":
-            self.project.equipmentModel["horseArmor"] = destinationPath
-        elif type_.lower() == "item":
-            self.project.equipmentTexture[id] = destinationPath
-        
-        image = QImage(destinationPath)
-        pixmap = QPixmap.fromImage(image).scaled(50, 50, Qt.AspectRatioMode.KeepAspectRatio)
 
-        label_widget.setPixmap(pixmap)
+        self.importAssets([model], ElementPage.EQUIPMENT, slot)
 
     def newEquipment(self): 
         self.unsavedChanges = True
+        self.editingElement = None
         self.ui.elementEditor.setCurrentIndex(ElementPage.EQUIPMENT)
 
     def validateEquipmentDetails(self):
@@ -1042,7 +1293,7 @@ class App(QMainWindow):
             self.ui.equipmentName,
             self.ui.equipmentDisplayName
         )
-        FieldResetter.clear_labels(
+        self.thumbnails.clear(
             self.ui.chestplateModelLabel,
             self.ui.leggingsModelLabel,
             self.ui.helmetItemLabel,
@@ -1071,34 +1322,32 @@ class App(QMainWindow):
 
         base_dur = self.ui.equipmentDurability.value()
 
-        self.project.equipmentProperties = {
-            "name": self.ui.equipmentName.text(),
-            "displayName": self.ui.equipmentDisplayName.text(),
-            "armor": {
+        self.project.equipmentProperties = Equipment(
+            name=self.ui.equipmentName.text(),
+            displayName=self.ui.equipmentDisplayName.text(),
+            armor={
                 "helmet": self.ui.helmetArmor.value(),
                 "chestplate": self.ui.chestplateArmor.value(),
                 "leggings": self.ui.leggingsArmor.value(),
                 "boots": self.ui.bootsArmor.value(),
                 "horse_armor": self.ui.horseArmor.value()
             },
-            "toughness": self.ui.equipmentArmorToughness.value(),
-            "kb_resistance": self.ui.equipmentKBResistance.value(),
-            "durability": {
+            toughness=self.ui.equipmentArmorToughness.value(),
+            kb_resistance=self.ui.equipmentKBResistance.value(),
+            durability={
                 "helmet": int(.6875 * base_dur),
                 "chestplate": int(base_dur),
                 "leggings": int(.9375 * base_dur),
                 "boots": int(.8125 * base_dur),
                 "horse_armor": 1
             },
-            "itemTextures": self.project.equipmentTexture,
-            "modelTextures": self.project.equipmentModel,
-            "includeHorse": self.ui.groupBox.isChecked()
-        }
+            itemTextures=self.project.equipmentTexture,
+            modelTextures=self.project.equipmentModel,
+            includeHorse=self.ui.groupBox.isChecked()
+        )
 
-        if not self.project.equipmentProperties["name"] in self.project.equipment:
-            QTreeWidgetItem(self.project.equipment_tree, [self.project.equipmentProperties["name"]])
-        
-        self.project.equipment[self.project.equipmentProperties["name"]] = self.project.equipmentProperties
+        self.warnIfRenamed('equipment', self.project.equipmentProperties.name)
+        self.project.setElement('equipment', self.project.equipmentProperties)
 
         self.clearEquipmentFields()
 
@@ -1109,29 +1358,27 @@ class App(QMainWindow):
     def editEquipment(self, equip):
         properties = self.project.equipment[equip]
 
-        self.ui.equipmentDisplayName.setText(properties["displayName"])
-        self.ui.equipmentName.setText(properties["name"])
-        self.ui.helmetArmor.setValue(properties["armor"]["helmet"])
-        self.ui.chestplateArmor.setValue(properties["armor"]["chestplate"])
-        self.ui.leggingsArmor.setValue(properties["armor"]["leggings"])
-        self.ui.bootsArmor.setValue(properties["armor"]["boots"])
-        self.ui.equipmentArmorToughness.setValue(properties["toughness"])
-        self.ui.equipmentKBResistance.setValue(properties["kb_resistance"])
-        self.ui.equipmentDurability.setValue(properties["durability"]["chestplate"])
-        self.project.equipmentTexture = properties["itemTextures"]
-        self.project.equipmentModel = properties["modelTextures"]
-        self.ui.groupBox.setChecked(properties["includeHorse"])
-
-        self.ui.helmetItemLabel.setPixmap(QPixmap.fromImage(QImage(self.project.equipmentTexture["helmet"])).scaled(50, 50, Qt.AspectRatioMode.KeepAspectRatio))
-        self.ui.chestplateItemLabel.setPixmap(QPixmap.fromImage(QImage(self.project.equipmentTexture["chestplate"])).scaled(50, 50, Qt.AspectRatioMode.KeepAspectRatio))
-        self.ui.leggingsItemLabel.setPixmap(QPixmap.fromImage(QImage(self.project.equipmentTexture["leggings"])).scaled(50, 50, Qt.AspectRatioMode.KeepAspectRatio))
-        self.ui.bootsItemLabel.setPixmap(QPixmap.fromImage(QImage(self.project.equipmentTexture["boots"])).scaled(50, 50, Qt.AspectRatioMode.KeepAspectRatio))
-        try: self.ui.horseArmorItemLabel.setPixmap(QPixmap.fromImage(QImage(self.project.equipmentTexture["horseArmor"])).scaled(50, 50, Qt.AspectRatioMode.KeepAspectRatio))
-        except: pass
-        self.ui.chestplateModelLabel.setPixmap(QPixmap.fromImage(QImage(self.project.equipmentModel["h"])).scaled(50, 50, Qt.AspectRatioMode.KeepAspectRatio))
-        self.ui.leggingsModelLabel.setPixmap(QPixmap.fromImage(QImage(self.project.equipmentModel["h_l"])).scaled(50, 50, Qt.AspectRatioMode.KeepAspectRatio))
-        try: self.ui.horseArmorModelLabel.setPixmap(QPixmap.fromImage(QImage(self.project.equipmentModel["horseArmor"])).scaled(50, 50, Qt.AspectRatioMode.KeepAspectRatio))
-        except: pass
+        self.ui.equipmentDisplayName.setText(properties.displayName)
+        self.ui.equipmentName.setText(properties.name)
+        self.ui.helmetArmor.setValue(properties.armor["helmet"])
+        self.ui.chestplateArmor.setValue(properties.armor["chestplate"])
+        self.ui.leggingsArmor.setValue(properties.armor["leggings"])
+        self.ui.bootsArmor.setValue(properties.armor["boots"])
+        self.ui.equipmentArmorToughness.setValue(properties.toughness)
+        self.ui.equipmentKBResistance.setValue(properties.kb_resistance)
+        self.ui.equipmentDurability.setValue(properties.durability["chestplate"])
+        self.project.equipmentTexture = dict(properties.itemTextures)
+        self.project.equipmentModel = dict(properties.modelTextures)
+        self.ui.groupBox.setChecked(properties.includeHorse)
+
+        self.thumbnails.show(self.ui.helmetItemLabel, self.project.equipmentTexture.get("helmet"))
+        self.thumbnails.show(self.ui.chestplateItemLabel, self.project.equipmentTexture.get("chestplate"))
+        self.thumbnails.show(self.ui.leggingsItemLabel, self.project.equipmentTexture.get("leggings"))
+        self.thumbnails.show(self.ui.bootsItemLabel, self.project.equipmentTexture.get("boots"))
+        self.thumbnails.show(self.ui.horseArmorItemLabel, self.project.equipmentTexture.get("horseArmor"))
+        self.thumbnails.show(self.ui.chestplateModelLabel, self.project.equipmentModel.get("h"))
+        self.thumbnails.show(self.ui.leggingsModelLabel, self.project.equipmentModel.get("h_l"))
+        self.thumbnails.show(self.ui.horseArmorModelLabel, self.project.equipmentModel.get("horseArmor"))
 
         self.ui.elementEditor.setCurrentIndex(ElementPage.EQUIPMENT)
 
@@ -1139,16 +1386,36 @@ class App(QMainWindow):
     # TOOLS               #
     #######################
 
+    def setupTextGenerator(self):
+        from generation.text_generator import TextGenerator
+
+        self.fontIDS = self.loadFonts()
+        family = QFontDatabase.applicationFontFamilies(self.fontIDS[0])[0]
+        self.minecraftFont = QFont(family, 12)
+
+        self.text_generator = TextGenerator(self.ui, OBFUSCATE_PROPERTY, MINECRAFT_COLORS)
+        self.ui.textGeneratorBold.clicked.connect(self.text_generator.tg_ToggleBold)
+        self.ui.textGeneratorItalic.clicked.connect(self.text_generator.tg_ToggleItalic)
+        self.ui.textGeneratorUnderline.clicked.connect(self.text_generator.tg_ToggleUnderline)
+        self.ui.textGeneratorStrikethrough.clicked.connect(self.text_generator.tg_ToggleStrikethrough)
+        self.ui.textGeneratorObfuscated.clicked.connect(self.text_generator.tg_ToggleObfuscate)
+        self.ui.textGeneratorColor.clicked.connect(self.text_generator.tg_Color)
+        self.ui.textGeneratorTextBox.textChanged.connect(self.text_generator.tg_ScheduleUpdate)
+        self.ui.textGeneratorCopy.clicked.connect(self.text_generator.tg_CopyOutput)
+
+        self.ui.textGeneratorOutput.setReadOnly(True)
+
     def textGenerator(self):
         self.ui.elementEditor.setCurrentIndex(ElementPage.TEXT_GENERATOR)
         self.ui.textGeneratorTextBox.setFont(self.minecraftFont)
         self.ui.textGeneratorTextBox.setStyleSheet("background-color: #1e1e1e; color: white;")
 
     def potionGenerator(self):
-        for potionEffect in self.data["effects"]:
+        for potionEffect in self.project.data["effects"]:
             effect = potionEffect.replace("_", " ").capitalize()
             self.ui.potionEffectBox.addItem(effect)
         
+        from generation.potion_generator import PotionGenerator
         self.potion_generator = PotionGenerator()
         self.effectWidgets = []
         
@@ -1164,6 +1431,7 @@ class App(QMainWindow):
             return
         
         # Create the widget
+        from generation.potion_generator import PotionEffectWidget
         effectWidget = PotionEffectWidget(effectId, self.removeEffectWidget)
         
         # Add to layout
@@ -1187,6 +1455,7 @@ class App(QMainWindow):
             widget.deleteLater()
 
     def getPotionColor(self):
+        from generation.potion_generator import PotionColorPicker
         color = PotionColorPicker.showColorDialog(self)
         if color is not None:
             self.potion_generator.setColor(color)
@@ -1218,45 +1487,95 @@ class App(QMainWindow):
     #######################
 
     def generate(self):
+        if self.exporter is not None:
+            return
+
         self.ui.statusbar.showMessage("Exporting project...", 2000)
-        version = self.packDetails["version"].replace(".", "_")
+        version = self.project.packDetails["version"].replace(".", "_")
 
         if getattr(sys, 'frozen', False):
             internal = 'src.'
         else:
             internal = ''
 
-        generator = importlib.import_module(f'{internal}generation.v{version}.generator').Generator
+        try:
+            generator = loadGenerator(self.mainDirectory, version, f'{internal}generation').Generator
+        except ImportError as e:
+            alert(f"Couldn't load the generator for this version: {e}")
+            return
 
         loc = self.settings.get('file_export', 'default_export_location')
         if loc == 'default':
             loc = self.mainDirectory / 'exports'
             os.makedirs(loc, exist_ok=True)
 
-        generator = generator(
+        # The export runs on a copy, so the project can keep being edited meanwhile
+        project = self.project
+        snapshot = copy.deepcopy((
+            project.packDetails,
+            project.blocks,
+            project.items,
+            project.recipes,
+            project.paintings,
+            project.structures,
+            project.equipment
+        ))
+        packDetails, blocks, items, recipes, paintings, structures, equipment = snapshot
+
+        makeGenerator = lambda directory, progress: generator(
             APP_VERSION,
-            self.packDetails,
-            self.dataFormat,
-            self.resourceFormat,
-            self.header,
-            self.blocks,
-            self.project.items,
-            self.project.recipes,
-            self.project.paintings,
-            self.data,
-            loc,
-            self.project.structures,
-            self.project.equipment
+            packDetails,
+            project.dataFormat,
+            project.resourceFormat,
+            project.header,
+            blocks,
+            items,
+            recipes,
+            paintings,
+            project.data,
+            directory,
+            structures,
+            equipment,
+            progress=progress
         )
 
-        generator.generateDatapack()
-
-        
-        alert("Pack Generated!")
+        self.exporter = PackExporter(makeGenerator, loc, self)
+        self.exporter.progress.connect(self.exportProgressed)
+        self.exporter.exported.connect(lambda _: alert("Pack Generated!"))
+        self.exporter.failed.connect(lambda error: alert(f"Pack export failed: {error}\n\nNothing was written. If the issue persists, report it here:\n{ISSUE_URL}"))
+        self.exporter.cancelled.connect(lambda: self.ui.statusbar.showMessage("Export cancelled.", 2000))
+        self.exporter.finished.connect(self.exportFinished)
+
+        self.ui.actionExport_Project.setEnabled(False)
+        self.exportProgress.setValue(0)
+        self.exportProgress.show()
+        self.exportCancelButton.setEnabled(True)
+        self.exportCancelButton.show()
+        self.exporter.start()
+
+    def exportProgressed(self, stage, element, done, total):
+        self.exportProgress.setMaximum(max(total, 1))
+        self.exportProgress.setValue(done)
+        self.exportProgress.setFormat(f"{stage}: {element}" if element else stage)
+
+    def cancelExport(self):
+        if self.exporter is not None:
+            self.exportCancelButton.setEnabled(False)
+            self.exporter.cancel()
+
+    def exportFinished(self):
+        self.exporter.wait()
+        self.exporter.deleteLater()
+        self.exporter = None
+        self.exportProgress.hide()
+        self.exportCancelButton.hide()
+        self.ui.actionExport_Project.setEnabled(True)
 
 
 if __name__ == "__main__":
+    startup.mark("imports")
     app = QApplication(sys.argv)
+    startup.mark("QApplication")
     window = App()
     window.show()
     app.setStyle("Fusion")
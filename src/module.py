@@ -1,46 +1,78 @@
 import os
-import requests
+import hashlib
+import tempfile
 import zipfile
-import io
+
+from core.http_client import getSession
 
 
 class ModuleDownloader:
     """
-    Downloads and extracts versioned modules from the mDirt GitHub repository.
+    Downloads versioned modules from the mDirt GitHub repository.
     """
 
     REPO_URL = "https://github.com/Faith-and-Code-Technologies/mDirt"
     MODULE_BASE = "https://raw.githubusercontent.com/Faith-and-Code-Technologies/mDirt/main/modules"
+    MAX_ZIP_SIZE = 64 * 1024 * 1024
 
-    def __init__(self, target_dir="src/generation"):
+    def __init__(self, target_dir="modules", session=None, base_url=None):
         self.target_dir = target_dir
+        self.session = session or getSession()
+        self.module_base = base_url or self.MODULE_BASE
         os.makedirs(self.target_dir, exist_ok=True)
 
-    def download_and_extract(self, version: str):
+    def fetch(self, version: str, zip_path: str, sha256: str = None):
         """
-        Downloads a ZIP file for the given version and extracts it into the target directory.
-
-        :param version: Version identifier, e.g., 'v1_21_4'
+        Streams the ZIP for `version` to `zip_path` (never held in memory) and checks
+        its size, optional `sha256` and member names. Returns False if any check fails.
         """
-        zip_url = f"{self.MODULE_BASE}/{version}.zip"
+        zip_url = f"{self.module_base}/{version}.zip"
+        digest = hashlib.sha256()
 
         try:
-            response = requests.get(zip_url)
-            response.raise_for_status()
-        except requests.RequestException as e:
+            with self.session.get(zip_url, stream=True, timeout=10) as response:
+                response.raise_for_status()
+                size = 0
+                with open(zip_path, "wb") as f:
+                    for chunk in response.iter_content(64 * 1024):
+                        size += len(chunk)
+                        if size > self.MAX_ZIP_SIZE:
+                            return False
+                        digest.update(chunk)
+                        f.write(chunk)
+        except OSError as e:      # requests' errors are OSErrors
+            return False
+
+        if sha256 and digest.hexdigest() != sha256:
             return False
 
-        # Extract the zip file from memory
+        # Archives contain a top level "<version>/" folder
         try:
-            with zipfile.ZipFile(io.BytesIO(response.content)) as zf:
-                extract_path = os.path.join(self.target_dir, version)
-                zf.extractall(extract_path)
+            with zipfile.ZipFile(zip_path) as zf:
+                names = zf.namelist()
         except zipfile.BadZipFile:
             return False
+        for name in names:
+            if name.startswith(("/", "\\")) or ".." in name.replace("\\", "/").split("/"):
+                return False
+        return f"{version}/generator.py" in names
+
+    def download(self, version: str, sha256: str = None):
+        """
+        Installs the module ZIP for `version` as `<target_dir>/<version>.zip`.
+
+        The generator is imported straight from the archive, so installing is a
+        single `os.replace` of a verified file.
+        """
+        with tempfile.TemporaryDirectory(dir=self.target_dir) as staging:
+            zip_path = os.path.join(staging, f"{version}.zip")
+            if not self.fetch(version, zip_path, sha256):
+                return False
+            os.replace(zip_path, os.path.join(self.target_dir, f"{version}.zip"))
         return True
 
 
 if __name__ == "__main__":
     downloader = ModuleDownloader()
-    version = "v1_21_3"  # Example version
-    downloader.download_and_extract(version)
+    version = "v1_21_11"  # Example version
+    downloader.download(version)
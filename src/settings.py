@@ -15,6 +15,7 @@ DEFAULT_SETTINGS = {
     },
     "editor": {
         "confirm_deletes": True,
+        "undo_memory_mb": 16,
         "enable_experiments": False
     },
     "file_export": {
@@ -25,7 +26,8 @@ DEFAULT_SETTINGS = {
     "network": {
         "check_updates": True,
         "custom_update_url": "",
-        "get_betas": False
+        "get_betas": False,
+        "mirror": ""
     },
     "data": {
         "last_project_path": "",
@@ -5,7 +5,6 @@ import zipfile
 import shutil
 import tempfile
 import subprocess
-import requests
 from packaging import version
 import tkinter as tk
 from tkinter import messagebox
@@ -14,6 +13,13 @@ import threading
 import psutil
 import pathlib
 import time
+import hashlib
+import posixpath
+import struct
+import zlib
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from core.http_client import getSession
 
 # --- Constants ---
 if getattr(sys, "frozen", False):
@@ -22,20 +28,25 @@ else:
     BASE_DIR = pathlib.Path(__file__).resolve().parent
 
 VERSION_FILE = os.path.join(BASE_DIR, "version.json")
+MANIFEST_ASSET = "manifest.json"
+CHUNK_SIZE = 64 * 1024
+DOWNLOAD_WORKERS = 4
 
 # --- Load Config ---
-with open(VERSION_FILE, "r") as f:
-    config = json.load(f)
+config = {}
+if os.path.exists(VERSION_FILE):
+    with open(VERSION_FILE, "r") as f:
+        config = json.load(f)
 
-github_url = config["GITHUB_URL"]
-current_version = config["CURRENT_VERSION"]
+github_url = config.get("GITHUB_URL", "")
+current_version = config.get("CURRENT_VERSION", "v0")
 include_beta = config.get("INCLUDE_BETA", False)
 
 
 # --- Fetch Latest Release ---
 def get_latest_release(allow_beta: bool):
     url = github_url.replace("/releases/latest", "/releases")
-    response = requests.get(url)
+    response = getSession().get(url)
     if response.status_code != 200:
         raise Exception(f"Failed to fetch releases: {response.status_code}")
 
@@ -46,6 +57,79 @@ def get_latest_release(allow_beta: bool):
     raise Exception("No valid releases found.")
 
 
+# --- Release Manifest ---
+def file_hash(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def install_path(relative_path):
+    normalised = posixpath.normpath(relative_path)
+    if normalised != relative_path or relative_path.startswith("/") or ".." in normalised.split("/") or ":" in relative_path:
+        raise Exception(f"Refusing to install outside the mDirt folder: {relative_path}")
+    return os.path.join(BASE_DIR, *normalised.split("/"))
+
+
+def archive_root(zip_ref):
+    """Returns the single top level folder releases are zipped in ("" if there isn't one)."""
+    tops = {name.split("/", 1)[0] for name in zip_ref.namelist()}
+    if len(tops) == 1 and any("/" in name for name in zip_ref.namelist()):
+        return f"{tops.pop()}/"
+    return ""
+
+
+def build_release_manifest(zip_path, tag):
+    """
+    Builds the manifest published next to a release zip as `manifest.json`.
+
+    Every file gets its hash plus where its compressed bytes sit inside the zip,
+    so the updater can fetch just that file from the release asset with a
+    Range request.
+    """
+    files = {}
+    with open(zip_path, "rb") as raw, zipfile.ZipFile(zip_path) as zip_ref:
+        root = archive_root(zip_ref)
+        for info in zip_ref.infolist():
+            if info.is_dir():
+                continue
+            if info.compress_type not in (zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED):
+                raise Exception(f"Unsupported compression for {info.filename}")
+
+            # The data starts after the local header, whose extra field can differ from the central directory's
+            raw.seek(info.header_offset)
+            name_length, extra_length = struct.unpack("<HH", raw.read(30)[26:30])
+
+            digest = hashlib.sha256()
+            with zip_ref.open(info) as member:
+                for chunk in iter(lambda: member.read(CHUNK_SIZE), b""):
+                    digest.update(chunk)
+
+            files[info.filename[len(root):]] = {
+                "sha256": digest.hexdigest(),
+                "size": info.file_size,
+                "offset": info.header_offset + 30 + name_length + extra_length,
+                "compressed_size": info.compress_size,
+                "compression": info.compress_type,
+            }
+    return {"version": tag, "files": files}
+
+
+def is_current(relative_path, sha256, size):
+    path = install_path(relative_path)
+    return os.path.isfile(path) and os.path.getsize(path) == size and file_hash(path) == sha256
+
+
+def skipped_files():
+    # Local settings, and the running updater which can't be replaced while it runs
+    skipped = {"version.json"}
+    if getattr(sys, "frozen", False):
+        skipped.add(os.path.basename(sys.executable))
+    return skipped
+
+
 # --- Worker for update ---
 class UpdateWorker:
     def __init__(self, progress_callback, status_callback, finish_callback):
@@ -53,6 +137,206 @@ class UpdateWorker:
         self.status_callback = status_callback
         self.finish_callback = finish_callback
 
+    def stage_from_manifest(self, manifest_url, zip_url, staging):
+        """
+        Downloads only the files whose hash differs from the installed copy, in
+        parallel, as byte ranges of the release zip. Each file is verified before
+        it counts as staged. Returns ([(relative path, staged path)], release files).
+        """
+        response = getSession().get(manifest_url, timeout=30)
+        response.raise_for_status()
+        manifest = response.json()
+        files = manifest["files"]
+
+        skipped = skipped_files()
+        changed = [(rel, entry) for rel, entry in files.items() if rel not in skipped and not is_current(rel, entry["sha256"], entry["size"])]
+        if not changed:
+            return [], list(files)
+
+        total = sum(entry["compressed_size"] for _, entry in changed) or 1
+        downloaded = 0
+        lock = threading.Lock()
+
+        def report(count):
+            nonlocal downloaded
+            with lock:
+                downloaded += count
+                self.progress_callback(int(downloaded * 100 / total))
+
+        def fetch(rel, entry):
+            install_path(rel)
+            staged = os.path.join(staging, *rel.split("/"))
+            os.makedirs(os.path.dirname(staged), exist_ok=True)
+            digest = hashlib.sha256()
+            size = 0
+
+            with open(staged, "wb") as f:
+                if entry["compressed_size"]:
+                    start = entry["offset"]
+                    end = start + entry["compressed_size"] - 1
+                    with getSession().get(zip_url, headers={"Range": f"bytes={start}-{end}"}, stream=True, timeout=30) as r:
+                        r.raise_for_status()
+                        if r.status_code != 206:
+                            raise Exception("The server doesn't support partial downloads.")
+
+                        decompressor = zlib.decompressobj(-15) if entry["compression"] == zipfile.ZIP_DEFLATED else None
+                        for chunk in r.iter_content(chunk_size=CHUNK_SIZE):
+                            report(len(chunk))
+                            data = decompressor.decompress(chunk) if decompressor else chunk
+                            size += len(data)
+                            if size > entry["size"]:
+                                break
+                            digest.update(data)
+                            f.write(data)
+                        if decompressor:
+                            data = decompressor.flush()
+                            size += len(data)
+                            digest.update(data)
+                            f.write(data)
+
+            if size != entry["size"] or digest.hexdigest() != entry["sha256"]:
+                raise Exception(f"Checksum mismatch for {rel}")
+            return rel, staged
+
+        self.status_callback(f"Downloading {len(changed)} changed file(s)...")
+        self.progress_callback(0)
+        with ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS) as pool:
+            futures = [pool.submit(fetch, rel, entry) for rel, entry in changed]
+            staged = [future.result() for future in as_completed(futures)]
+        return staged, list(files)
+
+    def stage_from_zip(self, zip_url, zip_path, staging):
+        """Fallback for releases without a manifest: downloads the whole zip and stages the files that changed."""
+        try:
+            with getSession().get(zip_url, stream=True, timeout=30) as r:
+                r.raise_for_status()
+                with open(zip_path, "wb") as f:
+                    total = int(r.headers.get("content-length", 0))
+                    downloaded = 0
+                    for chunk in r.iter_content(chunk_size=CHUNK_SIZE):
+                        if chunk:  # Filter out keep-alive chunks
+                            f.write(chunk)
+                            downloaded += len(chunk)
+                            if total:
+                                self.progress_callback(int(downloaded * 100 / total))
+        except Exception as e:
+            self.status_callback(f"Download failed: {str(e)}")
+            return None, None
+
+        self.status_callback("Extracting update...")
+        self.progress_callback(0)  # Reset progress bar
+
+        staged = []
+        skipped = skipped_files()
+        with zipfile.ZipFile(zip_path, "r") as zip_ref:
+            root = archive_root(zip_ref)
+            members = [info for info in zip_ref.infolist() if not info.is_dir()]
+            if not members:
+                raise Exception("Extracted archive is empty")
+
+            for i, info in enumerate(members):
+                rel = info.filename[len(root):]
+                if rel in skipped:
+                    continue
+                install_path(rel)
+                staged_path = os.path.join(staging, *rel.split("/"))
+                os.makedirs(os.path.dirname(staged_path), exist_ok=True)
+                with zip_ref.open(info) as member, open(staged_path, "wb") as f:
+                    shutil.copyfileobj(member, f, CHUNK_SIZE)
+
+                if is_current(rel, file_hash(staged_path), info.file_size):
+                    os.remove(staged_path)
+                else:
+                    staged.append((rel, staged_path))
+                self.progress_callback(int((i + 1) * 100 / len(members)))
+
+            release_files = [info.filename[len(root):] for info in members]
+        return staged, release_files
+
+    def stop_running_processes(self):
+        terminated_processes = []
+        for proc in psutil.process_iter(['pid', 'name', 'exe']):
+            try:
+                if (proc.info['exe'] and 
+                    proc.info['exe'].endswith(".exe") and
+                    proc.info['exe'] != sys.executable):
+                    
+                    exe_name = os.path.basename(proc.info['exe'])
+                    exe_path = os.path.join(BASE_DIR, exe_name)
+                    
+                    if os.path.exists(exe_path):
+                        proc.terminate()
+                        terminated_processes.append(proc)
+            except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+                pass
+
+        # Wait for processes to terminate
+        for proc in terminated_processes:
+            try:
+                proc.wait(timeout=3)
+            except (psutil.TimeoutExpired, psutil.NoSuchProcess):
+                try:
+                    proc.kill()  # Force kill if terminate doesn't work
+                except (psutil.NoSuchProcess, psutil.AccessDenied):
+                    pass
+
+    def remove_old_executables(self, new_exes):
+        # Delete old .exes (except self and new)
+        existing_exes = [f for f in os.listdir(BASE_DIR) if f.endswith(".exe")]
+
+        for exe in existing_exes:
+            if exe != os.path.basename(sys.executable) and exe not in new_exes:
+                exe_path = os.path.join(BASE_DIR, exe)
+                max_retries = 5
+                for attempt in range(max_retries):
+                    try:
+                        os.remove(exe_path)
+                        break
+                    except (PermissionError, FileNotFoundError):
+                        if attempt < max_retries - 1:
+                            time.sleep(0.5)  # Wait before retry
+                        pass
+
+    def install_staged(self, staged, backup_dir):
+        """
+        Moves every staged file over its installed copy. The old copies are kept
+        in `backup_dir` and put back if any file fails, so an update is applied
+        fully or not at all.
+        """
+        moved = []
+        try:
+            for i, (rel, staged_path) in enumerate(staged):
+                target = install_path(rel)
+                os.makedirs(os.path.dirname(target), exist_ok=True)
+
+                backup = None
+                if os.path.exists(target):
+                    backup = os.path.join(backup_dir, *rel.split("/"))
+                    os.makedirs(os.path.dirname(backup), exist_ok=True)
+                    os.replace(target, backup)
+                moved.append((target, backup))
+
+                # For files, handle potential permission issues
+                max_retries = 3
+                for attempt in range(max_retries):
+                    try:
+                        os.replace(staged_path, target)
+                        break
+                    except PermissionError:
+                        if attempt < max_retries - 1:
+                            time.sleep(0.5)
+                        else:
+                            raise
+
+                self.progress_callback(int((i + 1) * 100 / len(staged)))
+        except Exception:
+            for target, backup in reversed(moved):
+                if os.path.exists(target):
+                    os.remove(target)
+                if backup:
+                    os.replace(backup, target)
+            raise
+
     def run(self):
         try:
             self.status_callback("Checking for updates...")
@@ -71,149 +355,49 @@ class UpdateWorker:
 
             zip_url = None
             zip_name = None
+            manifest_url = None
 
             for asset in release_data["assets"]:
-                if asset["name"].endswith(".zip"):
+                if asset["name"].endswith(".zip") and not zip_url:
                     zip_url = asset["browser_download_url"]
                     zip_name = asset["name"]
-                    break
+                elif asset["name"] == MANIFEST_ASSET:
+                    manifest_url = asset["browser_download_url"]
 
             if not zip_url:
                 self.status_callback("No .zip asset found.")
                 return
 
             zip_path = os.path.join(BASE_DIR, zip_name)
+            # Staged next to the install so every swap is a same-disk rename
+            temp_path = tempfile.mkdtemp(prefix=".updater_", dir=BASE_DIR)
+            staging = os.path.join(temp_path, "staged")
             
-            # Download with better error handling
             try:
-                with requests.get(zip_url, stream=True, timeout=30) as r:
-                    r.raise_for_status()
-                    with open(zip_path, "wb") as f:
-                        total = int(r.headers.get("content-length", 0))
-                        downloaded = 0
-                        for chunk in r.iter_content(chunk_size=8192):
-                            if chunk:  # Filter out keep-alive chunks
-                                f.write(chunk)
-                                downloaded += len(chunk)
-                                if total:
-                                    self.progress_callback(int(downloaded * 100 / total))
-            except Exception as e:
-                self.status_callback(f"Download failed: {str(e)}")
-                return
+                staged = None
+                if manifest_url:
+                    try:
+                        staged, release_files = self.stage_from_manifest(manifest_url, zip_url, staging)
+                    except Exception as e:
+                        self.status_callback(f"Partial update failed ({str(e)}), downloading the full release...")
+                        shutil.rmtree(staging, ignore_errors=True)
 
-            self.status_callback("Extracting update...")
-            self.progress_callback(0)  # Reset progress bar
-            
-            # Create temp directory with better path handling
-            temp_path = tempfile.mkdtemp(prefix="updater_")
-            
-            try:
-                # Extract with progress feedback
-                with zipfile.ZipFile(zip_path, "r") as zip_ref:
-                    file_list = zip_ref.namelist()
-                    total_files = len(file_list)
-                    
-                    for i, file in enumerate(file_list):
-                        zip_ref.extract(file, temp_path)
-                        progress = int((i + 1) * 100 / total_files)
-                        self.progress_callback(progress)
-                        
-                        # Add small delay to show progress and prevent UI freezing
-                        if i % 10 == 0:  # Update every 10 files
-                            time.sleep(0.01)
-                
-                self.status_callback("Processing files...")
-                
-                # Find the extracted root directory more reliably
-                temp_contents = os.listdir(temp_path)
-                if not temp_contents:
-                    raise Exception("Extracted archive is empty")
-                
-                # Handle both single folder extraction and direct file extraction
-                if len(temp_contents) == 1 and os.path.isdir(os.path.join(temp_path, temp_contents[0])):
-                    extracted_root = os.path.join(temp_path, temp_contents[0])
-                else:
-                    extracted_root = temp_path
-                
-                if not os.path.exists(extracted_root):
-                    raise Exception(f"Extracted root directory not found: {extracted_root}")
+                if staged is None:
+                    staged, release_files = self.stage_from_zip(zip_url, zip_path, staging)
+                    if staged is None:
+                        return
 
-                self.status_callback("Stopping running processes...")
-                # Terminate other processes more safely
-                terminated_processes = []
-                for proc in psutil.process_iter(['pid', 'name', 'exe']):
-                    try:
-                        if (proc.info['exe'] and 
-                            proc.info['exe'].endswith(".exe") and
-                            proc.info['exe'] != sys.executable):
-                            
-                            exe_name = os.path.basename(proc.info['exe'])
-                            exe_path = os.path.join(BASE_DIR, exe_name)
-                            
-                            if os.path.exists(exe_path):
-                                proc.terminate()
-                                terminated_processes.append(proc)
-                    except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
-                        pass
+                new_exes = [f for f in release_files if "/" not in f and f.endswith(".exe")]
 
-                # Wait for processes to terminate
-                for proc in terminated_processes:
-                    try:
-                        proc.wait(timeout=3)
-                    except (psutil.TimeoutExpired, psutil.NoSuchProcess):
-                        try:
-                            proc.kill()  # Force kill if terminate doesn't work
-                        except (psutil.NoSuchProcess, psutil.AccessDenied):
-                            pass
+                self.status_callback("Stopping running processes...")
+                self.stop_running_processes()
 
                 self.status_callback("Cleaning up old files...")
-                # Delete old .exes (except self and new)
-                existing_exes = [f for f in os.listdir(BASE_DIR) if f.endswith(".exe")]
-                new_exes = [f for f in os.listdir(extracted_root) if f.endswith(".exe")]
-
-                for exe in existing_exes:
-                    if exe != os.path.basename(sys.executable) and exe not in new_exes:
-                        exe_path = os.path.join(BASE_DIR, exe)
-                        max_retries = 5
-                        for attempt in range(max_retries):
-                            try:
-                                os.remove(exe_path)
-                                break
-                            except (PermissionError, FileNotFoundError):
-                                if attempt < max_retries - 1:
-                                    time.sleep(0.5)  # Wait before retry
-                                pass
-
-                self.status_callback("Installing new files...")
-                # Copy new files with better error handling
-                items_to_copy = os.listdir(extracted_root)
-                for i, item in enumerate(items_to_copy):
-                    s = os.path.join(extracted_root, item)
-                    d = os.path.join(BASE_DIR, item)
-                    
-                    try:
-                        if os.path.isdir(s):
-                            if os.path.exists(d):
-                                shutil.rmtree(d)
-                            shutil.copytree(s, d)
-                        else:
-                            # For files, handle potential permission issues
-                            max_retries = 3
-                            for attempt in range(max_retries):
-                                try:
-                                    shutil.copy2(s, d)
-                                    break
-                                except PermissionError:
-                                    if attempt < max_retries - 1:
-                                        time.sleep(0.5)
-                                    else:
-                                        raise
-                    except Exception as e:
-                        print(f"Warning: Failed to copy {item}: {str(e)}")
-                    
-                    # Update progress
-                    progress = int((i + 1) * 100 / len(items_to_copy))
-                    self.progress_callback(progress)
+                self.remove_old_executables(new_exes)
+
+                self.status_callback(f"Installing {len(staged)} new file(s)...")
+                self.progress_callback(0)
+                self.install_staged(staged, os.path.join(temp_path, "backup"))
 
                 # Update version info
                 config["CURRENT_VERSION"] = latest_tag
@@ -241,7 +425,7 @@ class UpdateWorker:
                 self.finish_callback()
 
             except Exception as e:
-                self.status_callback(f"Extraction failed: {str(e)}")
+                self.status_callback(f"Installation failed: {str(e)}")
                 return
             finally:
                 # Cleanup
@@ -360,6 +544,13 @@ def check_for_update():
 
 
 if __name__ == "__main__":
+    if sys.argv[1:2] == ["--manifest"]:
+        # Release builds: python src/updater.py --manifest <release zip> <tag>
+        manifest = build_release_manifest(sys.argv[2], sys.argv[3])
+        with open(os.path.join(os.path.dirname(os.path.abspath(sys.argv[2])), MANIFEST_ASSET), "w") as f:
+            json.dump(manifest, f, indent=4)
+        sys.exit()
+
     if check_for_update():
         app = UpdaterUI(update_found=True)
         app.mainloop()
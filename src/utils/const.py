@@ -1,6 +1,7 @@
 APP_VERSION = 'v2026.1'
 FULL_APP_VERSION = 'v2026.1-beta.1'
-LIB_URL = 'https://raw.githubusercontent.com/JoelDaDev/mDirt/main/lib'
+RAW_URL = 'https://raw.githubusercontent.com/JoelDaDev/mDirt/main'
+LIB_URL = f'{RAW_URL}/lib'
 ISSUE_URL = 'https://github.com/JoelDaDev/mDirt/issues'
 MINECRAFT_COLORS = [
     ("Black", "#000000"),
@@ -20,4 +21,29 @@ MINECRAFT_COLORS = [
     ("Yellow", "#FFFF55"),
     ("White", "#FFFFFF")
 ]
-OBFUSCATE_PROPERTY = 10001
\ No newline at end of file
+OBFUSCATE_PROPERTY = 10001
+# Vanilla biome tags offered for structures when the version data doesn't list them
+BIOME_TAGS = [
+    "is_overworld",
+    "is_nether",
+    "is_end",
+    "is_ocean",
+    "is_deep_ocean",
+    "is_beach",
+    "is_river",
+    "is_mountain",
+    "is_hill",
+    "is_forest",
+    "is_taiga",
+    "is_jungle",
+    "is_savanna",
+    "is_badlands"
+]
+TREE_CATEGORIES = {
+    "Blocks": "blocks",
+    "Items": "items",
+    "Recipes": "recipes",
+    "Paintings": "paintings",
+    "Structures": "structures",
+    "Equipment": "equipment"
+}
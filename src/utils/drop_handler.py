@@ -1,13 +1,24 @@
+import os
+
 from PySide6.QtCore import QEvent, QObject
 from PySide6.QtGui import QDropEvent, QDragEnterEvent
 
+from core.background import runInBackground
+
 
 class DropHandler(QObject):
-    def __init__(self, button, filetype, func):
+    """
+    Accepts files dropped on a widget. Dropped folders are searched for
+    matching files on a worker thread. `func` gets the first match, or the
+    list of all of them when `multiple` is set.
+    """
+
+    def __init__(self, button, filetype, func, multiple=False):
         super().__init__()
         self.button = button
         self.filetype = filetype
         self.func = func
+        self.multiple = multiple
         self.png_path = None
         self.button.setAcceptDrops(True)
         self.button.installEventFilter(self)
@@ -16,24 +27,54 @@ class DropHandler(QObject):
         if watched == self.button:
             if event.type() == QEvent.DragEnter:
                 return self.dragEnter(event)
+            elif event.type() == QEvent.DragMove:
+                # Item views re-check every move; keep accepting what dragEnter accepted
+                if event.mimeData().hasUrls():
+                    event.acceptProposedAction()
+                    return True
             elif event.type() == QEvent.Drop:
                 return self.dropEvent(event)
         return False
 
+    def matches(self, path):
+        return path.lower().endswith(self.filetype)
+
     def dragEnter(self, event: QDragEnterEvent):
         if event.mimeData().hasUrls():
             for url in event.mimeData().urls():
-                if url.toLocalFile().lower().endswith(self.filetype):
+                path = url.toLocalFile()
+                if self.matches(path) or os.path.isdir(path):
                     event.acceptProposedAction()
                     return True
         event.ignore()
         return True
 
+    def findFiles(self, paths):
+        files = []
+        for path in paths:
+            if os.path.isdir(path):
+                for root, dirs, names in os.walk(path):
+                    dirs.sort()
+                    files.extend(os.path.join(root, name) for name in sorted(names) if self.matches(name))
+            elif self.matches(path):
+                files.append(path)
+        return files
+
     def dropEvent(self, event: QDropEvent):
-        for url in event.mimeData().urls():
-            path = url.toLocalFile()
-            if path.lower().endswith(self.filetype):
-                self.png_path = path
-                self.func(path)
-                break
+        paths = [url.toLocalFile() for url in event.mimeData().urls()]
+        if any(os.path.isdir(path) for path in paths):
+            # Folders can hold any number of files, so they are searched off the GUI thread
+            event.acceptProposedAction()
+            runInBackground(lambda: self.findFiles(paths), self.deliver)
+            return True
+
+        files = self.findFiles(paths)
+        if files:
+            event.acceptProposedAction()
+            self.deliver(files)
         return True
+
+    def deliver(self, paths):
+        if paths:
+            self.png_path = paths[0]
+            self.func(paths if self.multiple else paths[0])
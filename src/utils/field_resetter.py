@@ -5,7 +5,7 @@ from PySide6.QtWidgets import (
     QSpinBox,
     QLabel,
     QCheckBox,
-    QTreeWidget,
+    QTreeView,
 )
 
 
@@ -34,6 +34,6 @@ class FieldResetter:
         for box in boxes:
             box.setChecked(False)
 
-    def clear_tree_selection(*trees: QTreeWidget):
+    def clear_tree_selection(*trees: QTreeView):
         for tree in trees:
             tree.clearSelection()
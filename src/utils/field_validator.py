@@ -2,26 +2,30 @@ from PySide6.QtWidgets import QLineEdit, QMessageBox
 
 
 class FieldValidator:
-    def validate_text_field(
-        field: QLineEdit, allowed_chars: str, field_name: str
-    ) -> bool:
-        text = field.text()
+    NAME_CHARS = "abcdefghijklmnopqrstuvwxyz_0123456789"
+    DISPLAY_NAME_CHARS = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz _-!0123456789"
 
+    def check_text(text: str, allowed_chars: str, field_name: str) -> str | None:
         if not text:
-            field.setStyleSheet("QLineEdit { border: 1px solid red; }")
-            FieldValidator._alert(f"Please fill in all fields! ({field_name})")
-            return False
-
+            return f"Please fill in all fields! ({field_name})"
         if any(c not in allowed_chars for c in text):
+            return f"{field_name} contains illegal characters!"
+        return None
+
+    def validate_text_field(
+        field: QLineEdit, allowed_chars: str, field_name: str
+    ) -> bool:
+        error = FieldValidator.check_text(field.text(), allowed_chars, field_name)
+        if error:
             field.setStyleSheet("QLineEdit { border: 1px solid red; }")
-            FieldValidator._alert(f"{field_name} contains illegal characters!")
+            FieldValidator._alert(error)
             return False
 
         field.setStyleSheet("")
         return True
 
     def validate_dropdown_selection(
-        field: QLineEdit, options: list[str], field_name: str
+        field: QLineEdit, options, field_name: str
     ) -> bool:
         value = field.text()
         if value not in options:
@@ -32,6 +36,53 @@ class FieldValidator:
         field.setStyleSheet("")
         return True
 
+    def parse_block_state(text: str):
+        """Splits `name[key=value,...]` into the block name and a dict of properties. Raises ValueError."""
+        if "[" not in text:
+            return text, {}
+        if not text.endswith("]"):
+            raise ValueError("Block states must end with ']'.")
+
+        name, _, states = text[:-1].partition("[")
+        properties = {}
+        for pair in filter(None, states.split(",")):
+            key, sep, value = pair.partition("=")
+            if not sep or not key.strip() or not value.strip():
+                raise ValueError(f'"{pair}" is not a valid block state (expected key=value).')
+            properties[key.strip()] = value.strip()
+        return name, properties
+
+    def check_block_state(text: str, blocks, blockStates: dict, field_name: str) -> str | None:
+        try:
+            name, properties = FieldValidator.parse_block_state(text)
+        except ValueError as e:
+            return f"{field_name}: {e}"
+
+        if name not in blocks:
+            return f"{field_name} must be one of the allowed values."
+
+        if blockStates is None:
+            return None     # Version data compiled without block states; only the block can be checked
+        known = blockStates.get(name, {})
+        for key, value in properties.items():
+            if key in known:
+                if value not in known[key]:
+                    return f'{field_name}: "{value}" is not a valid value for {key} (expected one of {", ".join(known[key])}).'
+            # Properties that don't affect the model (e.g. waterlogged) are missing from blockstate files, so only booleans are accepted for them
+            elif value not in ("true", "false"):
+                return f'{field_name}: {name} has no "{key}" state.'
+        return None
+
+    def validate_block_state(field: QLineEdit, blocks, blockStates: dict, field_name: str) -> bool:
+        error = FieldValidator.check_block_state(field.text(), blocks, blockStates, field_name)
+        if error:
+            field.setStyleSheet("QLineEdit { border: 1px solid red; }")
+            FieldValidator._alert(error)
+            return False
+
+        field.setStyleSheet("")
+        return True
+
     def validate_non_null(value, field_name: str) -> bool:
         if value is None or value == "":
             FieldValidator._alert(f"Please select a valid value for {field_name}!")
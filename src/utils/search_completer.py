@@ -0,0 +1,24 @@
+from PySide6.QtCore import QStringListModel, Qt
+from PySide6.QtWidgets import QCompleter
+
+
+class SearchCompleter(QCompleter):
+    """
+    Completion popup for a QLineEdit that shows `search(text)`'s results in
+    the order given, rather than QCompleter's own prefix filtering.
+    """
+
+    def __init__(self, field, search, parent=None):
+        super().__init__(parent)
+        self.search = search
+        self.results = QStringListModel(self)
+        self.setModel(self.results)
+        self.setCompletionMode(QCompleter.CompletionMode.UnfilteredPopupCompletion)
+        self.setCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
+        field.setCompleter(self)
+        field.textEdited.connect(self.refresh)
+
+    def refresh(self, text):
+        self.results.setStringList(self.search(text))
+        if text:
+            self.complete()
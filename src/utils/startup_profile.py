@@ -0,0 +1,31 @@
+import time
+
+
+class StartupProfile:
+    """
+    Wall-clock time of each startup phase, printed when mDirt is started with
+    --profile-startup (or MDIRT_PROFILE_STARTUP=1). Does nothing otherwise.
+    """
+
+    def __init__(self, enabled, started=None):
+        self.enabled = enabled
+        self.started = started or time.perf_counter()
+        self.last = self.started
+        self.phases = []
+
+    def mark(self, phase):
+        """Ends the running phase and records it as `phase`."""
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        self.phases.append((phase, now - self.last))
+        self.last = now
+
+    def report(self):
+        if not self.enabled:
+            return
+        width = max(len(phase) for phase, _ in self.phases) + 2
+        print("Startup profile:")
+        for phase, seconds in self.phases:
+            print(f'  {phase:<{width}}{seconds * 1000:8.1f} ms')
+        print(f'  {"total":<{width}}{(self.last - self.started) * 1000:8.1f} ms')
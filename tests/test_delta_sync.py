@@ -0,0 +1,161 @@
+import json
+import os
+
+import pytest
+
+from core import delta_sync
+from core.delta_sync import DeltaSync, SyncError, buildManifest
+from core.pooled_session import PooledSession
+
+VERSION = '1.0'
+DATA = f'lib/{VERSION}_data.json'
+MODULE = 'modules/v1_0.zip'
+
+
+def writeFile(root, relativePath, content):
+    path = os.path.join(root, *relativePath.split('/'))
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'wb') as f:
+        f.write(content)
+    return path
+
+
+def readFile(root, relativePath):
+    with open(os.path.join(root, *relativePath.split('/')), 'rb') as f:
+        return f.read()
+
+
+def publish(server, files, manifest=None):
+    """Lays `files` out like the repository and writes their manifest."""
+    for relativePath, content in files.items():
+        writeFile(str(server), relativePath, content)
+    manifest = manifest or buildManifest(str(server), VERSION, list(files))
+    writeFile(str(server), f'lib/manifests/{VERSION}.json', json.dumps(manifest).encode())
+    return manifest
+
+
+class RecordingSession(PooledSession):
+    """Serves the file:// server folder and remembers the Range header of every download."""
+
+    def __init__(self):
+        super().__init__()
+        self.ranges = []
+
+    def get(self, url, **kwargs):
+        if '/manifests/' not in url:
+            self.ranges.append((url.rsplit('/', 1)[-1], kwargs.get('headers', {}).get('Range')))
+        return super().get(url, **kwargs)
+
+
+@pytest.fixture
+def folders(tmp_path):
+    server, install = tmp_path / 'server', tmp_path / 'install'
+    server.mkdir()
+    install.mkdir()
+    return server, install
+
+
+def syncer(server, install):
+    session = RecordingSession()
+    return DeltaSync(server.as_uri(), install, session=session), session
+
+
+def test_sync_fetches_only_changed_files(folders):
+    server, install = folders
+    publish(server, {DATA: b'{"blocks": []}', MODULE: b'zip bytes'})
+    writeFile(str(install), MODULE, b'zip bytes')
+
+    sync, session = syncer(server, install)
+    assert sync.sync(VERSION) == [DATA]
+    assert readFile(str(install), DATA) == b'{"blocks": []}'
+    assert [name for name, _ in session.ranges] == [f'{VERSION}_data.json']
+
+    assert sync.sync(VERSION) == []
+    assert not os.listdir(install / '.sync' / 'lib')
+
+
+def test_sync_resumes_partial_download(folders):
+    server, install = folders
+    content = bytes(range(256)) * 1000
+    publish(server, {DATA: content})
+    half = len(content) // 2
+    writeFile(str(install), f'.sync/{DATA}.part', content[:half])
+
+    sync, session = syncer(server, install)
+    assert sync.sync(VERSION) == [DATA]
+    assert session.ranges == [(f'{VERSION}_data.json', f'bytes={half}-')]
+    assert readFile(str(install), DATA) == content
+
+
+def test_sync_discards_oversized_partial(folders):
+    server, install = folders
+    publish(server, {DATA: b'new data'})
+    writeFile(str(install), f'.sync/{DATA}.part', b'left over from a bigger file')
+
+    sync, session = syncer(server, install)
+    sync.sync(VERSION)
+    assert session.ranges == [(f'{VERSION}_data.json', None)]
+    assert readFile(str(install), DATA) == b'new data'
+
+
+def test_checksum_mismatch_leaves_install_untouched(folders):
+    server, install = folders
+    manifest = publish(server, {DATA: b'new data', MODULE: b'new module'})
+    # The server's module no longer matches what the manifest promises
+    writeFile(str(server), MODULE, b'tampered!!')
+    writeFile(str(install), DATA, b'old data')
+
+    sync, _ = syncer(server, install)
+    with pytest.raises(SyncError, match='Checksum mismatch'):
+        sync.sync(VERSION)
+    assert readFile(str(install), DATA) == b'old data'
+    assert not os.path.exists(install / 'modules' / 'v1_0.zip')
+    assert not os.path.exists(install / '.sync' / 'modules' / 'v1_0.zip.part')
+    assert manifest['files'][MODULE]['size'] == len(b'new module')
+
+
+def test_corrupt_partial_is_not_resumed_twice(folders):
+    server, install = folders
+    content = b'x' * 4096
+    publish(server, {DATA: content})
+    writeFile(str(install), f'.sync/{DATA}.part', b'y' * 1024)
+
+    sync, _ = syncer(server, install)
+    with pytest.raises(SyncError, match='Checksum mismatch'):
+        sync.sync(VERSION)
+    # The bad partial was dropped, so the next attempt starts over and succeeds
+    assert sync.sync(VERSION) == [DATA]
+    assert readFile(str(install), DATA) == content
+
+
+def test_size_cap(folders, monkeypatch):
+    server, install = folders
+    publish(server, {DATA: b'0123456789'})
+    monkeypatch.setattr(delta_sync, 'MAX_FILE_SIZE', 8)
+
+    sync, session = syncer(server, install)
+    with pytest.raises(SyncError, match='limit'):
+        sync.sync(VERSION)
+    assert session.ranges == []
+    assert not os.path.exists(install / 'lib' / f'{VERSION}_data.json')
+
+
+@pytest.mark.parametrize('relativePath', [
+    'lib/../../escaped.json',
+    '../escaped.json',
+    'src/main.py',
+    '/etc/escaped.json',
+    'lib//data.json',
+])
+def test_paths_outside_the_install_are_refused(folders, relativePath):
+    server, install = folders
+    files = {DATA: b'data'}
+    manifest = publish(server, files)
+    manifest['files'][relativePath] = {'sha256': '0' * 64, 'size': 4}
+    publish(server, files, manifest)
+
+    sync, session = syncer(server, install)
+    with pytest.raises(SyncError, match='Refusing'):
+        sync.sync(VERSION)
+    assert session.ranges == []
+    assert not os.path.exists(install / 'lib' / f'{VERSION}_data.json')
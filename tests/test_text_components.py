@@ -0,0 +1,94 @@
+import json
+import random
+
+import pytest
+
+from generation.text_components import DEFAULT_COLOR, FLAGS, optimiseComponents
+
+# Chat, titles and the actionbar: unstyled text is white and has no flags set
+CHAT_STYLE = dict.fromkeys(FLAGS, False) | {"color": DEFAULT_COLOR}
+
+
+def resolve(component, inherited):
+    if not isinstance(component, dict):
+        return inherited
+    style = dict(inherited)
+    for key in CHAT_STYLE:
+        if key in component:
+            style[key] = component[key]
+    return style
+
+
+def render(component, inherited=CHAT_STYLE, out=None):
+    """The (character, style) pairs a text component shows, following Minecraft's inheritance rules."""
+    out = [] if out is None else out
+    if isinstance(component, list):
+        # The first element is the parent of the rest
+        style = resolve(component[0], inherited)
+        render(component[0], inherited, out)
+        for extra in component[1:]:
+            render(extra, style, out)
+        return out
+
+    style = resolve(component, inherited)
+    text = component if isinstance(component, str) else component["text"]
+    for char in text:
+        # A line break looks the same in any style, unless obfuscated
+        out.append((char, None if char == "\n" and not style["obfuscated"] else tuple(sorted(style.items()))))
+    if isinstance(component, dict):
+        for extra in component.get("extra", []):
+            render(extra, style, out)
+    return out
+
+
+def randomComponents(rng):
+    components = []
+    for _ in range(rng.randrange(25)):
+        component = {"text": rng.choice(["a", "bc", " ", "\n", "lore ", "é"])}
+        for flag in FLAGS:
+            if rng.random() < 0.3:
+                component[flag] = True
+        color = rng.choice([None, "#ff5555", "#55ff55", "#aa00aa"])
+        if color:
+            component["color"] = color
+        components.append(component)
+    return components
+
+
+def test_compact_output_renders_the_same():
+    rng = random.Random(50)
+    for _ in range(3000):
+        components = randomComponents(rng)
+        flat = json.dumps([""] + components, separators=(",", ":"))
+        compact = optimiseComponents(components)
+
+        assert render(json.loads(compact)) == render(json.loads(flat)), flat
+        assert len(compact) <= len(flat)
+
+
+@pytest.mark.parametrize("components, expected", [
+    ([], '""'),
+    ([{"text": "plain"}], '"plain"'),
+    ([{"text": "a", "bold": True}, {"text": "b", "bold": True}], '{"text":"ab","bold":true}'),
+    # The line break joins the red run instead of becoming a component of its own
+    ([{"text": "x", "color": "#ff5555"}, {"text": "\n"}, {"text": "y", "color": "#ff5555"}], '{"text":"x\\ny","color":"#ff5555"}'),
+])
+def test_known_outputs(components, expected):
+    assert optimiseComponents(components) == expected
+
+
+def test_styled_lore_shrinks():
+    components = []
+    for line in range(200):
+        if line:
+            components.append({"text": "\n"})
+        components += [
+            {"text": f"Line {line}: ", "color": "#aaaaaa", "italic": True},
+            {"text": "rare", "color": "#aa00aa", "bold": True, "italic": True},
+            {"text": " item", "color": "#aaaaaa", "italic": True},
+        ]
+    flat = json.dumps([""] + components, separators=(",", ":"))
+    compact = optimiseComponents(components)
+
+    assert render(json.loads(compact)) == render(json.loads(flat))
+    assert len(compact) < len(flat) * 0.6
@@ -0,0 +1,119 @@
+import random
+import time
+import types
+
+import pytest
+
+QtWidgets = pytest.importorskip('PySide6.QtWidgets')
+from PySide6.QtGui import QColor, QFont, QTextCharFormat, QTextCursor
+
+from generation.text_generator import TextGenerator
+from utils.const import MINECRAFT_COLORS, OBFUSCATE_PROPERTY
+
+TYPES = ["Raw JSON", "Tellraw Command", "Title", "Subtitle", "Actionbar", "MOTD"]
+EDITS = 600
+
+
+@pytest.fixture(scope='module')
+def app():
+    return QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+
+@pytest.fixture
+def generator(app):
+    ui = types.SimpleNamespace(
+        textGeneratorTextBox=QtWidgets.QTextEdit(),
+        textGeneratorType=QtWidgets.QComboBox(),
+        textGeneratorOutput=QtWidgets.QLineEdit(),
+        horizontalLayout_3=QtWidgets.QHBoxLayout()
+    )
+    ui.textGeneratorType.addItems(TYPES)
+    return TextGenerator(ui, OBFUSCATE_PROPERTY, MINECRAFT_COLORS)
+
+
+def randomEdit(doc, rng):
+    """Types, deletes, restyles, undoes or redoes a random span, the way the editor would."""
+    colors = [hexcode for _, hexcode in MINECRAFT_COLORS] + ['#123456']
+    cursor = QTextCursor(doc)
+    start = rng.randrange(doc.characterCount())
+    end = min(doc.characterCount() - 1, start + rng.randrange(1, 12))
+    op = rng.random()
+
+    if op < 0.35:
+        cursor.setPosition(start)
+        cursor.insertText(rng.choice(["ab", "lore text ", "\n", "x\ny", "é✓"]))
+    elif op < 0.7:
+        cursor.setPosition(start)
+        cursor.setPosition(end, QTextCursor.KeepAnchor)
+        fmt = QTextCharFormat()
+        kind = rng.randrange(6)
+        if kind == 0:
+            fmt.setFontWeight(rng.choice([QFont.Bold, QFont.Normal]))
+        elif kind == 1:
+            fmt.setFontItalic(rng.random() < 0.5)
+        elif kind == 2:
+            fmt.setFontUnderline(rng.random() < 0.5)
+        elif kind == 3:
+            fmt.setFontStrikeOut(rng.random() < 0.5)
+        elif kind == 4:
+            fmt.setForeground(QColor(rng.choice(colors)))
+        else:
+            fmt.setProperty(OBFUSCATE_PROPERTY, True)
+            fmt.setProperty(OBFUSCATE_PROPERTY + 1, "q")
+        cursor.mergeCharFormat(fmt)
+    elif op < 0.85:
+        cursor.setPosition(start)
+        cursor.setPosition(end, QTextCursor.KeepAnchor)
+        cursor.removeSelectedText()
+    elif op < 0.95:
+        doc.undo()
+    else:
+        doc.redo()
+
+
+def outputs(generator):
+    ui = generator.ui
+    results = []
+    for outputType in TYPES:
+        ui.textGeneratorType.setCurrentText(outputType)
+        generator.tg_UpdateTextComponentOutput()
+        results.append(ui.textGeneratorOutput.text())
+    return results
+
+
+@pytest.mark.parametrize('compact', [False, True])
+def test_cached_output_matches_full_rebuild(generator, compact):
+    generator.compactBox.setChecked(compact)
+    doc = generator.ui.textGeneratorTextBox.document()
+    rng = random.Random(49)
+
+    for step in range(EDITS):
+        randomEdit(doc, rng)
+        if step % 5:
+            continue
+        cached = outputs(generator)
+        generator.blockCache.clear()
+        assert outputs(generator) == cached, f'after edit {step}'
+
+    # Deleted blocks don't linger in the cache
+    generator.tg_UpdateTextComponentOutput()
+    assert len(generator.blockCache) == doc.blockCount()
+
+
+def test_updates_are_debounced(generator, app):
+    calls = []
+    generator.updateTimer.timeout.disconnect()
+    generator.updateTimer.timeout.connect(lambda: calls.append(1))
+    generator.updateTimer.setInterval(20)
+
+    for _ in range(10):
+        generator.tg_ScheduleUpdate()
+        app.processEvents()
+    assert calls == []
+
+    for _ in range(200):
+        app.processEvents()
+        if calls:
+            break
+        time.sleep(0.005)
+    assert calls == [1]
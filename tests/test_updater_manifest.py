@@ -0,0 +1,113 @@
+import json
+import os
+import random
+import zipfile
+
+import pytest
+
+pytest.importorskip('psutil')       # The updater stops running mDirt processes with it
+pytest.importorskip('tkinter')
+import updater
+from updater import UpdateWorker, build_release_manifest
+
+ROOT = 'mDirt-1.0/'
+
+
+def releaseFiles():
+    rng = random.Random(38)
+    return {
+        'mDirt.exe': bytes(rng.randrange(256) for _ in range(50_000)),      # Doesn't compress, stored
+        'lib/1.21.11_data.json': json.dumps({'blocks': [f'block_{i}' for i in range(5000)]}).encode(),
+        'assets/empty.txt': b'',
+        'unchanged.txt': b'already installed',
+    }
+
+
+@pytest.fixture
+def release(tmp_path, monkeypatch):
+    """A release zip and its manifest served over file://, and an install folder that has one file current."""
+    server, install = tmp_path / 'server', tmp_path / 'install'
+    server.mkdir()
+    install.mkdir()
+    files = releaseFiles()
+
+    zipPath = server / 'mDirt-1.0.zip'
+    with zipfile.ZipFile(zipPath, 'w') as zf:
+        for name, content in files.items():
+            compression = zipfile.ZIP_STORED if name == 'mDirt.exe' else zipfile.ZIP_DEFLATED
+            zf.writestr(ROOT + name, content, compress_type=compression)
+
+    manifest = build_release_manifest(str(zipPath), 'v1.0')
+    (install / 'unchanged.txt').write_bytes(files['unchanged.txt'])
+    monkeypatch.setattr(updater, 'BASE_DIR', install)
+    return server, install, zipPath, manifest, files
+
+
+def publish(server, manifest):
+    path = server / 'manifest.json'
+    path.write_text(json.dumps(manifest))
+    return path.as_uri()
+
+
+def worker():
+    progress = []
+    return UpdateWorker(progress.append, lambda status: None, lambda *args: None), progress
+
+
+def test_manifest_records_where_each_file_sits(release):
+    _, _, zipPath, manifest, files = release
+    assert set(manifest['files']) == set(files)
+    entries = manifest['files']
+    assert entries['mDirt.exe']['compression'] == zipfile.ZIP_STORED
+    assert entries['lib/1.21.11_data.json']['compression'] == zipfile.ZIP_DEFLATED
+    assert entries['lib/1.21.11_data.json']['compressed_size'] < len(files['lib/1.21.11_data.json'])
+
+    # The recorded offset points straight at the stored bytes
+    entry = entries['mDirt.exe']
+    with open(zipPath, 'rb') as f:
+        f.seek(entry['offset'])
+        assert f.read(entry['compressed_size']) == files['mDirt.exe']
+
+
+def test_stages_only_changed_files_from_byte_ranges(release, tmp_path):
+    server, _, zipPath, manifest, files = release
+    staging = tmp_path / 'staging'
+    update, progress = worker()
+
+    staged, releaseFiles = update.stage_from_manifest(publish(server, manifest), zipPath.as_uri(), str(staging))
+
+    assert sorted(releaseFiles) == sorted(files)
+    assert sorted(rel for rel, _ in staged) == ['assets/empty.txt', 'lib/1.21.11_data.json', 'mDirt.exe']
+    for rel, path in staged:
+        with open(path, 'rb') as f:
+            assert f.read() == files[rel]
+    assert progress[-1] == 100
+
+
+def test_checksum_mismatch_fails_the_update(release, tmp_path):
+    server, _, zipPath, manifest, _ = release
+    manifest['files']['lib/1.21.11_data.json']['sha256'] = '0' * 64
+    update, _ = worker()
+
+    with pytest.raises(Exception, match='Checksum mismatch for lib/1.21.11_data.json'):
+        update.stage_from_manifest(publish(server, manifest), zipPath.as_uri(), str(tmp_path / 'staging'))
+
+
+def test_truncated_deflate_stream_fails_the_update(release, tmp_path):
+    server, _, zipPath, manifest, _ = release
+    manifest['files']['lib/1.21.11_data.json']['compressed_size'] -= 100
+    update, _ = worker()
+
+    with pytest.raises(Exception, match='Checksum mismatch'):
+        update.stage_from_manifest(publish(server, manifest), zipPath.as_uri(), str(tmp_path / 'staging'))
+
+
+@pytest.mark.parametrize('relativePath', ['../escaped.txt', 'lib/../../escaped.txt', '/escaped.txt', 'C:/escaped.txt'])
+def test_paths_outside_the_install_are_refused(release, tmp_path, relativePath):
+    server, _, zipPath, manifest, _ = release
+    manifest['files'][relativePath] = dict(manifest['files']['unchanged.txt'])
+    update, _ = worker()
+
+    with pytest.raises(Exception, match='Refusing'):
+        update.stage_from_manifest(publish(server, manifest), zipPath.as_uri(), str(tmp_path / 'staging'))
+    assert not (tmp_path / 'escaped.txt').exists()